@@ -1,16 +1,101 @@
-from fastapi import APIRouter, HTTPException, Query, Path, Depends, BackgroundTasks
-from fastapi.responses import FileResponse, JSONResponse
-from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, HTTPException, Query, Path, Depends
+from fastapi.responses import StreamingResponse, JSONResponse, ORJSONResponse
+from typing import List, Dict, Any, Optional, AsyncIterator
 import os
-import asyncio
+import logging
+import aiofiles
+import aiofiles.os
 
 from ...services.report_service import ReportService
 from ...services.scanner_service import ScannerService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
-@router.get("/{report_id}", response_model=Dict[str, Any])
-async def get_report(report_id: str = Path(..., description="The ID of the report")):
+# Report IDs are UUIDs or MongoDB ObjectIds; anything else is rejected at routing time
+REPORT_ID_PATTERN = r"^[A-Za-z0-9_-]{8,64}$"
+
+# Media types of the supported export formats
+_MEDIA_TYPES = {
+    "pdf": "application/pdf",
+    "json": "application/json",
+    "txt": "text/plain"
+}
+_ALLOWED_FORMATS = frozenset(_MEDIA_TYPES)
+
+# Size of each chunk read from an exported report while streaming it
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+async def _file_iter(path: str, chunk_size: int = EXPORT_CHUNK_SIZE,
+                     remove_after: bool = False) -> AsyncIterator[bytes]:
+    """
+    Yield the contents of a file in fixed-size chunks without blocking the event loop.
+    
+    If remove_after is set, the file is deleted once the last chunk has been
+    sent (or the client disconnects).
+    """
+    try:
+        async with aiofiles.open(path, "rb") as f:
+            while data := await f.read(chunk_size):
+                yield data
+    finally:
+        if remove_after:
+            try:
+                await aiofiles.os.remove(path)
+            except FileNotFoundError:
+                pass
+            except Exception:
+                logger.exception("Error removing file %s", path)
+
+@router.get("/list", response_class=ORJSONResponse)
+async def list_reports(
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of reports to return"),
+    cursor: Optional[str] = Query(None, description="The next_cursor returned with the previous page"),
+    skip: int = Query(0, ge=0, description="Number of reports to skip (deprecated, use cursor)")
+):
+    """
+    List all reports, newest first.
+    
+    Args:
+        limit: Maximum number of reports to return
+        cursor: The next_cursor returned with the previous page
+        skip: Number of reports to skip (deprecated, use cursor)
+        
+    Returns:
+        Dict[str, Any]: Dictionary with reports, total count and next_cursor
+    """
+    try:
+        if skip and not cursor:
+            # Offset pagination is kept for older clients
+            result = await ReportService.get_reports(limit, skip)
+        else:
+            result = await ReportService.get_reports_after(cursor, limit)
+        return ORJSONResponse(content=result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error listing reports: {str(e)}")
+
+@router.get("/export")
+async def export_all_reports():
+    """
+    Export the summaries of all reports as newline-delimited JSON.
+    
+    Reports are streamed from the database one at a time, so the whole
+    collection is never held in memory.
+    
+    Returns:
+        StreamingResponse: One JSON encoded report per line
+    """
+    return StreamingResponse(
+        ReportService.iter_reports_ndjson(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="reports.ndjson"'}
+    )
+
+@router.get("/{report_id}", response_model=Dict[str, Any], response_class=ORJSONResponse)
+async def get_report(report_id: str = Path(..., description="The ID of the report", regex=REPORT_ID_PATTERN)):
     """
     Get a report by ID.
     
@@ -24,7 +109,8 @@ async def get_report(report_id: str = Path(..., description="The ID of the repor
         report = await ReportService.get_report(report_id)
         if not report:
             raise HTTPException(status_code=404, detail=f"Report with ID {report_id} not found")
-        return report
+        # Return the response directly so FastAPI skips jsonable_encoder
+        return ORJSONResponse(content=report)
     except HTTPException:
         raise
     except Exception as e:
@@ -32,8 +118,7 @@ async def get_report(report_id: str = Path(..., description="The ID of the repor
 
 @router.get("/{report_id}/export/{format_type}")
 async def export_report(
-    background_tasks: BackgroundTasks,
-    report_id: str = Path(..., description="The ID of the report"),
+    report_id: str = Path(..., description="The ID of the report", regex=REPORT_ID_PATTERN),
     format_type: str = Path(..., description="The format to export to (pdf, json, txt)")
 ):
     """
@@ -44,11 +129,12 @@ async def export_report(
         format_type: The format to export to (pdf, json, txt)
         
     Returns:
-        FileResponse: The exported file
+        StreamingResponse: The exported file, streamed in chunks
     """
     try:
         # Validate format type
-        if format_type.lower() not in ["pdf", "json", "txt"]:
+        fmt = format_type.lower()
+        if fmt not in _ALLOWED_FORMATS:
             raise HTTPException(status_code=400, detail=f"Unsupported format: {format_type}")
         
         # Check if report exists
@@ -57,59 +143,29 @@ async def export_report(
             raise HTTPException(status_code=404, detail=f"Report with ID {report_id} not found")
         
         # Export report (this can take time for large reports)
-        file_path = await ReportService.export_report(report_id, format_type.lower())
+        file_path = await ReportService.export_report(report_id, fmt, report=report)
         
         if not file_path or not os.path.exists(file_path):
             raise HTTPException(status_code=500, detail="Failed to export report")
         
-        # Set up clean-up task for temporary file
-        # This will delete the file after it has been sent to the client
-        def remove_file(path: str):
-            try:
-                # Wait a bit to ensure the file has been sent
-                asyncio.sleep(60)
-                if os.path.exists(path):
-                    os.remove(path)
-            except Exception as e:
-                print(f"Error removing file {path}: {e}")
-        
-        background_tasks.add_task(remove_file, file_path)
-        
         # Create a meaningful filename for the download
         filename = os.path.basename(file_path)
-        return FileResponse(
-            path=file_path,
-            filename=filename,
-            media_type=get_media_type(format_type.lower())
+        return StreamingResponse(
+            # The temporary export file is deleted as soon as the last chunk is sent
+            _file_iter(file_path, remove_after=True),
+            media_type=_MEDIA_TYPES[fmt],
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "Content-Length": str(os.path.getsize(file_path))
+            }
         )
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error exporting report: {str(e)}")
 
-@router.get("/list")
-async def list_reports(
-    limit: int = Query(10, ge=1, le=100, description="Maximum number of reports to return"),
-    skip: int = Query(0, ge=0, description="Number of reports to skip")
-):
-    """
-    List all reports.
-    
-    Args:
-        limit: Maximum number of reports to return
-        skip: Number of reports to skip
-        
-    Returns:
-        Dict[str, Any]: Dictionary with reports and total count
-    """
-    try:
-        result = await ReportService.get_reports(limit, skip)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error listing reports: {str(e)}")
-
 @router.delete("/{report_id}")
-async def delete_report(report_id: str = Path(..., description="The ID of the report")):
+async def delete_report(report_id: str = Path(..., description="The ID of the report", regex=REPORT_ID_PATTERN)):
     """
     Delete a report.
     
@@ -127,15 +183,4 @@ async def delete_report(report_id: str = Path(..., description="The ID of the re
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error deleting report: {str(e)}")
-
-def get_media_type(format_type: str) -> str:
-    """Get the media type for a file format."""
-    if format_type == "pdf":
-        return "application/pdf"
-    elif format_type == "json":
-        return "application/json"
-    elif format_type == "txt":
-        return "text/plain"
-    else:
-        return "application/octet-stream" 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error deleting report: {str(e)}") 
\ No newline at end of file
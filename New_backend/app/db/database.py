@@ -1,19 +1,60 @@
 import os
+import asyncio
+import functools
+import logging
 import motor.motor_asyncio
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator, Callable
 from bson import ObjectId
-import json
-from datetime import datetime
-
-# Custom JSON encoder that handles datetime
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        # Handle ObjectId
-        if isinstance(obj, ObjectId):
-            return str(obj)
-        return super().default(obj)
+from pymongo import IndexModel, ASCENDING, DESCENDING
+from pymongo.errors import CollectionInvalid
+import orjson
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import itemgetter
+from urllib.parse import urlparse
+
+logger = logging.getLogger("app.db")
+
+# File locking is only available on POSIX systems
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Pretty-print fallback JSON files only when debugging, compact output is smaller and faster
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if DEBUG else 0)
+
+def _orjson_default(obj):
+    """Serialize types orjson does not support natively"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _read_json_file(file_path: str) -> Any:
+    """Read and parse a JSON file"""
+    with open(file_path, "rb") as f:
+        return orjson.loads(f.read())
+
+def _write_json_file(file_path: str, data: Any) -> None:
+    """
+    Serialize data to a JSON file
+    
+    The data is written to a temporary file in the same directory and moved
+    into place with os.replace, so readers never see a partially written file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(data, default=_orjson_default, option=_ORJSON_OPTIONS))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 # MongoDB Configuration
 # Use environment variables for better security
@@ -23,11 +64,53 @@ MONGODB_URL = os.getenv("MONGODB_URL", "mongodb+srv://jaisrajputdev:newpass1234@
 # Use Vulnerability as database name
 DB_NAME = "Vulnerability"
 
+# Collections created on startup
+_COLLECTIONS = ["scans", "scan_results", "users", "reports"]
+
+# Indexes created on startup for each collection
+_INDEXES = {
+    "reports": [
+        IndexModel([("report_id", ASCENDING)], unique=True),
+        # Supports keyset pagination of report listings
+        IndexModel([("timestamp", DESCENDING), ("report_id", DESCENDING)]),
+    ],
+    "scans": [
+        IndexModel([("scan_id", ASCENDING)], unique=True),
+        IndexModel([("timestamp", DESCENDING)]),
+    ],
+    "scan_results": [
+        IndexModel([("scan_id", ASCENDING)]),
+    ],
+}
+
+# Connection pool bounds; MONGO_MIN_POOL_SIZE connections are opened up front
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "50"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "10"))
+
 # Global database connection object
 _mongo_client = None
 _db = None
 _using_fallback = False
 
+def _mongo_host(url: str) -> str:
+    """Get the host part of a MongoDB URL so it can be logged without credentials"""
+    try:
+        return urlparse(url).hostname or "<unknown host>"
+    except ValueError:
+        return "<invalid url>"
+
+def _tls_options() -> Dict[str, Any]:
+    """
+    Get the TLS options for the MongoDB client
+    
+    Certificate verification stays on (and TLS sessions can be resumed) unless
+    MONGO_TLS_INSECURE=1 is set, which is meant for local testing only.
+    """
+    if os.getenv("MONGO_TLS_INSECURE") == "1":
+        logger.warning("MONGO_TLS_INSECURE=1: TLS certificate verification is disabled")
+        return {"tlsAllowInvalidCertificates": True}
+    return {}
+
 async def connect_to_mongo() -> Optional[motor.motor_asyncio.AsyncIOMotorDatabase]:
     """
     Connect to MongoDB database
@@ -37,50 +120,88 @@ async def connect_to_mongo() -> Optional[motor.motor_asyncio.AsyncIOMotorDatabas
     """
     global _mongo_client, _db, _using_fallback
     
+    # Services call this during startup as well, reuse the existing pool
+    if _db is not None:
+        return _db
+    
     try:
         # Create a new client and connect to the server
-        print(f"Connecting to MongoDB at {MONGODB_URL}")
+        logger.info("Connecting to MongoDB at %s", _mongo_host(MONGODB_URL))
         _mongo_client = motor.motor_asyncio.AsyncIOMotorClient(
             MONGODB_URL, 
             serverSelectionTimeoutMS=5000,
             connectTimeoutMS=5000,
-            tlsAllowInvalidCertificates=True  # Less strict SSL verification for testing
+            maxPoolSize=MONGO_MAX_POOL_SIZE,
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=60000,
+            retryWrites=True,
+            **_tls_options()
         )
         
         # Verify the connection was successful
         await _mongo_client.server_info()
-        print("Successfully connected to MongoDB Atlas!")
+        logger.info("Successfully connected to MongoDB Atlas")
+        
+        # Warm up the pool so the first requests do not pay for connection and TLS setup
+        await asyncio.gather(*[_mongo_client.admin.command("ping") for _ in range(MONGO_MIN_POOL_SIZE)])
         
         # Access the database
         _db = _mongo_client[DB_NAME]
         
-        # Create collections if they don't exist
-        collections_to_create = ["scans", "scan_results", "users", "reports"]
-        existing_collections = await _db.list_collection_names()
-        
-        for collection in collections_to_create:
-            if collection not in existing_collections:
-                await _db.create_collection(collection)
-                print(f"Created collection: {collection}")
+        # Create missing collections and indexes in as few round trips as possible
+        await _ensure_collections(_db)
+        await _ensure_indexes(_db)
         
         return _db
     
     except Exception as e:
-        print(f"Error connecting to MongoDB: {e}")
-        print("Please check your MongoDB Atlas credentials and network connection.")
-        print("Using local JSON storage fallback instead.")
+        logger.error("Error connecting to MongoDB: %s", e)
+        logger.warning("Please check your MongoDB Atlas credentials and network connection. "
+                       "Using local JSON storage fallback instead.")
         
         # Set fallback flag
         _using_fallback = True
         _db = None
+        
+        # Create the fallback directories once so later operations skip the checks
+        for collection in _COLLECTIONS:
+            _get_collection_dir(collection)
         return None
 
+async def _create_collection(db: motor.motor_asyncio.AsyncIOMotorDatabase, collection: str) -> None:
+    """Create a collection, ignoring it if another worker created it first"""
+    try:
+        await db.create_collection(collection)
+        logger.info("Created collection: %s", collection)
+    except CollectionInvalid:
+        pass
+
+async def _ensure_collections(db: motor.motor_asyncio.AsyncIOMotorDatabase) -> None:
+    """Create all missing collections concurrently"""
+    existing_collections = set(await db.list_collection_names())
+    await asyncio.gather(*[
+        _create_collection(db, collection)
+        for collection in _COLLECTIONS if collection not in existing_collections
+    ])
+
+async def _ensure_indexes(db: motor.motor_asyncio.AsyncIOMotorDatabase) -> None:
+    """Create the indexes used by lookups and listings, one create_indexes call per collection"""
+    results = await asyncio.gather(*[
+        db[collection].create_indexes(indexes)
+        for collection, indexes in _INDEXES.items()
+    ], return_exceptions=True)
+    
+    for collection, result in zip(_INDEXES, results):
+        if isinstance(result, Exception):
+            # Queries still work without the indexes, only slower
+            logger.warning("Error creating indexes for %s: %s", collection, result)
+
 async def close_mongo_connection() -> None:
     """Close the MongoDB connection"""
     global _mongo_client
     if _mongo_client:
         _mongo_client.close()
-        print("MongoDB connection closed")
+        logger.info("MongoDB connection closed")
 
 def get_db() -> motor.motor_asyncio.AsyncIOMotorDatabase:
     """
@@ -99,17 +220,226 @@ def get_db() -> motor.motor_asyncio.AsyncIOMotorDatabase:
     
     return _db
 
+@functools.lru_cache(maxsize=1)
 def _get_fallback_dir() -> str:
-    """Get fallback directory for local storage"""
+    """Get fallback directory for local storage, created on first use"""
     base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
     fallback_dir = os.path.join(base_dir, "db_fallback")
-    
-    # Create directory if it doesn't exist
-    if not os.path.exists(fallback_dir):
-        os.makedirs(fallback_dir)
-        
+    os.makedirs(fallback_dir, exist_ok=True)
     return fallback_dir
 
+@functools.lru_cache(maxsize=None)
+def _get_collection_dir(collection: str) -> str:
+    """Get the fallback directory of a collection, created on first use"""
+    collection_dir = os.path.join(_get_fallback_dir(), collection)
+    os.makedirs(collection_dir, exist_ok=True)
+    return collection_dir
+
+# Worker threads used to read fallback document files in parallel
+_FALLBACK_IO_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="db-fallback")
+
+# Fields maintained in the per-collection fallback index
+_INDEXED_FIELDS = ("report_id", "scan_id", "status", "_id")
+_INDEX_FILENAME = "_index.json"
+_INDEX_LOCK_FILENAME = "_index.lock"
+
+def _is_document_file(filename: str) -> bool:
+    """Check whether a file in a collection directory holds a document"""
+    return filename.endswith(".json") and filename != _INDEX_FILENAME
+
+@contextmanager
+def _index_lock(collection_dir: str):
+    """Hold an exclusive lock on a collection index while it is read and rewritten"""
+    with open(os.path.join(collection_dir, _INDEX_LOCK_FILENAME), "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def _index_add(index: Dict[str, Any], doc_id: str, doc: Dict[str, Any]) -> None:
+    """Add a document's indexed field values to an index"""
+    by_field = index["by_field"]
+    entries = {}
+    for field in _INDEXED_FIELDS:
+        value = doc.get(field)
+        if isinstance(value, (str, int, float, bool, ObjectId)):
+            key = str(value)
+            by_field.setdefault(field, {}).setdefault(key, set()).add(doc_id)
+            entries[field] = key
+    if entries:
+        index["by_doc"][doc_id] = entries
+
+def _index_remove(index: Dict[str, Any], doc_id: str) -> None:
+    """Remove every reference to a document from an index, using its by_doc entry"""
+    entries = index["by_doc"].pop(doc_id, None)
+    if not entries:
+        return
+    for field, key in entries.items():
+        values = index["by_field"].get(field, {})
+        ids = values.get(key)
+        if ids is not None:
+            ids.discard(doc_id)
+            if not ids:
+                del values[key]
+
+def _scan_document_files(collection_dir: str) -> List[os.DirEntry]:
+    """List the document files of a collection, using DirEntry data to avoid extra stat calls"""
+    with os.scandir(collection_dir) as entries:
+        return [entry for entry in entries if _is_document_file(entry.name) and entry.is_file()]
+
+def _new_index() -> Dict[str, Any]:
+    """
+    Create an empty collection index
+    
+    by_field maps field -> value -> set of document IDs for lookups, and by_doc
+    maps document ID -> {field: value} so a document is removed in O(1). Only
+    by_doc is stored on disk; by_field is derived from it when loading.
+    """
+    return {"by_field": {}, "by_doc": {}}
+
+def _rebuild_index(collection_dir: str) -> Dict[str, Any]:
+    """Build the index of a collection by reading all of its documents"""
+    index = _new_index()
+    for entry in _scan_document_files(collection_dir):
+        try:
+            doc = _read_json_file(entry.path)
+            _index_add(index, entry.name[:-len(".json")], doc)
+        except Exception as e:
+            logger.error("Error indexing file %s: %s", entry.name, e)
+    return index
+
+# Parsed indexes keyed by collection directory, with the index file's stat
+# signature; the file is replaced on every write, so a changed signature means
+# the cached copy is stale. Cached indexes are never mutated.
+_index_cache: Dict[str, Any] = {}
+
+def _index_signature(stat_result: os.stat_result) -> tuple:
+    """Identify one version of an index file"""
+    return (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+def _parse_index(index_path: str) -> Optional[Dict[str, Any]]:
+    """Read an index file, or None if it is missing, unreadable or in an old format"""
+    try:
+        data = _read_json_file(index_path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error("Error reading index %s: %s", index_path, e)
+        return None
+    by_doc = data.get("by_doc") if isinstance(data, dict) else None
+    if not isinstance(by_doc, dict):
+        return None
+    
+    index = _new_index()
+    index["by_doc"] = by_doc
+    by_field = index["by_field"]
+    for doc_id, entries in by_doc.items():
+        for field, key in entries.items():
+            by_field.setdefault(field, {}).setdefault(key, set()).add(doc_id)
+    return index
+
+def _read_index(collection_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the index of a collection for a lookup, without ever writing it
+    
+    Returns:
+        Optional[Dict[str, Any]]: The shared read-only index, or None if there is
+        no usable index file; callers then scan the documents instead
+    """
+    index_path = os.path.join(collection_dir, _INDEX_FILENAME)
+    try:
+        signature = _index_signature(os.stat(index_path))
+    except FileNotFoundError:
+        return None
+    
+    cached = _index_cache.get(collection_dir)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    index = _parse_index(index_path)
+    if index is not None:
+        _index_cache[collection_dir] = (signature, index)
+    return index
+
+def _load_index(collection_dir: str) -> Dict[str, Any]:
+    """
+    Load a private copy of a collection's index for updating, rebuilding it if
+    it is missing or unreadable
+    
+    Callers must hold _index_lock and finish with _write_index.
+    """
+    index = _parse_index(os.path.join(collection_dir, _INDEX_FILENAME))
+    if index is None:
+        index = _rebuild_index(collection_dir)
+    return index
+
+def _write_index(collection_dir: str, index: Dict[str, Any]) -> None:
+    """Write the index of a collection and publish it to readers in this process"""
+    index_path = os.path.join(collection_dir, _INDEX_FILENAME)
+    _write_json_file(index_path, {"by_doc": index["by_doc"]})
+    _index_cache[collection_dir] = (_index_signature(os.stat(index_path)), index)
+
+def _index_candidates(collection_dir: str, query: Dict[str, Any]) -> Optional[List[str]]:
+    """
+    Get the IDs of documents that may match a query using the collection index
+    
+    Returns:
+        Optional[List[str]]: Candidate document IDs, or None if the query has no
+        indexed field or the collection has no usable index
+    """
+    indexed_keys = [k for k in query if k in _INDEXED_FIELDS]
+    if not indexed_keys:
+        return None
+    
+    index = _read_index(collection_dir)
+    if index is None:
+        return None
+    
+    by_field = index["by_field"]
+    candidates = None
+    for key in indexed_keys:
+        ids = by_field.get(key, {}).get(str(query[key]), set())
+        candidates = candidates & ids if candidates is not None else ids
+        if not candidates:
+            break
+    return list(candidates)
+
+def _compile_query(query: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Build a predicate testing whether a document matches an equality query
+    
+    The keys and expected values are prepared once per query, so each document
+    is tested with a single itemgetter call and tuple comparison.
+    """
+    if not query:
+        return lambda doc: True
+    
+    if len(query) == 1:
+        (key, expected), = query.items()
+        return lambda doc: doc.get(key) == expected
+    
+    getter = itemgetter(*query)
+    expected_values = tuple(query.values())
+    
+    def matches(doc: Dict[str, Any]) -> bool:
+        try:
+            return getter(doc) == expected_values
+        except KeyError:
+            # A missing field only matches an expected None, like doc.get()
+            return all(doc.get(k) == v for k, v in query.items())
+    
+    return matches
+
+def _iter_candidate_files(collection_dir: str, query: Dict[str, Any]) -> List[str]:
+    """Get the document file paths that have to be checked against a query"""
+    candidates = _index_candidates(collection_dir, query)
+    if candidates is not None:
+        return [os.path.join(collection_dir, f"{doc_id}.json") for doc_id in candidates]
+    return [entry.path for entry in _scan_document_files(collection_dir)]
+
 async def save_to_db(collection: str, data: Dict[str, Any]) -> str:
     """
     Save data to database
@@ -131,28 +461,27 @@ async def save_to_db(collection: str, data: Dict[str, Any]) -> str:
             # Use fallback JSON storage
             return _save_to_json(collection, data)
     except Exception as e:
-        print(f"Error saving to database: {e}")
+        logger.error("Error saving to database: %s", e)
         # Fallback to local JSON storage
         return _save_to_json(collection, data)
 
 def _save_to_json(collection: str, data: Dict[str, Any]) -> str:
     """Save data to JSON file as fallback"""
-    fallback_dir = _get_fallback_dir()
-    
-    # Create collection directory if it doesn't exist
-    collection_dir = os.path.join(fallback_dir, collection)
-    if not os.path.exists(collection_dir):
-        os.makedirs(collection_dir)
+    collection_dir = _get_collection_dir(collection)
     
     # Use report_id or document_id if available, otherwise generate UUID
     doc_id = data.get("report_id") or data.get("scan_id") or data.get("_id") or str(ObjectId())
     
     # Save to file
     file_path = os.path.join(collection_dir, f"{doc_id}.json")
-    with open(file_path, "w") as f:
-        json.dump(data, f, indent=2, cls=DateTimeEncoder)
+    with _index_lock(collection_dir):
+        index = _load_index(collection_dir)
+        _write_json_file(file_path, data)
+        _index_remove(index, doc_id)
+        _index_add(index, doc_id, data)
+        _write_index(collection_dir, index)
         
-    print(f"Saved {collection}/{doc_id} to local storage")
+    logger.debug("Saved %s/%s to local storage", collection, doc_id)
     return doc_id
 
 async def update_in_db(collection: str, filter_query: Dict[str, Any], update_data: Dict[str, Any]) -> bool:
@@ -177,41 +506,42 @@ async def update_in_db(collection: str, filter_query: Dict[str, Any], update_dat
             # Use fallback JSON storage
             return _update_in_json(collection, filter_query, update_data)
     except Exception as e:
-        print(f"Error updating in database: {e}")
+        logger.error("Error updating in database: %s", e)
         # Fallback to local JSON storage
         return _update_in_json(collection, filter_query, update_data)
 
 def _update_in_json(collection: str, filter_query: Dict[str, Any], update_data: Dict[str, Any]) -> bool:
     """Update document in JSON file as fallback"""
-    fallback_dir = _get_fallback_dir()
-    collection_dir = os.path.join(fallback_dir, collection)
+    collection_dir = _get_collection_dir(collection)
     
-    if not os.path.exists(collection_dir):
-        return False
+    matches = _compile_query(filter_query)
     
     # Find matching file based on filter_query
-    for filename in os.listdir(collection_dir):
-        if not filename.endswith(".json"):
-            continue
-            
-        file_path = os.path.join(collection_dir, filename)
+    for file_path in _iter_candidate_files(collection_dir, filter_query):
+        filename = os.path.basename(file_path)
         try:
-            with open(file_path, "r") as f:
-                doc = json.load(f)
+            doc = _read_json_file(file_path)
                 
             # Check if document matches filter_query
-            if all(doc.get(k) == v for k, v in filter_query.items()):
+            if matches(doc):
                 # Update document
                 doc.update(update_data)
                 
-                # Save updated document
-                with open(file_path, "w") as f:
-                    json.dump(doc, f, indent=2, cls=DateTimeEncoder)
+                # Save updated document and refresh its index entries
+                doc_id = filename[:-len(".json")]
+                with _index_lock(collection_dir):
+                    index = _load_index(collection_dir)
+                    _write_json_file(file_path, doc)
+                    _index_remove(index, doc_id)
+                    _index_add(index, doc_id, doc)
+                    _write_index(collection_dir, index)
                     
-                print(f"Updated {collection}/{filename} in local storage")
+                logger.debug("Updated %s/%s in local storage", collection, filename)
                 return True
+        except FileNotFoundError:
+            continue
         except Exception as e:
-            print(f"Error reading/writing file {file_path}: {e}")
+            logger.error("Error reading/writing file %s: %s", file_path, e)
     
     return False
 
@@ -238,38 +568,77 @@ async def find_document(collection: str, query: Dict[str, Any]) -> Optional[Dict
             # Use fallback JSON storage
             return _find_document_in_json(collection, query)
     except Exception as e:
-        print(f"Error finding document in database: {e}")
+        logger.error("Error finding document in database: %s", e)
         # Fallback to local JSON storage
         return _find_document_in_json(collection, query)
 
 def _find_document_in_json(collection: str, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Find a document in JSON file as fallback"""
-    fallback_dir = _get_fallback_dir()
-    collection_dir = os.path.join(fallback_dir, collection)
+    collection_dir = _get_collection_dir(collection)
     
-    if not os.path.exists(collection_dir):
-        return None
+    matches = _compile_query(query)
     
     # Find matching file based on query
-    for filename in os.listdir(collection_dir):
-        if not filename.endswith(".json"):
-            continue
-            
-        file_path = os.path.join(collection_dir, filename)
+    for file_path in _iter_candidate_files(collection_dir, query):
         try:
-            with open(file_path, "r") as f:
-                doc = json.load(f)
+            doc = _read_json_file(file_path)
                 
             # Check if document matches query
-            if all(doc.get(k) == v for k, v in query.items()):
+            if matches(doc):
                 return doc
+        except FileNotFoundError:
+            continue
         except Exception as e:
-            print(f"Error reading file {file_path}: {e}")
+            logger.error("Error reading file %s: %s", file_path, e)
     
     return None
 
+async def iter_documents(collection: str, query: Dict[str, Any], limit: int = 0, skip: int = 0,
+                         sort_field: str = None, sort_order: int = -1,
+                         projection: Optional[Dict[str, int]] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterate over documents in database one at a time
+    
+    Documents are decoded as the cursor is consumed instead of materializing
+    the whole result set, so memory use does not grow with the result size.
+    
+    Args:
+        collection: Collection name
+        query: Query to find documents
+        limit: Maximum number of documents to return
+        skip: Number of documents to skip
+        sort_field: Field to sort by
+        sort_order: Sort order (1 for ascending, -1 for descending)
+        projection: Fields to include (1) or exclude (0), MongoDB style
+        
+    Yields:
+        Dict[str, Any]: Matching documents
+    """
+    global _using_fallback, _db
+    
+    if not _using_fallback and _db is not None:
+        cursor = _db[collection].find(query, projection).skip(skip)
+        
+        if sort_field:
+            cursor = cursor.sort(sort_field, sort_order)
+            
+        if limit > 0:
+            cursor = cursor.limit(limit)
+        
+        async for doc in cursor:
+            # Convert ObjectId to string
+            if "_id" in doc:
+                doc["_id"] = str(doc["_id"])
+            yield doc
+    else:
+        # Use fallback JSON storage
+        for doc in await _find_documents_in_json_async(collection, query, limit, skip,
+                                                       sort_field, sort_order, projection):
+            yield doc
+
 async def find_documents(collection: str, query: Dict[str, Any], limit: int = 0, skip: int = 0, 
-                         sort_field: str = None, sort_order: int = -1) -> List[Dict[str, Any]]:
+                         sort_field: str = None, sort_order: int = -1,
+                         projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
     """
     Find documents in database
     
@@ -280,71 +649,174 @@ async def find_documents(collection: str, query: Dict[str, Any], limit: int = 0,
         skip: Number of documents to skip
         sort_field: Field to sort by
         sort_order: Sort order (1 for ascending, -1 for descending)
+        projection: Fields to include (1) or exclude (0), MongoDB style
         
     Returns:
         list: List of documents
     """
-    global _using_fallback, _db
-    
     try:
-        if not _using_fallback and _db is not None:
-            cursor = _db[collection].find(query).skip(skip)
-            
-            if sort_field:
-                cursor = cursor.sort(sort_field, sort_order)
-                
-            if limit > 0:
-                cursor = cursor.limit(limit)
-                
-            documents = await cursor.to_list(length=None)
-            
-            # Convert ObjectId to string for each document
-            for doc in documents:
-                if "_id" in doc:
-                    doc["_id"] = str(doc["_id"])
-                    
-            return documents
-        else:
-            # Use fallback JSON storage
-            return _find_documents_in_json(collection, query, limit, skip, sort_field, sort_order)
+        return [doc async for doc in iter_documents(collection, query, limit, skip,
+                                                    sort_field, sort_order, projection)]
     except Exception as e:
-        print(f"Error finding documents in database: {e}")
+        logger.error("Error finding documents in database: %s", e)
         # Fallback to local JSON storage
-        return _find_documents_in_json(collection, query, limit, skip, sort_field, sort_order)
+        return await _find_documents_in_json_async(collection, query, limit, skip, sort_field, sort_order, projection)
+
+def _apply_projection(doc: Dict[str, Any], projection: Optional[Dict[str, int]]) -> Dict[str, Any]:
+    """Apply a MongoDB style projection to a document loaded from JSON"""
+    if not projection:
+        return doc
+    
+    included = {k for k, v in projection.items() if v and k != "_id"}
+    if included:
+        keep_id = projection.get("_id", 1)
+        return {k: v for k, v in doc.items() if k in included or (k == "_id" and keep_id)}
+    return {k: v for k, v in doc.items() if k not in projection}
+
+def _load_document_file(file_path: str) -> Optional[Dict[str, Any]]:
+    """Read a document file, returning None if it is missing or unreadable"""
+    try:
+        return _read_json_file(file_path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error("Error reading file %s: %s", file_path, e)
+        return None
+
+async def _find_documents_in_json_async(collection: str, query: Dict[str, Any], limit: int = 0, skip: int = 0,
+                                        sort_field: str = None, sort_order: int = -1,
+                                        projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+    """Find documents in JSON files as fallback without blocking the event loop"""
+    return await asyncio.to_thread(_find_documents_in_json, collection, query, limit, skip,
+                                   sort_field, sort_order, projection)
 
 def _find_documents_in_json(collection: str, query: Dict[str, Any], limit: int = 0, skip: int = 0,
-                           sort_field: str = None, sort_order: int = -1) -> List[Dict[str, Any]]:
+                           sort_field: str = None, sort_order: int = -1,
+                           projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
     """Find documents in JSON files as fallback"""
-    fallback_dir = _get_fallback_dir()
-    collection_dir = os.path.join(fallback_dir, collection)
+    collection_dir = _get_collection_dir(collection)
     
-    if not os.path.exists(collection_dir):
-        return []
+    matches = _compile_query(query)
     
-    results = []
+    # Read candidate files in parallel, file reads release the GIL
+    file_paths = _iter_candidate_files(collection_dir, query)
+    if len(file_paths) > 1:
+        documents = _FALLBACK_IO_EXECUTOR.map(_load_document_file, file_paths)
+    else:
+        documents = map(_load_document_file, file_paths)
     
     # Find matching files based on query
-    for filename in os.listdir(collection_dir):
-        if not filename.endswith(".json"):
-            continue
-            
-        file_path = os.path.join(collection_dir, filename)
-        try:
-            with open(file_path, "r") as f:
-                doc = json.load(f)
-                
-            # Check if document matches query
-            if all(doc.get(k) == v for k, v in query.items()):
-                results.append(doc)
-        except Exception as e:
-            print(f"Error reading file {file_path}: {e}")
+    results = [doc for doc in documents if doc is not None and matches(doc)]
     
     # Sort results if sort_field provided
     if sort_field and sort_field in results[0] if results else False:
         results.sort(key=lambda x: x.get(sort_field, ""), reverse=(sort_order == -1))
     
     # Apply skip and limit
-    return results[skip:skip+limit] if limit > 0 else results[skip:]
+    results = results[skip:skip+limit] if limit > 0 else results[skip:]
+    return [_apply_projection(doc, projection) for doc in results]
+
+async def count_documents(collection: str, query: Dict[str, Any]) -> int:
+    """
+    Count documents in database without loading them
+    
+    Args:
+        collection: Collection name
+        query: Query to match documents
+        
+    Returns:
+        int: Number of matching documents
+    """
+    global _using_fallback, _db
+    
+    try:
+        if not _using_fallback and _db is not None:
+            if not query:
+                # Uses collection metadata instead of scanning
+                return await _db[collection].estimated_document_count()
+            return await _db[collection].count_documents(query)
+        else:
+            # Use fallback JSON storage
+            return _count_documents_in_json(collection, query)
+    except Exception as e:
+        logger.error("Error counting documents in database: %s", e)
+        # Fallback to local JSON storage
+        return _count_documents_in_json(collection, query)
+
+def _count_documents_in_json(collection: str, query: Dict[str, Any]) -> int:
+    """Count documents in JSON files as fallback"""
+    collection_dir = _get_collection_dir(collection)
+    
+    if not query:
+        return len(_scan_document_files(collection_dir))
+    return len(_find_documents_in_json(collection, query))
+
+async def find_documents_cursor(collection: str, base_query: Dict[str, Any], cursor_field: str,
+                                cursor_value: Any = None, tie_field: str = "_id", tie_value: Any = None,
+                                limit: int = 10, projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+    """
+    Find documents in descending (cursor_field, tie_field) order using keyset pagination
+    
+    Unlike skip-based pagination, the cost of fetching a page does not grow with its depth.
+    
+    Args:
+        collection: Collection name
+        base_query: Query to find documents
+        cursor_field: Field the results are ordered by
+        cursor_value: Value of cursor_field in the last document of the previous page, None for the first page
+        tie_field: Unique field used to order documents with the same cursor_field value
+        tie_value: Value of tie_field in the last document of the previous page
+        limit: Maximum number of documents to return
+        projection: Fields to include (1) or exclude (0), MongoDB style
+        
+    Returns:
+        list: List of documents
+    """
+    global _using_fallback, _db
+    
+    query = base_query
+    if cursor_value is not None:
+        after_cursor = {"$or": [
+            {cursor_field: {"$lt": cursor_value}},
+            {cursor_field: cursor_value, tie_field: {"$lt": tie_value}}
+        ]}
+        query = {"$and": [base_query, after_cursor]} if base_query else after_cursor
+    
+    try:
+        if not _using_fallback and _db is not None:
+            cursor = _db[collection].find(query, projection)
+            cursor = cursor.sort([(cursor_field, -1), (tie_field, -1)]).limit(limit)
+            documents = await cursor.to_list(length=limit)
+            
+            # Convert ObjectId to string for each document
+            for doc in documents:
+                if "_id" in doc:
+                    doc["_id"] = str(doc["_id"])
+                    
+            return documents
+        else:
+            # Use fallback JSON storage
+            return await asyncio.to_thread(_find_documents_cursor_in_json, collection, base_query, cursor_field,
+                                           cursor_value, tie_field, tie_value, limit, projection)
+    except Exception as e:
+        logger.error("Error finding documents in database: %s", e)
+        # Fallback to local JSON storage
+        return await asyncio.to_thread(_find_documents_cursor_in_json, collection, base_query, cursor_field,
+                                       cursor_value, tie_field, tie_value, limit, projection)
+
+def _find_documents_cursor_in_json(collection: str, base_query: Dict[str, Any], cursor_field: str,
+                                   cursor_value: Any, tie_field: str, tie_value: Any, limit: int,
+                                   projection: Optional[Dict[str, int]]) -> List[Dict[str, Any]]:
+    """Find documents after a keyset cursor in JSON files as fallback"""
+    def sort_key(doc):
+        return (str(doc.get(cursor_field, "")), str(doc.get(tie_field, "")))
+    
+    results = sorted(_find_documents_in_json(collection, base_query), key=sort_key, reverse=True)
+    if cursor_value is not None:
+        last_key = (str(cursor_value), str(tie_value))
+        results = [doc for doc in results if sort_key(doc) < last_key]
+    
+    return [_apply_projection(doc, projection) for doc in results[:limit]]
 
 async def delete_document(collection: str, query: Dict[str, Any]) -> bool:
     """
@@ -367,36 +839,36 @@ async def delete_document(collection: str, query: Dict[str, Any]) -> bool:
             # Use fallback JSON storage
             return _delete_document_in_json(collection, query)
     except Exception as e:
-        print(f"Error deleting document from database: {e}")
+        logger.error("Error deleting document from database: %s", e)
         # Fallback to local JSON storage
         return _delete_document_in_json(collection, query)
 
 def _delete_document_in_json(collection: str, query: Dict[str, Any]) -> bool:
     """Delete a document from JSON file as fallback"""
-    fallback_dir = _get_fallback_dir()
-    collection_dir = os.path.join(fallback_dir, collection)
+    collection_dir = _get_collection_dir(collection)
     
-    if not os.path.exists(collection_dir):
-        return False
+    matches = _compile_query(query)
     
     # Find matching file based on query
-    for filename in os.listdir(collection_dir):
-        if not filename.endswith(".json"):
-            continue
-            
-        file_path = os.path.join(collection_dir, filename)
+    for file_path in _iter_candidate_files(collection_dir, query):
+        filename = os.path.basename(file_path)
         try:
-            with open(file_path, "r") as f:
-                doc = json.load(f)
+            doc = _read_json_file(file_path)
                 
             # Check if document matches query
-            if all(doc.get(k) == v for k, v in query.items()):
-                # Delete file
-                os.remove(file_path)
-                print(f"Deleted {collection}/{filename} from local storage")
+            if matches(doc):
+                # Delete file and drop it from the index
+                with _index_lock(collection_dir):
+                    index = _load_index(collection_dir)
+                    os.remove(file_path)
+                    _index_remove(index, filename[:-len(".json")])
+                    _write_index(collection_dir, index)
+                logger.debug("Deleted %s/%s from local storage", collection, filename)
                 return True
+        except FileNotFoundError:
+            continue
         except Exception as e:
-            print(f"Error reading/deleting file {file_path}: {e}")
+            logger.error("Error reading/deleting file %s: %s", file_path, e)
     
     return False
 
@@ -415,13 +887,10 @@ async def get_document_by_id(collection: str, doc_id: str) -> Optional[Dict[str,
     
     try:
         if not _using_fallback and _db is not None:
-            try:
-                # Try as MongoDB ObjectId
-                document = await _db[collection].find_one({"_id": ObjectId(doc_id)})
-            except Exception:
-                # Try as a regular string ID
-                document = await _db[collection].find_one({"_id": doc_id})
-                
+            # Query as a MongoDB ObjectId if it looks like one, otherwise as a string ID
+            id_query = {"_id": ObjectId(doc_id) if ObjectId.is_valid(doc_id) else doc_id}
+            document = await _db[collection].find_one(id_query)
+            
             if document:
                 document["_id"] = str(document["_id"])
             return document
@@ -429,26 +898,21 @@ async def get_document_by_id(collection: str, doc_id: str) -> Optional[Dict[str,
             # Use fallback JSON storage
             return _get_document_by_id_in_json(collection, doc_id)
     except Exception as e:
-        print(f"Error getting document by ID: {e}")
+        logger.error("Error getting document by ID: %s", e)
         # Fallback to local JSON storage
         return _get_document_by_id_in_json(collection, doc_id)
 
 def _get_document_by_id_in_json(collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
     """Get a document by its ID from JSON file as fallback"""
-    fallback_dir = _get_fallback_dir()
-    collection_dir = os.path.join(fallback_dir, collection)
-    
-    if not os.path.exists(collection_dir):
-        return None
+    collection_dir = _get_collection_dir(collection)
     
     # Try direct file access first (most efficient)
     file_path = os.path.join(collection_dir, f"{doc_id}.json")
     if os.path.exists(file_path):
         try:
-            with open(file_path, "r") as f:
-                return json.load(f)
+            return _read_json_file(file_path)
         except Exception as e:
-            print(f"Error reading file {file_path}: {e}")
+            logger.error("Error reading file %s: %s", file_path, e)
     
     # If not found, search through all files
     return _find_document_in_json(collection, {"_id": doc_id}) 
\ No newline at end of file
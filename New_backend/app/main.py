@@ -7,8 +7,10 @@ Example:
 """
 
 import os
+import logging
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 from typing import Dict, Any
@@ -16,6 +18,12 @@ from typing import Dict, Any
 from .api.routes import router as api_router
 from .db.database import connect_to_mongo, close_mongo_connection, get_db
 
+# Application loggers (e.g. app.db) follow LOG_LEVEL, per-document messages are debug only
+logging.basicConfig(
+    level=getattr(logging, os.getenv("LOG_LEVEL", "info").strip().upper(), logging.INFO),
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
 # Create FastAPI app
 app = FastAPI(
     title="Safex Vulnerability Scanner API",
@@ -32,6 +40,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (reports are repetitive JSON) for clients sending Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Event handlers for MongoDB connection
 @app.on_event("startup")
 async def startup_db_client():
@@ -93,6 +104,7 @@ async def root():
                 "get_report": "/api/v1/reports/{report_id}",
                 "export_report": "/api/v1/reports/{report_id}/export/{format_type}",
                 "list_reports": "/api/v1/reports/list",
+                "export_all_reports": "/api/v1/reports/export",
                 "delete_report": "/api/v1/reports/{report_id}"
             }
         }
@@ -41,6 +41,14 @@ class EnhancedFileUploadScanner:
     # Maximum upload file size (3MB)
     max_file_size = 3 * 1024 * 1024
     
+    # Messages that indicate the server rejected an upload, matched case-insensitively
+    upload_error_re = re.compile(
+        r'invalid file|not allowed|invalid type|forbidden extension|'
+        r'file type not supported|unsupported file|security check|'
+        r'only allow|expect|extension|type|sorry|error|failed|rejected',
+        re.IGNORECASE
+    )
+    
     def __init__(self):
         """Initialize the scanner."""
         self.upload_dir = os.path.join(os.path.dirname(__file__), "upload_tests")
@@ -203,7 +211,8 @@ class EnhancedFileUploadScanner:
         Returns:
             List of links
         """
-        links = []
+        # Insertion-ordered set: links are deduplicated as they are found
+        links = {}
         
         try:
             async with semaphore:
@@ -225,14 +234,12 @@ class EnhancedFileUploadScanner:
                             for a_tag in soup.find_all('a', href=True):
                                 href = a_tag['href']
                                 if href and not href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
-                                    abs_url = urljoin(base_url, href)
-                                    if abs_url not in links:
-                                        links.append(abs_url)
+                                    links[urljoin(base_url, href)] = None
         
         except Exception as e:
             print(f"Error extracting links: {str(e)}")
         
-        return links
+        return list(links)
     
     async def _find_potential_upload_paths(self, url: str, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
         """
@@ -245,7 +252,6 @@ class EnhancedFileUploadScanner:
         Returns:
             List of potential upload paths with metadata
         """
-        potential_paths = []
         verified_paths = []
         
         # Common upload directories
@@ -260,24 +266,24 @@ class EnhancedFileUploadScanner:
         parsed_url = urlparse(url)
         base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
         
-        # Generate paths to test
+        # Generate paths to test. Insertion-ordered set: when the URL is the
+        # site root the deeper path equals the base path and is checked once
+        path_urls = {}
         for directory in common_upload_dirs:
-            potential_paths.append({
-                "url": f"{base_url}/{directory}",
-                "verified": False,
-                "status_code": None,
-                "content_type": None,
-                "directory_listing": False
-            })
-            
+            path_urls[f"{base_url}/{directory}"] = None
             # Also try deeper paths
-            potential_paths.append({
-                "url": f"{url.rstrip('/')}/{directory}",
+            path_urls[f"{url.rstrip('/')}/{directory}"] = None
+        
+        potential_paths = [
+            {
+                "url": path_url,
                 "verified": False,
                 "status_code": None,
                 "content_type": None,
                 "directory_listing": False
-            })
+            }
+            for path_url in path_urls
+        ]
         
         # Check if the paths exist
         check_tasks = []
@@ -301,6 +307,10 @@ class EnhancedFileUploadScanner:
         """
         Check if a path exists and get metadata about it.
         
+        Existence is checked with a HEAD request; the body is only fetched
+        for paths that answer 200 (or servers that refuse HEAD), where it is
+        needed for the size and directory-listing checks.
+        
         Args:
             url: The URL to check
             semaphore: Semaphore to limit concurrent requests
@@ -320,32 +330,39 @@ class EnhancedFileUploadScanner:
         try:
             async with semaphore:
                 async with aiohttp.ClientSession() as session:
-                    async with session.get(url, timeout=5, allow_redirects=True) as response:
-                        result["status_code"] = response.status
-                        
-                        if response.status == 200:
-                            result["exists"] = True
-                            result["verified"] = True
-                            result["content_type"] = response.headers.get("Content-Type", "")
-                            
-                            # Check the size
-                            content = await response.text()
-                            result["size"] = len(content)
-                            
-                            # Check for directory listing
-                            result["directory_listing"] = (
-                                "Index of" in content and
-                                ("<tr>" in content or "<TR>" in content) and
-                                ("Name" in content or "Size" in content or "Modified" in content)
-                            )
-                        elif response.status in [301, 302, 303, 307, 308]:
-                            # Redirects often indicate the path exists but is protected
-                            result["exists"] = True
-                            result["verified"] = True
-                        elif response.status == 403:
-                            # Forbidden means the path exists but we can't access it
-                            result["exists"] = True
-                            result["verified"] = True
+                    async with session.head(url, timeout=5, allow_redirects=True) as response:
+                        status = response.status
+                    
+                    if status in [200, 405, 501]:
+                        async with session.get(url, timeout=5, allow_redirects=True) as response:
+                            status = response.status
+                            if status == 200:
+                                result["content_type"] = response.headers.get("Content-Type", "")
+                                
+                                # Check the size
+                                content = await response.text()
+                                result["size"] = len(content)
+                                
+                                # Check for directory listing
+                                result["directory_listing"] = (
+                                    "Index of" in content and
+                                    ("<tr>" in content or "<TR>" in content) and
+                                    ("Name" in content or "Size" in content or "Modified" in content)
+                                )
+                    
+                    result["status_code"] = status
+                    
+                    if status == 200:
+                        result["exists"] = True
+                        result["verified"] = True
+                    elif status in [301, 302, 303, 307, 308]:
+                        # Redirects often indicate the path exists but is protected
+                        result["exists"] = True
+                        result["verified"] = True
+                    elif status == 403:
+                        # Forbidden means the path exists but we can't access it
+                        result["exists"] = True
+                        result["verified"] = True
         
         except Exception as e:
             print(f"Error checking path {url}: {str(e)}")
@@ -881,20 +898,13 @@ class EnhancedFileUploadScanner:
                                     }
                             
                             # Check for error messages in the response
-                            error_patterns = [
-                                'invalid file', 'not allowed', 'invalid type', 'forbidden extension',
-                                'file type not supported', 'unsupported file', 'security check',
-                                'only allow', 'expect', 'extension', 'type', 'sorry', 'error',
-                                'failed', 'rejected'
-                            ]
-                            
-                            for pattern in error_patterns:
-                                if pattern in response_text.lower():
-                                    return {
-                                        'success': False,
-                                        'status': response.status,
-                                        'error': f"Found error pattern: '{pattern}' in response"
-                                    }
+                            error_match = self.upload_error_re.search(response_text)
+                            if error_match:
+                                return {
+                                    'success': False,
+                                    'status': response.status,
+                                    'error': f"Found error pattern: '{error_match.group(0).lower()}' in response"
+                                }
                             
                             # If no error patterns found and status is 200, assume success
                             if response.status == 200:
@@ -4,6 +4,9 @@ import asyncio
 from typing import List, Dict, Any, Optional
 import re
 
+# Timeout passed with every request so it applies per probe, not per session
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
 class EnhancedHTTPScanner:
     """
     Enhanced scanner for detecting HTTP method vulnerabilities and server information.
@@ -53,6 +56,30 @@ class EnhancedHTTPScanner:
         "Via"
     ]
     
+    def __init__(self):
+        """Initialize the scanner."""
+        # Shared HTTP session, created lazily on first request (see _get_session)
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the scanner's shared HTTP session, creating it on first use.
+        
+        Every method, header and CORS check of a scan goes through the same
+        connection pool instead of opening a new session per request.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=5, enable_cleanup_closed=True)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session if one is open."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
     async def scan_url(self, url: str) -> List[Dict[str, Any]]:
         """
         Scan a URL for HTTP method vulnerabilities and server information.
@@ -68,24 +95,24 @@ class EnhancedHTTPScanner:
         semaphore = asyncio.Semaphore(5)  # Limit concurrent requests
         
         try:
-            # Test HTTP methods
-            for method in self.http_methods:
-                vulnerabilities = await self._test_http_method(url, method, semaphore)
+            # Test every HTTP method and check the security headers and CORS
+            # configuration concurrently; the semaphore bounds requests in flight.
+            # Each check handles its own errors, and results keep this order
+            results = await asyncio.gather(
+                *(self._test_http_method(url, method, semaphore) for method in self.http_methods),
+                self._check_security_headers(url, semaphore),
+                self._check_cors_config(url, semaphore)
+            )
+            for vulnerabilities in results:
                 all_vulnerabilities.extend(vulnerabilities)
             
-            # Check security headers
-            header_vulnerabilities = await self._check_security_headers(url, semaphore)
-            all_vulnerabilities.extend(header_vulnerabilities)
-            
-            # Check CORS configuration
-            cors_vulnerabilities = await self._check_cors_config(url, semaphore)
-            all_vulnerabilities.extend(cors_vulnerabilities)
-            
             print(f"Found {len(all_vulnerabilities)} HTTP method vulnerabilities")
             return all_vulnerabilities
         except Exception as e:
             print(f"Error in HTTP methods scan: {str(e)}")
             return all_vulnerabilities
+        finally:
+            await self.close()
     
     async def _test_http_method(self, url: str, method: str, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
         """
@@ -103,64 +130,66 @@ class EnhancedHTTPScanner:
         
         try:
             async with semaphore:
-                async with aiohttp.ClientSession() as session:
-                    try:
-                        # Create a request with the specified method
-                        custom_headers = {
-                            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Safari/537.36",
-                            "Accept": "*/*",
-                            "Accept-Language": "en-US,en;q=0.9",
-                            "Connection": "close"
-                        }
+                session = await self._get_session()
+                try:
+                    # Create a request with the specified method
+                    custom_headers = {
+                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Safari/537.36",
+                        "Accept": "*/*",
+                        "Accept-Language": "en-US,en;q=0.9"
+                    }
+                    if method == "CONNECT":
+                        # Never hand a connection that may have become a tunnel back to the pool
+                        custom_headers["Connection"] = "close"
                         
-                        async with session.request(method, url, headers=custom_headers, timeout=10, allow_redirects=False) as response:
-                            # Check if the method is dangerous and not properly rejected
-                            if method in self.dangerous_methods:
-                                if response.status not in [405, 501, 403, 401]:
-                                    # The dangerous method is not properly rejected
-                                    severity = "high" if method in ["PUT", "DELETE"] else "medium"
+                    async with session.request(method, url, headers=custom_headers, timeout=REQUEST_TIMEOUT, allow_redirects=False) as response:
+                        # Check if the method is dangerous and not properly rejected
+                        if method in self.dangerous_methods:
+                            if response.status not in [405, 501, 403, 401]:
+                                # The dangerous method is not properly rejected
+                                severity = "high" if method in ["PUT", "DELETE"] else "medium"
                                     
-                                    vulnerabilities.append({
-                                        "id": str(uuid.uuid4()),
-                                        "name": f"Dangerous HTTP Method Allowed: {method}",
-                                        "description": f"The server allows the potentially dangerous HTTP method: {method} without proper authorization",
-                                        "severity": severity,
-                                        "location": url,
-                                        "evidence": f"HTTP {response.status} response for {method} request",
-                                        "remediation": f"Disable the {method} HTTP method or implement proper authorization for it"
-                                    })
+                                vulnerabilities.append({
+                                    "id": str(uuid.uuid4()),
+                                    "name": f"Dangerous HTTP Method Allowed: {method}",
+                                    "description": f"The server allows the potentially dangerous HTTP method: {method} without proper authorization",
+                                    "severity": severity,
+                                    "location": url,
+                                    "evidence": f"HTTP {response.status} response for {method} request",
+                                    "remediation": f"Disable the {method} HTTP method or implement proper authorization for it"
+                                })
                             
-                            # Special check for TRACE method (XST vulnerability)
-                            if method == "TRACE":
-                                response_text = await response.text()
-                                # Check if response contains our headers (indicates TRACE is reflecting request)
-                                if "User-Agent" in response_text and "Mozilla" in response_text:
-                                    vulnerabilities.append({
-                                        "id": str(uuid.uuid4()),
-                                        "name": "Cross-Site Tracing (XST) Vulnerability",
-                                        "description": "The server reflects the TRACE request which can lead to credential theft via Cross-Site Tracing",
-                                        "severity": "high",
-                                        "location": url,
-                                        "evidence": "TRACE method response contains the request headers",
-                                        "remediation": "Disable the TRACE HTTP method on your web server"
-                                    })
+                        # Special check for TRACE method (XST vulnerability)
+                        if method == "TRACE":
+                            response_text = await response.text()
+                            # Check if response contains our headers (indicates TRACE is reflecting request)
+                            if "User-Agent" in response_text and "Mozilla" in response_text:
+                                vulnerabilities.append({
+                                    "id": str(uuid.uuid4()),
+                                    "name": "Cross-Site Tracing (XST) Vulnerability",
+                                    "description": "The server reflects the TRACE request which can lead to credential theft via Cross-Site Tracing",
+                                    "severity": "high",
+                                    "location": url,
+                                    "evidence": "TRACE method response contains the request headers",
+                                    "remediation": "Disable the TRACE HTTP method on your web server"
+                                })
                             
-                            # Check for information disclosure in headers
-                            for header, value in response.headers.items():
-                                if header.lower() in [h.lower() for h in self.sensitive_headers]:
-                                    vulnerabilities.append({
-                                        "id": str(uuid.uuid4()),
-                                        "name": f"Information Disclosure: {header}",
-                                        "description": f"The server discloses potentially sensitive information in the {header} header",
-                                        "severity": "low",
-                                        "location": url,
-                                        "evidence": f"{header}: {value}",
-                                        "remediation": f"Remove or obfuscate the {header} header"
-                                    })
+                        # Check for information disclosure in headers
+                        for header, value in response.headers.items():
+                            if header.lower() in [h.lower() for h in self.sensitive_headers]:
+                                vulnerabilities.append({
+                                    "id": str(uuid.uuid4()),
+                                    "name": f"Information Disclosure: {header}",
+                                    "description": f"The server discloses potentially sensitive information in the {header} header",
+                                    "severity": "low",
+                                    "location": url,
+                                    "evidence": f"{header}: {value}",
+                                    "remediation": f"Remove or obfuscate the {header} header"
+                                })
                     
-                    except aiohttp.ClientError as e:
-                        # If the method is not supported by the server, an error might be raised
-                        pass
+                except aiohttp.ClientError as e:
+                    # If the method is not supported by the server, an error might be raised
+                    pass
         
         except Exception as e:
             print(f"Error testing HTTP method {method}: {str(e)}")
@@ -182,31 +211,31 @@ class EnhancedHTTPScanner:
         
         try:
             async with semaphore:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, timeout=10) as response:
-                        # Check for missing security headers
-                        present_headers = [h.lower() for h in response.headers.keys()]
+                session = await self._get_session()
+                async with session.get(url, timeout=REQUEST_TIMEOUT) as response:
+                    # Check for missing security headers
+                    present_headers = [h.lower() for h in response.headers.keys()]
                         
-                        for header in self.security_headers:
-                            if header.lower() not in present_headers:
-                                # Determine severity based on the importance of the header
+                    for header in self.security_headers:
+                        if header.lower() not in present_headers:
+                            # Determine severity based on the importance of the header
+                            severity = "medium"
+                            if header in ["Strict-Transport-Security", "Content-Security-Policy"]:
                                 severity = "medium"
-                                if header in ["Strict-Transport-Security", "Content-Security-Policy"]:
-                                    severity = "medium"
-                                elif header in ["X-Frame-Options", "X-Content-Type-Options", "X-XSS-Protection"]:
-                                    severity = "medium"
-                                else:
-                                    severity = "low"
+                            elif header in ["X-Frame-Options", "X-Content-Type-Options", "X-XSS-Protection"]:
+                                severity = "medium"
+                            else:
+                                severity = "low"
                                 
-                                vulnerabilities.append({
-                                    "id": str(uuid.uuid4()),
-                                    "name": f"Missing Security Header: {header}",
-                                    "description": f"The HTTP response is missing the security header: {header}",
-                                    "severity": severity,
-                                    "location": url,
-                                    "evidence": f"Header {header} not found in response",
-                                    "remediation": f"Implement the {header} security header"
-                                })
+                            vulnerabilities.append({
+                                "id": str(uuid.uuid4()),
+                                "name": f"Missing Security Header: {header}",
+                                "description": f"The HTTP response is missing the security header: {header}",
+                                "severity": severity,
+                                "location": url,
+                                "evidence": f"Header {header} not found in response",
+                                "remediation": f"Implement the {header} security header"
+                            })
         
         except Exception as e:
             print(f"Error checking security headers: {str(e)}")
@@ -228,51 +257,51 @@ class EnhancedHTTPScanner:
         
         try:
             async with semaphore:
-                async with aiohttp.ClientSession() as session:
-                    # Make a request with Origin header set to a different domain
-                    headers = {
-                        "Origin": "https://evil.example.com",
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Safari/537.36",
-                    }
+                session = await self._get_session()
+                # Make a request with Origin header set to a different domain
+                headers = {
+                    "Origin": "https://evil.example.com",
+                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Safari/537.36",
+                }
                     
-                    async with session.options(url, headers=headers, timeout=10) as response:
-                        # Check Access-Control-Allow-Origin header
-                        allow_origin = response.headers.get("Access-Control-Allow-Origin", "")
+                async with session.options(url, headers=headers, timeout=REQUEST_TIMEOUT) as response:
+                    # Check Access-Control-Allow-Origin header
+                    allow_origin = response.headers.get("Access-Control-Allow-Origin", "")
                         
-                        # Check if CORS is too permissive
-                        if allow_origin == "*":
-                            vulnerabilities.append({
-                                "id": str(uuid.uuid4()),
-                                "name": "CORS Misconfiguration: Wildcard Origin",
-                                "description": "The server allows any origin to access its resources via CORS",
-                                "severity": "medium",
-                                "location": url,
-                                "evidence": "Access-Control-Allow-Origin: *",
-                                "remediation": "Restrict CORS to specific trusted domains instead of using a wildcard"
-                            })
-                        elif "evil.example.com" in allow_origin:
-                            vulnerabilities.append({
-                                "id": str(uuid.uuid4()),
-                                "name": "CORS Misconfiguration: Origin Reflection",
-                                "description": "The server reflects the Origin header value in Access-Control-Allow-Origin header",
-                                "severity": "high",
-                                "location": url,
-                                "evidence": f"Access-Control-Allow-Origin: {allow_origin}",
-                                "remediation": "Only allow specific trusted domains in the Access-Control-Allow-Origin header"
-                            })
+                    # Check if CORS is too permissive
+                    if allow_origin == "*":
+                        vulnerabilities.append({
+                            "id": str(uuid.uuid4()),
+                            "name": "CORS Misconfiguration: Wildcard Origin",
+                            "description": "The server allows any origin to access its resources via CORS",
+                            "severity": "medium",
+                            "location": url,
+                            "evidence": "Access-Control-Allow-Origin: *",
+                            "remediation": "Restrict CORS to specific trusted domains instead of using a wildcard"
+                        })
+                    elif "evil.example.com" in allow_origin:
+                        vulnerabilities.append({
+                            "id": str(uuid.uuid4()),
+                            "name": "CORS Misconfiguration: Origin Reflection",
+                            "description": "The server reflects the Origin header value in Access-Control-Allow-Origin header",
+                            "severity": "high",
+                            "location": url,
+                            "evidence": f"Access-Control-Allow-Origin: {allow_origin}",
+                            "remediation": "Only allow specific trusted domains in the Access-Control-Allow-Origin header"
+                        })
                         
-                        # Check if credentials are allowed
-                        allow_credentials = response.headers.get("Access-Control-Allow-Credentials", "")
-                        if allow_credentials.lower() == "true" and allow_origin == "*":
-                            vulnerabilities.append({
-                                "id": str(uuid.uuid4()),
-                                "name": "CORS Misconfiguration: Credentials with Wildcard",
-                                "description": "The server allows credentials to be sent cross-origin with a wildcard origin",
-                                "severity": "high",
-                                "location": url,
-                                "evidence": "Access-Control-Allow-Credentials: true with Access-Control-Allow-Origin: *",
-                                "remediation": "When allowing credentials, specify exact origins instead of using a wildcard"
-                            })
+                    # Check if credentials are allowed
+                    allow_credentials = response.headers.get("Access-Control-Allow-Credentials", "")
+                    if allow_credentials.lower() == "true" and allow_origin == "*":
+                        vulnerabilities.append({
+                            "id": str(uuid.uuid4()),
+                            "name": "CORS Misconfiguration: Credentials with Wildcard",
+                            "description": "The server allows credentials to be sent cross-origin with a wildcard origin",
+                            "severity": "high",
+                            "location": url,
+                            "evidence": "Access-Control-Allow-Credentials: true with Access-Control-Allow-Origin: *",
+                            "remediation": "When allowing credentials, specify exact origins instead of using a wildcard"
+                        })
         
         except Exception as e:
             print(f"Error checking CORS configuration: {str(e)}")
@@ -1,5 +1,6 @@
 import asyncio
 import aiohttp
+import itertools
 import random
 import string
 import uuid
@@ -120,6 +121,9 @@ class EnhancedXSSScanner:
         "ng-bind-template"
     ]
     
+    # All sinks as one literal alternation, so a text is scanned once rather than once per sink
+    dom_xss_sink_re = re.compile("|".join(map(re.escape, dom_xss_sinks)))
+    
     # DOM-based XSS sources to look for in JavaScript
     dom_xss_sources = [
         "location",
@@ -192,6 +196,33 @@ class EnhancedXSSScanner:
     # Maximum number of concurrent requests
     max_concurrent_requests = 10
     
+    # Keywords marking a login form or a content submission form, matched
+    # case-insensitively against the rendered form markup
+    auth_form_re = re.compile(r'login|auth|sign in|signin', re.IGNORECASE)
+    submission_form_re = re.compile(r'comment|post|message|review|feedback|text|content', re.IGNORECASE)
+    
+    # Characters used for the random part of test identifiers
+    test_id_chars = string.ascii_letters + string.digits
+    
+    def __init__(self):
+        """Initialize the scanner."""
+        self._reset_test_ids()
+    
+    def _reset_test_ids(self) -> None:
+        """Draw a fresh random test-ID prefix and restart the counter."""
+        self._test_id_prefix = ''.join(random.choices(self.test_id_chars, k=4))
+        self._test_id_counter = itertools.count()
+    
+    def _new_test_id(self) -> str:
+        """
+        Get an 8-character identifier for tagging one payload.
+        
+        The prefix is random per scanned URL and the suffix is a counter, so
+        identifiers are unique within a scan without drawing from the RNG for
+        every payload.
+        """
+        return f"{self._test_id_prefix}{next(self._test_id_counter):04x}"
+    
     async def scan_url(self, url: str) -> List[Dict[str, Any]]:
         """
         Scan a URL for XSS vulnerabilities.
@@ -204,6 +235,7 @@ class EnhancedXSSScanner:
         """
         print(f"Starting Enhanced XSS scan for URL: {url}")
         all_vulnerabilities = []
+        self._reset_test_ids()
         
         try:
             # Create a semaphore to limit concurrent requests
@@ -329,7 +361,7 @@ class EnhancedXSSScanner:
                     # Test each payload for this parameter
                     for payload in self.xss_payloads:
                         # Use a unique identifier for this test
-                        test_id = ''.join(random.choices(string.ascii_letters + string.digits, k=8))
+                        test_id = self._new_test_id()
                         customized_payload = payload.replace("XSS", test_id).replace("'XSS'", f"'{test_id}'")
                         
                         tasks.append(self._test_reflected_xss(url, param_name, param_values[0], 
@@ -419,7 +451,7 @@ class EnhancedXSSScanner:
                     }
             
             # Check for potential DOM-based XSS (if the payload is not directly reflected)
-            if test_id in response_text or any(sink in response_text for sink in self.dom_xss_sinks):
+            if test_id in response_text or self.dom_xss_sink_re.search(response_text):
                 # Analyze JavaScript content for possible DOM XSS
                 if self._check_javascript_for_xss(response_text, param_name):
                     return {
@@ -503,13 +535,9 @@ class EnhancedXSSScanner:
         if not re.search(param_pattern, javascript):
             return False
         
-        # Check if any sinks are present and potentially connected to the parameter
-        for sink in self.dom_xss_sinks:
-            sink_pattern = re.escape(sink) + r'.*?(' + param_pattern + r'|.*?' + param_pattern + r')'
-            if re.search(sink_pattern, javascript, re.DOTALL):
-                return True
-        
-        return False
+        # Check if any sink is present and followed by the parameter, in one pass
+        sink_pattern = r'(?:' + self.dom_xss_sink_re.pattern + r').*?' + param_pattern
+        return re.search(sink_pattern, javascript, re.DOTALL) is not None
     
     async def _check_forms(self, url: str, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
         """
@@ -558,7 +586,7 @@ class EnhancedXSSScanner:
                 
                 # Detect if this is a login/authentication form
                 is_auth_form = any(input_field.get('type', '').lower() == 'password' for input_field in input_fields)
-                is_auth_form = is_auth_form or any(keyword in str(form).lower() for keyword in ['login', 'auth', 'sign in', 'signin'])
+                is_auth_form = is_auth_form or bool(self.auth_form_re.search(str(form)))
                 
                 # Get CSRF tokens if present
                 csrf_tokens = {}
@@ -586,7 +614,7 @@ class EnhancedXSSScanner:
                     # Test each payload
                     for payload in safe_payloads:
                         # Use a unique identifier for this test
-                        test_id = ''.join(random.choices(string.ascii_letters + string.digits, k=8))
+                        test_id = self._new_test_id()
                         customized_payload = payload.replace("XSS", test_id).replace("'XSS'", f"'{test_id}'")
                         
                         # Get other form field values to submit together
@@ -872,8 +900,7 @@ class EnhancedXSSScanner:
             for form in forms:
                 # Identify forms with post methods that might be used for content submission
                 if (form.get('method', '').lower() == 'post' and
-                        any(area in str(form).lower() for area in 
-                           ['comment', 'post', 'message', 'review', 'feedback', 'text', 'content'])):
+                        self.submission_form_re.search(str(form))):
                     
                     # Check if the form has text input or textarea
                     inputs = form.find_all(['input', 'textarea'])
@@ -935,7 +962,7 @@ class EnhancedXSSScanner:
                     continue
                 
                 # Create a payload with a unique identifier for tracking
-                xss_id = ''.join(random.choices(string.ascii_letters + string.digits, k=8))
+                xss_id = self._new_test_id()
                 # Use a less aggressive payload to avoid being blocked
                 stored_xss_payload = f'Test<img src=x onerror="console.log(\'{xss_id}\')">'
                 
@@ -1190,7 +1217,7 @@ class EnhancedXSSScanner:
                 # Test each bypass payload
                 for bypass_payload in bypass_payloads:
                     # Create a unique test ID
-                    test_id = ''.join(random.choices(string.ascii_letters + string.digits, k=8))
+                    test_id = self._new_test_id()
                     customized_payload = bypass_payload.replace("XSS", test_id).replace("'XSS'", f"'{test_id}'").replace('"XSS"', f'"{test_id}"')
                     
                     # Test each parameter with the payload
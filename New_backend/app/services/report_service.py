@@ -1,11 +1,15 @@
 import os
 import json
 import uuid
+import base64
+import copy
+import orjson
 import datetime
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, AsyncIterator
 import asyncio
 from pathlib import Path
 import aiofiles
+from cachetools import TTLCache
 
 # For PDF generation
 try:
@@ -24,6 +28,9 @@ from ..db.database import (
     save_to_db, 
     find_document, 
     find_documents, 
+    iter_documents,
+    find_documents_cursor,
+    count_documents,
     update_in_db,
     get_document_by_id,
     delete_document
@@ -34,6 +41,33 @@ class ReportService:
     
     _cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "reports")
     
+    # Fields returned for each report when listing reports
+    _LIST_PROJECTION = {
+        "_id": 0,
+        "report_id": 1,
+        "scan_id": 1,
+        "url": 1,
+        "title": 1,
+        "timestamp": 1,
+        "status": 1,
+        "summary": 1,
+        "vulnerabilities_count": 1
+    }
+    
+    # In-process caches for report lookups, reports do not change once generated
+    _report_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+    _list_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+    # Bumped whenever the set of reports changes so cached listings are never reused
+    _list_generation: int = 0
+    
+    @classmethod
+    def _invalidate_report(cls, report_id: Optional[str] = None):
+        """Drop a cached report (if given) and all cached report listings."""
+        if report_id is not None:
+            cls._report_cache.pop(report_id, None)
+        cls._list_generation += 1
+        cls._list_cache.clear()
+    
     @classmethod
     async def initialize(cls):
         """Initialize the report service."""
@@ -74,6 +108,7 @@ class ReportService:
         # Save to MongoDB
         try:
             report_id = await save_to_db("reports", report)
+            cls._invalidate_report()
             if report_id:
                 print(f"Report saved to database with ID: {report_id}")
                 report["_id"] = report_id
@@ -86,6 +121,7 @@ class ReportService:
             print(f"Error saving report to database: {e}")
             # Fallback to local file
             cls._save_report_to_file(report)
+            cls._invalidate_report()
             return report["report_id"]
     
     @classmethod
@@ -115,6 +151,20 @@ class ReportService:
         Returns:
             Optional[Dict[str, Any]]: The report if found, None otherwise
         """
+        # Callers get their own copy so mutating it cannot corrupt the cache
+        cached = cls._report_cache.get(report_id)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        report = await cls._fetch_report(report_id)
+        if report:
+            cls._report_cache[report_id] = report
+            return copy.deepcopy(report)
+        return report
+    
+    @classmethod
+    async def _fetch_report(cls, report_id: str) -> Optional[Dict[str, Any]]:
+        """Get a report from the database or local files, bypassing the cache."""
         # Try to get from database
         try:
             # First try by report_id field
@@ -149,19 +199,34 @@ class ReportService:
         Returns:
             Dict[str, Any]: Dictionary with reports and total count
         """
+        # Callers get their own copy so mutating it cannot corrupt the cache
+        cache_key = (limit, skip, cls._list_generation)
+        cached = cls._list_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        result = await cls._fetch_reports(limit, skip)
+        cls._list_cache[cache_key] = result
+        return copy.deepcopy(result)
+    
+    @classmethod
+    async def _fetch_reports(cls, limit: int, skip: int) -> Dict[str, Any]:
+        """Get reports from the database or local files, bypassing the cache."""
         try:
             # Get from database
+            # Only fetch the summary fields, findings are not needed for listings
             reports = await find_documents(
                 "reports", 
                 {}, 
                 limit=limit, 
                 skip=skip, 
                 sort_field="timestamp", 
-                sort_order=-1
+                sort_order=-1,
+                projection=cls._LIST_PROJECTION
             )
             
             # Get total count
-            total = len(await find_documents("reports", {}))
+            total = await count_documents("reports", {})
             
             return {
                 "reports": reports,
@@ -185,6 +250,110 @@ class ReportService:
                 "total": len(reports_files)
             }
     
+    @classmethod
+    async def iter_reports_ndjson(cls) -> AsyncIterator[bytes]:
+        """
+        Stream the summaries of all reports, newest first, as newline-delimited JSON.
+        
+        Yields:
+            bytes: One JSON encoded report per line
+        """
+        async for report in iter_documents("reports", {}, sort_field="timestamp", sort_order=-1,
+                                           projection=cls._LIST_PROJECTION):
+            yield orjson.dumps(report, default=str) + b"\n"
+    
+    @staticmethod
+    def _encode_cursor(report: Dict[str, Any]) -> str:
+        """Encode the position of a report in the listing as an opaque cursor."""
+        position = [report.get("timestamp", ""), report.get("report_id", "")]
+        return base64.urlsafe_b64encode(orjson.dumps(position)).decode("ascii")
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple:
+        """
+        Decode a cursor created by _encode_cursor.
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            timestamp, report_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except Exception as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+        return timestamp, report_id
+    
+    @classmethod
+    async def get_reports_after(cls, cursor: Optional[str] = None, limit: int = 10) -> Dict[str, Any]:
+        """
+        Get a page of reports, newest first, using keyset pagination.
+        
+        Args:
+            cursor: The next_cursor returned with the previous page, None for the first page
+            limit: Maximum number of reports to return
+            
+        Returns:
+            Dict[str, Any]: Dictionary with reports, total count and the cursor of the next page
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        timestamp, report_id = cls._decode_cursor(cursor) if cursor else (None, None)
+        
+        cache_key = ("after", cursor, limit, cls._list_generation)
+        cached = cls._list_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        result = await cls._fetch_reports_after(timestamp, report_id, limit)
+        cls._list_cache[cache_key] = result
+        return copy.deepcopy(result)
+    
+    @classmethod
+    async def _fetch_reports_after(cls, timestamp: Optional[str], report_id: Optional[str],
+                                   limit: int) -> Dict[str, Any]:
+        """Get a keyset page of reports from the database or local files, bypassing the cache."""
+        try:
+            # Get from database
+            reports = await find_documents_cursor(
+                "reports",
+                {},
+                cursor_field="timestamp",
+                cursor_value=timestamp,
+                tie_field="report_id",
+                tie_value=report_id,
+                limit=limit,
+                projection=cls._LIST_PROJECTION
+            )
+            
+            # Get total count
+            total = await count_documents("reports", {})
+        except Exception as e:
+            print(f"Error getting reports from database: {e}")
+            
+            # Fallback to local files, in the same (timestamp, report_id) descending order
+            reports_files = os.listdir(cls._cache_dir)
+            reports = []
+            
+            for file_name in reports_files:
+                if file_name.endswith(".json"):
+                    file_path = os.path.join(cls._cache_dir, file_name)
+                    with open(file_path, "r") as f:
+                        reports.append(json.load(f))
+            
+            def position(report):
+                return report.get("timestamp", ""), report.get("report_id", "")
+            
+            total = len(reports)
+            if timestamp is not None:
+                reports = [report for report in reports if position(report) < (timestamp, report_id)]
+            reports = sorted(reports, key=position, reverse=True)[:limit]
+        
+        return {
+            "reports": reports,
+            "total": total,
+            "next_cursor": cls._encode_cursor(reports[-1]) if len(reports) == limit else None
+        }
+    
     @classmethod
     async def delete_report(cls, report_id: str) -> bool:
         """
@@ -196,6 +365,16 @@ class ReportService:
         Returns:
             bool: True if successful, False otherwise
         """
+        # Invalidate once the delete has finished, so a concurrent get_report
+        # cannot put the row being deleted back into the cache
+        try:
+            return await cls._delete_report(report_id)
+        finally:
+            cls._invalidate_report(report_id)
+    
+    @classmethod
+    async def _delete_report(cls, report_id: str) -> bool:
+        """Delete a report from the database or local files, bypassing the cache."""
         try:
             # Try to delete from database
             deleted = await delete_document("reports", {"report_id": report_id})
@@ -234,19 +413,22 @@ class ReportService:
             return False
     
     @classmethod
-    async def export_report(cls, report_id: str, format_type: str = "json") -> Optional[str]:
+    async def export_report(cls, report_id: str, format_type: str = "json",
+                            report: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """
         Export a report to a specific format (JSON, PDF, TXT).
         
         Args:
             report_id: The ID of the report
             format_type: The format to export to (json, pdf, txt)
+            report: The report data if already fetched, to avoid looking it up again
             
         Returns:
             Optional[str]: The path to the exported file if successful, None otherwise
         """
         # Get the report
-        report = await cls.get_report(report_id)
+        if report is None:
+            report = await cls.get_report(report_id)
         if not report:
             print(f"Report with ID {report_id} not found")
             return None
@@ -532,5 +714,6 @@ class ReportService:
         except Exception as e:
             print(f"Error saving report to database: {e}")
             cls._save_report_to_file(report)
+        cls._invalidate_report()
         
         return report_id 
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+Shared SQL error signature matcher used by the SQL injection scanners.
+"""
+import functools
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Optional Hyperscan multi-regex matcher for SQL error detection
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+_INLINE_FLAGS_RE = re.compile(r'^\(\?([aiLmsux]+)\)')
+
+
+def _scope_inline_flags(pattern: str) -> str:
+    """Turn leading global flags like (?s) into a scoped group so the pattern can be alternated."""
+    match = _INLINE_FLAGS_RE.match(pattern)
+    if not match:
+        return pattern
+    return f"(?{match.group(1)}:{pattern[match.end():]})"
+
+
+class SQLErrorMatcher:
+    """
+    Match response bodies against the SQL error patterns in a single scan.
+    
+    With Hyperscan available, all patterns are compiled into one block-mode
+    database; patterns Hyperscan rejects, or all of them without Hyperscan,
+    are joined into one case-insensitive alternation with a named group per
+    pattern so a single pass also tells which pattern matched.
+    """
+    
+    def __init__(self, patterns: Tuple[str, ...]):
+        self.patterns = patterns
+        self._context_res: Dict[str, re.Pattern] = {}
+        self._hs_db = None
+        re_only = range(len(patterns))
+        if HYPERSCAN_AVAILABLE:
+            re_only = self._build_hyperscan_db()
+        
+        self._combined = None
+        if re_only:
+            self._combined = re.compile(
+                "|".join(f"(?P<p{i}>{_scope_inline_flags(patterns[i])})" for i in re_only),
+                re.IGNORECASE
+            )
+    
+    def _build_hyperscan_db(self) -> List[int]:
+        """Compile the Hyperscan database and return the ids it could not take."""
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+        accepted, rejected = [], []
+        for i, pattern in enumerate(self.patterns):
+            try:
+                hyperscan.Database().compile(expressions=[pattern.encode()], ids=[i], flags=[flags])
+                accepted.append(i)
+            except hyperscan.error:
+                rejected.append(i)
+        
+        if accepted:
+            self._hs_db = hyperscan.Database()
+            self._hs_db.compile(
+                expressions=[self.patterns[i].encode() for i in accepted],
+                ids=accepted,
+                flags=[flags] * len(accepted)
+            )
+        return rejected
+    
+    def search(self, text: str) -> Optional[str]:
+        """
+        Return a pattern that matches text (the earliest match found), or None.
+        """
+        if not text:
+            return None
+        
+        if self._hs_db is not None:
+            matched = []
+            
+            def on_match(pattern_id, start, end, flags, context):
+                matched.append(pattern_id)
+                return True  # Stop scanning at the first hit
+            
+            try:
+                self._hs_db.scan(text.encode("utf-8", "ignore"), match_event_handler=on_match)
+            except hyperscan.ScanTerminated:
+                pass
+            if matched:
+                return self.patterns[matched[0]]
+        
+        if self._combined is not None:
+            match = self._combined.search(text)
+            if match:
+                return self.patterns[int(match.lastgroup[1:])]
+        
+        return None
+    
+    def context(self, text: str, pattern: str) -> Optional[str]:
+        """
+        Return the line fragment around the first match of pattern in text.
+        
+        The surrounding-context regex is compiled once per pattern, with
+        IGNORECASE baked in, and reused for every later response.
+        """
+        context_re = self._context_res.get(pattern)
+        if context_re is None:
+            context_re = re.compile(
+                r'[^\n\r]{0,100}(?:' + _scope_inline_flags(pattern) + r')[^\n\r]{0,100}',
+                re.IGNORECASE
+            )
+            self._context_res[pattern] = context_re
+        match = context_re.search(text)
+        return match.group(0) if match else None
+
+
+@functools.lru_cache(maxsize=8)
+def get_sql_error_matcher(patterns: Tuple[str, ...]) -> SQLErrorMatcher:
+    """Build (once per distinct pattern list) the matcher for a scanner's error patterns."""
+    return SQLErrorMatcher(patterns)